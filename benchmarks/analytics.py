@@ -0,0 +1,108 @@
+"""
+Benchmark the vectorized adherence analytics against the per-window loop.
+
+Seeds `--medications` medications with `--days` days of DailyAdherence
+rollup rows, then times:
+
+- vectorized: `analytics.adherence_series` for every window, plus
+  serialization to JSON-ready data.
+- loop: `Medication.adherence_rate_over_period` called once per
+  medication per window for `--sample` medications, extrapolated to
+  the whole cohort.
+
+Usage:
+    python -m benchmarks.analytics [--medications 10000] [--days 365] [--sample 20] [--skip-seed]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+
+
+def seed(medications, days, start):
+    from django.core.management import call_command
+    from medtrackerapp.models import DailyAdherence, Medication
+
+    call_command("migrate", verbosity=0)
+    call_command("flush", interactive=False, verbosity=0)
+    rng = random.Random(42)
+    Medication.objects.bulk_create(
+        [Medication(name=f"Med {i}", dosage_mg=100, prescribed_per_day=rng.randint(1, 4)) for i in range(medications)],
+        batch_size=5000,
+    )
+    batch = []
+    for med_id, per_day in Medication.objects.values_list("id", "prescribed_per_day").iterator():
+        for offset in range(days):
+            taken = rng.randint(0, per_day)
+            batch.append(DailyAdherence(
+                medication_id=med_id, day=start + timedelta(days=offset),
+                taken_count=taken, missed_count=per_day - taken,
+            ))
+        if len(batch) >= 50000:
+            DailyAdherence.objects.bulk_create(batch, batch_size=5000)
+            batch = []
+    DailyAdherence.objects.bulk_create(batch, batch_size=5000)
+
+
+def run(args):
+    import django
+    django.setup()
+
+    from medtrackerapp.analytics import adherence_series, serialize_adherence_series
+    from medtrackerapp.models import Medication
+
+    start = date(2025, 1, 1)
+    end = start + timedelta(days=args.days - 1)
+    started = time.perf_counter()
+    if not args.skip_seed:
+        seed(args.medications, args.days, start)
+    seed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = adherence_series(start, end)
+    compute_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    serialize_adherence_series(result)
+    serialize_seconds = time.perf_counter() - started
+
+    # Same windows for a sample of medications, one query per window.
+    sample = list(Medication.objects.order_by("id")[:args.sample])
+    started = time.perf_counter()
+    for med in sample:
+        for offset in range(args.days):
+            day = start + timedelta(days=offset)
+            med.adherence_rate_over_period(day, day)
+            med.adherence_rate_over_period(day - timedelta(days=6), day)
+            med.adherence_rate_over_period(day - timedelta(days=29), day)
+        for offset in range(0, args.days, 7):
+            first = start + timedelta(days=offset)
+            med.adherence_rate_over_period(first, min(first + timedelta(days=6), end))
+    loop_seconds = (time.perf_counter() - started) / max(len(sample), 1) * args.medications
+
+    vectorized_seconds = compute_seconds + serialize_seconds
+    print(json.dumps({
+        "medications": args.medications,
+        "days": args.days,
+        "seed_seconds": round(seed_seconds, 2),
+        "vectorized_compute_seconds": round(compute_seconds, 3),
+        "vectorized_serialize_seconds": round(serialize_seconds, 3),
+        "loop_seconds_extrapolated": round(loop_seconds, 1),
+        "speedup": round(loop_seconds / vectorized_seconds, 1),
+    }, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--medications", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--sample", type=int, default=20, help="medications timed in the loop baseline")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the data seeded by a previous run")
+    args = parser.parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
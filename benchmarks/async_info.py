@@ -0,0 +1,120 @@
+"""
+Compare sync (WSGI) and async (ASGI) throughput of /medications/{id}/info/.
+
+Each mode runs in its own subprocess against a local stub OpenFDA
+server that answers after a fixed delay, with the drug-info cache and
+the enrichment store disabled so every request goes upstream:
+
+- wsgi: the DRF action, driven by a fixed pool of worker threads,
+  as a threaded WSGI worker would be.
+- asgi: the async view, driven by one event loop with all requests
+  in flight at once, as a single ASGI worker would be.
+
+Usage:
+    python -m benchmarks.async_info [--requests 200] [--delay 0.5] [--workers 8]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stub_openfda import StubOpenFDAServer
+
+
+def setup_django(stub_url):
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    from medtrackerapp.models import Medication
+    from medtrackerapp.services import DrugInfoService
+
+    call_command("migrate", verbosity=0)
+    DrugInfoService.BASE_URL = stub_url
+    medication, _ = Medication.objects.get_or_create(
+        name="Ibuprofen", defaults={"dosage_mg": 200, "prescribed_per_day": 3}
+    )
+    return f"/api/medications/{medication.id}/info/"
+
+
+def run_wsgi(url, total, workers):
+    from django.test import Client
+
+    def worker(count):
+        client = Client()
+        return sum(client.get(url).status_code == 200 for _ in range(count))
+
+    shares = [total // workers + (1 if i < total % workers else 0) for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(worker, shares))
+
+
+def run_asgi(url, total):
+    from django.test import AsyncClient
+
+    async def main():
+        client = AsyncClient()
+        responses = await asyncio.gather(*(client.get(url) for _ in range(total)))
+        return sum(response.status_code == 200 for response in responses)
+
+    return asyncio.run(main())
+
+
+def run_mode(args):
+    url = setup_django(args.stub_url)
+    started = time.perf_counter()
+    if args.mode == "wsgi":
+        ok = run_wsgi(url, args.requests, args.workers)
+    else:
+        ok = run_asgi(url, args.requests)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        "mode": args.mode,
+        "requests": args.requests,
+        "ok": ok,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(args.requests / elapsed, 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.5, help="stub upstream latency in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="WSGI worker threads")
+    parser.add_argument("--mode", choices=["wsgi", "asgi"], help=argparse.SUPPRESS)
+    parser.add_argument("--stub-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return
+
+    results = []
+    with StubOpenFDAServer(delay=args.delay) as stub:
+        for mode in ["wsgi", "asgi"]:
+            env = dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE="benchmarks.settings",
+                DRUG_INFO_CACHE_ENABLED="False",
+                DRUG_INFO_ENRICHMENT_ENABLED="False",
+                DRUG_INFO_ASYNC_VIEW="True" if mode == "asgi" else "False",
+                DRUG_INFO_POOL_SIZE=str(args.workers),
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.async_info", "--mode", mode,
+                 "--stub-url", stub.url, "--requests", str(args.requests),
+                 "--workers", str(args.workers)],
+                env=env, check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps({"delay": args.delay, "workers": args.workers, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Compare request throughput of /medications/{id}/expected-doses/ under
+different database connection settings.
+
+Each mode runs in its own subprocess and pushes `--requests` requests
+through Django's WSGI handler from `--workers` threads, closing every
+response the way a WSGI server does, so the per-request connection
+handling (`close_old_connections`) runs as in production:
+
+- per_request: CONN_MAX_AGE=0, a new connection for every request
+  (the old default).
+- persistent: CONN_MAX_AGE=60 with health checks, one connection
+  per thread reused across requests.
+- pool: a psycopg 3 pool sized to the worker count (Postgres only;
+  needs `psycopg[pool]`).
+
+Opening a SQLite file is cheap, so the gap is much wider against a
+real server: run with `BENCHMARK_DB=postgres` and the usual `DB_*`
+variables.
+
+Usage:
+    python -m benchmarks.connections [--requests 2000] [--workers 8] [--modes per_request persistent pool]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+MODES = {
+    "per_request": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "60", "DB_CONN_HEALTH_CHECKS": "True"},
+    "pool": {"DB_POOL": "True"},
+}
+
+
+def setup_django():
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connections
+    from medtrackerapp.models import Medication
+
+    call_command("migrate", verbosity=0)
+    medication, _ = Medication.objects.get_or_create(
+        name="Ibuprofen", defaults={"dosage_mg": 200, "prescribed_per_day": 3}
+    )
+    connections.close_all()
+    return f"/api/medications/{medication.id}/expected-doses/", "days=7"
+
+
+def run_requests(path, query, total, workers):
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+    from django.test import RequestFactory
+
+    handler = WSGIHandler()
+    factory = RequestFactory()
+
+    def start_response(status, headers, exc_info=None):
+        start_response.status = status
+
+    def worker(count):
+        ok = 0
+        try:
+            for _ in range(count):
+                environ = factory._base_environ(PATH_INFO=path, QUERY_STRING=query, REQUEST_METHOD="GET")
+                response = handler(environ, start_response)
+                b"".join(response)
+                response.close()  # fires request_finished, as a WSGI server would
+                ok += start_response.status.startswith("200")
+        finally:
+            connections.close_all()
+        return ok
+
+    shares = [total // workers + (1 if i < total % workers else 0) for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(worker, shares))
+
+
+def run_mode(args):
+    path, query = setup_django()
+    from django.db import connection
+    from medtrackerapp.instrumentation import metrics_registry
+
+    run_requests(path, query, min(args.requests, 50), args.workers)  # warm-up
+    metrics_registry.clear()
+    started = time.perf_counter()
+    ok = run_requests(path, query, args.requests, args.workers)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        "mode": args.mode,
+        "database": connection.vendor,
+        "requests": args.requests,
+        "ok": ok,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(args.requests / elapsed, 1),
+        "connections_opened": sum(metrics_registry.connection_counts().values()),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=8, help="request threads (and pool size)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--mode", choices=list(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return
+
+    results = []
+    for mode in args.modes:
+        if mode == "pool" and os.getenv("BENCHMARK_DB", "sqlite") != "postgres":
+            print("skipping pool: connection pools need BENCHMARK_DB=postgres", file=sys.stderr)
+            continue
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE="benchmarks.settings",
+            PERF_METRICS_ENABLED="False",
+            DB_POOL_MIN_SIZE=str(args.workers),
+            DB_POOL_MAX_SIZE=str(args.workers),
+            **MODES[mode],
+        )
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.connections", "--mode", mode,
+             "--requests", str(args.requests), "--workers", str(args.workers)],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps({"workers": args.workers, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
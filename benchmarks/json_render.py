@@ -0,0 +1,89 @@
+"""
+Benchmark the orjson-backed renderer/parser against DRF's stock JSON ones.
+
+Builds `--rows` dose-log representations (as `/logs/` returns them)
+and times, best of `--repeat`:
+
+- render: `JSONRenderer` vs `FastJSONRenderer` on the list.
+- parse: `JSONParser` vs `FastJSONParser` on a bulk-upload body of
+  the same rows.
+
+No database is needed.
+
+Usage:
+    python -m benchmarks.json_render [--rows 1000 10000 100000] [--repeat 5]
+"""
+import argparse
+import io
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def run(args):
+    import django
+    django.setup()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from medtrackerapp.exports import format_datetime
+    from medtrackerapp.parsers import FastJSONParser
+    from medtrackerapp.renderers import FastJSONRenderer
+
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    results = []
+    for rows in args.rows:
+        data = {
+            "next": "http://testserver/logs/?cursor=cD0yMDI1",
+            "previous": None,
+            "results": [
+                {
+                    "id": i,
+                    "medication": i % 100 + 1,
+                    "taken_at": format_datetime(start + timedelta(minutes=i, microseconds=i)),
+                    "was_taken": i % 5 != 0,
+                }
+                for i in range(rows)
+            ],
+        }
+        stock_render, stock_body = best_of(args.repeat, lambda: JSONRenderer().render(data))
+        fast_render, fast_body = best_of(args.repeat, lambda: FastJSONRenderer().render(data))
+
+        upload = json.dumps(data["results"]).encode()
+        stock_parse, _ = best_of(args.repeat, lambda: JSONParser().parse(io.BytesIO(upload)))
+        fast_parse, _ = best_of(args.repeat, lambda: FastJSONParser().parse(io.BytesIO(upload)))
+
+        results.append({
+            "rows": rows,
+            "identical": stock_body == fast_body,
+            "render_stock_ms": round(stock_render * 1000, 2),
+            "render_fast_ms": round(fast_render * 1000, 2),
+            "render_speedup": round(stock_render / fast_render, 1),
+            "parse_stock_ms": round(stock_parse * 1000, 2),
+            "parse_fast_ms": round(fast_parse * 1000, 2),
+            "parse_speedup": round(stock_parse / fast_parse, 1),
+        })
+    print(json.dumps(results, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Seed a benchmark database with synthetic medications, dose logs and notes.
+
+Rows are written with `bulk_create` in large batches, bypassing the
+per-row signal handlers; the DailyAdherence rollup is rebuilt once at
+the end with `rebuild_daily_adherence`. The same `--seed` always
+produces the same data.
+
+Usage:
+    python -m benchmarks.seed [--medications 1000] [--logs-per-medication 100]
+                              [--notes-per-medication 5] [--days 90] [--seed 42]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+BATCH_SIZE = 5000
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(medications=1000, logs_per_medication=100, notes_per_medication=5, days=90, random_seed=42):
+    """
+    Replace the database contents with a generated dataset.
+
+    Args:
+        medications (int): Medications to create.
+        logs_per_medication (int): Dose logs per medication, spread over `days`.
+        notes_per_medication (int): Doctor's notes per medication.
+        days (int): Number of days (from 2025-01-01) covered by the logs.
+        random_seed (int): Seed for the generator.
+
+    Returns:
+        dict: Row counts written per model.
+    """
+    from django.core.management import call_command
+    from medtrackerapp.models import DoctorsNote, DoseLog, Medication
+    from medtrackerapp.rollups import rebuild_daily_adherence
+
+    call_command("migrate", verbosity=0)
+    call_command("flush", interactive=False, verbosity=0)
+    rng = random.Random(random_seed)
+
+    Medication.objects.bulk_create(
+        [
+            Medication(name=f"Med {i}", dosage_mg=rng.choice([50, 100, 200, 500]), prescribed_per_day=rng.randint(1, 4))
+            for i in range(medications)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    med_ids = list(Medication.objects.order_by("id").values_list("id", flat=True))
+    span = days * 24 * 60
+
+    batch = []
+    for med_id in med_ids:
+        for _ in range(logs_per_medication):
+            batch.append(DoseLog(
+                medication_id=med_id,
+                taken_at=START + timedelta(minutes=rng.randrange(span)),
+                was_taken=rng.random() < 0.85,
+            ))
+        if len(batch) >= BATCH_SIZE * 10:
+            DoseLog.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+            batch = []
+    DoseLog.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+    DoctorsNote.objects.bulk_create(
+        [
+            DoctorsNote(medication_id=med_id, content=f"Review dosage after {rng.randint(1, 30)} days.")
+            for med_id in med_ids
+            for _ in range(notes_per_medication)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    rollups = rebuild_daily_adherence()
+    return {
+        "medications": len(med_ids),
+        "dose_logs": len(med_ids) * logs_per_medication,
+        "doctors_notes": len(med_ids) * notes_per_medication,
+        "daily_adherence": rollups,
+    }
+
+
+def add_arguments(parser):
+    """Add the dataset-size options shared by the seeding benchmarks."""
+    parser.add_argument("--medications", type=int, default=1000)
+    parser.add_argument("--logs-per-medication", type=int, default=100)
+    parser.add_argument("--notes-per-medication", type=int, default=5)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def seed_from_args(args):
+    return seed(args.medications, args.logs_per_medication, args.notes_per_medication, args.days, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    import django
+    django.setup()
+
+    started = time.perf_counter()
+    counts = seed_from_args(args)
+    print(json.dumps({**counts, "seconds": round(time.perf_counter() - started, 2)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
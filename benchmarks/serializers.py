@@ -0,0 +1,90 @@
+"""
+Benchmark the `.values()` serializers against the DRF model serializers.
+
+Seeds (with `benchmarks.seed`) at least the largest requested number
+of dose logs and doctor's notes, then for each size in `--rows` times
+rendering the newest N rows to JSON bytes with:
+
+- model: `queryset` -> model instances -> `ModelSerializer(many=True)`.
+- values: `.values()` rows -> `ValuesSerializer`.
+
+Both paths include fetching the rows and `JSONRenderer` output, and the
+bytes are checked to be identical.
+
+Usage:
+    python -m benchmarks.serializers [--rows 1000 10000 100000] [--repeat 3] [--skip-seed]
+"""
+import argparse
+import json
+import os
+import time
+
+from benchmarks import seed as seeding
+
+
+def seed(rows):
+    # Spread `rows` logs and notes evenly over 100 medications.
+    per_medication = max(1, -(-rows // 100))
+    seeding.seed(medications=100, logs_per_medication=per_medication, notes_per_medication=per_medication, days=365)
+
+
+def best_of(repeat, render):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+
+def run(args):
+    import django
+    django.setup()
+
+    from rest_framework.renderers import JSONRenderer
+    from medtrackerapp.models import DoctorsNote, DoseLog
+    from medtrackerapp.serializers import (
+        DoctorsNoteSerializer, DoctorsNoteValuesSerializer, DoseLogSerializer, DoseLogValuesSerializer,
+    )
+
+    if not args.skip_seed:
+        seed(max(args.rows))
+
+    renderer = JSONRenderer()
+    cases = [
+        ("logs", DoseLog.objects.order_by("-taken_at", "id"), DoseLogSerializer, DoseLogValuesSerializer),
+        ("notes", DoctorsNote.objects.order_by("id"), DoctorsNoteSerializer, DoctorsNoteValuesSerializer),
+    ]
+    results = []
+    for name, queryset, model_serializer, values_serializer in cases:
+        for rows in args.rows:
+            selected = queryset[:rows]
+            model_seconds, model_body = best_of(
+                args.repeat, lambda: renderer.render(model_serializer(selected, many=True).data)
+            )
+            values_seconds, values_body = best_of(
+                args.repeat, lambda: renderer.render(values_serializer(values_serializer.values(selected)).data)
+            )
+            results.append({
+                "endpoint": name,
+                "rows": rows,
+                "identical": model_body == values_body,
+                "model_rows_per_second": round(rows / model_seconds),
+                "values_rows_per_second": round(rows / values_seconds),
+                "speedup": round(model_seconds / values_seconds, 2),
+            })
+    print(json.dumps(results, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the data seeded by a previous run")
+    args = parser.parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Django settings used by the benchmark scripts.
+
+Runs against a throwaway SQLite file by default; set
+`BENCHMARK_DB=postgres` to use the Postgres database configured
+through the usual `DB_*` environment variables instead.
+"""
+import os
+import tempfile
+
+from medtracker.settings import *  # noqa: F401,F403
+
+DEBUG = False
+ALLOWED_HOSTS = ["testserver", "localhost", "127.0.0.1"]
+
+if os.getenv("BENCHMARK_DB", "sqlite") == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv(
+                "BENCHMARK_SQLITE_PATH",
+                os.path.join(tempfile.gettempdir(), "medtracker_bench.sqlite3"),
+            ),
+            # Same connection management as the main settings (no pool on SQLite).
+            "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+            "CONN_HEALTH_CHECKS": DATABASES["default"]["CONN_HEALTH_CHECKS"],
+        }
+    }
+
+# The suite measures the stored-info path, so enrichment defaults to on
+# here; `benchmarks.async_info` switches it off through the environment.
+DRUG_INFO_ENRICHMENT = {
+    **DRUG_INFO_ENRICHMENT,  # noqa: F405
+    "ENABLED": os.getenv("DRUG_INFO_ENRICHMENT_ENABLED", "True") == "True",
+}
@@ -0,0 +1,59 @@
+"""A local, deliberately slow stand-in for the OpenFDA drug-label API."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+LABEL = {
+    "results": [{
+        "openfda": {"generic_name": ["Ibuprofen"], "manufacturer_name": ["McKesson"]},
+        "warnings": ["Keep out of reach of children."],
+        "purpose": ["Pain reliever"],
+    }]
+}
+
+
+class SlowLabelHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid delayed-ACK stalls on keep-alive.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        body = json.dumps(LABEL).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubOpenFDAServer:
+    """
+    Serve `LABEL` on a free local port after sleeping `delay` seconds.
+
+    Usable as a context manager; `url` is the drug-label endpoint to
+    assign to `DrugInfoService.BASE_URL`.
+    """
+
+    def __init__(self, delay=0.2):
+        self.httpd = _StubHTTPServer(("127.0.0.1", 0), SlowLabelHandler)
+        self.httpd.delay = delay
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/drug/label.json"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,230 @@
+"""
+Repeatable timing and memory benchmarks for the main endpoints and models.
+
+Seeds a dataset with `benchmarks.seed` (unless `--skip-seed`), then
+runs every benchmark `--warmup` + `--repeat` times through the Django
+test client (or directly, for model methods) and reports per
+benchmark:
+
+- median_ms / p95_ms / min_ms: wall time of the timed runs.
+- peak_kib: peak Python allocation of one extra run (tracemalloc).
+- queries: database queries of one run.
+
+OpenFDA is replaced by a local stub server: it backs the live
+`/medications/info/?ids=` lookups and fills the enrichment store that
+`/medications/{id}/info/` serves from.
+Results are written as JSON (`--output`, default stdout). With
+`--baseline`, medians are compared to a previous result file and the
+process exits with status 1 if any benchmark got slower by more than
+`--threshold` (a fraction, default 0.25) and at least `--min-delta-ms`.
+
+Runs on SQLite by default and on Postgres with `BENCHMARK_DB=postgres`
+(see `benchmarks.settings`).
+
+Usage:
+    python -m benchmarks.suite [--medications 1000] [--logs-per-medication 100]
+                               [--repeat 10] [--only logs_list ...]
+                               [--output results.json] [--baseline old.json --threshold 0.25]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+
+from benchmarks import seed as seeding
+from benchmarks.stub_openfda import StubOpenFDAServer
+
+
+class Benchmark:
+    """A named callable, with optional untimed `before` hook run ahead of every call."""
+
+    def __init__(self, name, run, before=None):
+        self.name = name
+        self.run = run
+        self.before = before or (lambda: None)
+
+
+def build_benchmarks(client, medication_id):
+    from django.core.cache import cache
+    from medtrackerapp.models import Medication
+    from medtrackerapp.enrichment import enqueue, run_pending
+    from medtrackerapp.services import get_drug_info_cache
+
+    # Fill the enrichment store (from the stub) for the stored-info benchmark.
+    enqueue([medication_id])
+    run_pending()
+    def get(url, params=None):
+        def run():
+            response = client.get(url, params)
+            assert response.status_code == 200, (url, response.status_code)
+            return response
+        return run
+
+    medications = list(Medication.objects.order_by("id")[:100])
+
+    def clear_drug_info():
+        # Both tiers: the in-process LRU and the shared Django cache.
+        get_drug_info_cache().clear()
+        cache.clear()
+
+    def model_loop(method):
+        def run():
+            for med in medications:
+                method(med)
+        return run
+
+    return [
+        Benchmark("medications_list", get("/api/medications/")),
+        Benchmark("medications_list_cold", get("/api/medications/"), before=cache.clear),
+        Benchmark("logs_list", get("/api/logs/", {"page_size": 1000})),
+        Benchmark("logs_filter", get("/api/logs/filter/", {"start": "2025-01-01", "end": "2025-01-31", "page_size": 1000})),
+        Benchmark("expected_doses", get(f"/api/medications/{medication_id}/expected-doses/", {"days": 30})),
+        Benchmark("drug_info_stored", get(f"/api/medications/{medication_id}/info/")),
+        Benchmark("drug_info_live_uncached", get("/api/medications/info/", {"ids": medication_id}), before=clear_drug_info),
+        Benchmark("drug_info_live_cached", get("/api/medications/info/", {"ids": medication_id})),
+        Benchmark("model_adherence_rate_x100", model_loop(lambda med: med.adherence_rate())),
+        Benchmark(
+            "model_adherence_over_period_x100",
+            model_loop(lambda med: med.adherence_rate_over_period(date(2025, 1, 1), date(2025, 1, 31))),
+        ),
+        Benchmark("model_expected_doses_x100", model_loop(lambda med: med.expected_doses(30))),
+    ]
+
+
+def measure(benchmark, warmup, repeat):
+    from medtrackerapp.query_audit import QueryRecorder
+
+    for _ in range(warmup):
+        benchmark.before()
+        benchmark.run()
+
+    timings = []
+    for _ in range(repeat):
+        benchmark.before()
+        gc.collect()
+        started = time.perf_counter()
+        benchmark.run()
+        timings.append(time.perf_counter() - started)
+
+    benchmark.before()
+    tracemalloc.start()
+    with QueryRecorder() as recorder:
+        benchmark.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 3),
+        "min_ms": round(timings[0] * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "queries": len(recorder.queries),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """
+    Compare medians against a baseline result document.
+
+    Returns:
+        tuple[dict, list[str]]: Per-benchmark ratios, and the names of
+            benchmarks slower than `1 + threshold` times the baseline
+            by at least `min_delta_ms`.
+    """
+    ratios, regressions = {}, []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["median_ms"]:
+            continue
+        ratios[name] = round(result["median_ms"] / previous["median_ms"], 3)
+        if ratios[name] > 1 + threshold and result["median_ms"] - previous["median_ms"] >= min_delta_ms:
+            regressions.append(name)
+    return ratios, regressions
+
+
+def run(args):
+    import django
+    django.setup()
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client
+    from medtrackerapp.models import Medication
+    from medtrackerapp.services import DrugInfoService
+
+    dataset = seeding.seed_from_args(args) if not args.skip_seed else None
+    medication_id = Medication.objects.order_by("id").values_list("id", flat=True).first()
+    if medication_id is None:
+        sys.exit("The benchmark database is empty; run without --skip-seed first.")
+
+    results = {}
+    with StubOpenFDAServer(delay=args.stub_delay) as stub:
+        DrugInfoService.BASE_URL = stub.url
+        for benchmark in build_benchmarks(Client(), medication_id):
+            if args.only and benchmark.name not in args.only:
+                continue
+            results[benchmark.name] = measure(benchmark, args.warmup, args.repeat)
+            print(f"{benchmark.name}: {results[benchmark.name]['median_ms']} ms", file=sys.stderr)
+
+    document = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "json_backend": settings.JSON_BACKEND,
+            "dataset": dataset or "existing",
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as handle:
+            ratios, regressions = compare(results, json.load(handle), args.threshold, args.min_delta_ms)
+        document["comparison"] = {
+            "baseline": args.baseline,
+            "threshold": args.threshold,
+            "min_delta_ms": args.min_delta_ms,
+            "ratios": ratios,
+            "regressions": regressions,
+        }
+        exit_code = 1 if regressions else 0
+
+    output = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+    return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    seeding.add_arguments(parser)
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the data seeded by a previous run")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--only", nargs="+", help="run only these benchmarks")
+    parser.add_argument("--stub-delay", type=float, default=0.0, help="stub OpenFDA latency in seconds")
+    parser.add_argument("--output", help="write results here instead of stdout")
+    parser.add_argument("--baseline", help="previous results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this (timer noise)"
+    )
+    args = parser.parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
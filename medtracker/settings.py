@@ -30,10 +30,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "medtrackerapp.middleware.PerformanceMiddleware",
+    "medtrackerapp.middleware.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "medtracker.urls"
 
+TEST_RUNNER = "medtrackerapp.test_runner.QueryAuditRunner"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -52,6 +56,15 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "medtracker.wsgi.application"
 
+# Connection management. By default each thread keeps its connection
+# for DB_CONN_MAX_AGE seconds (0 = close after every request; None =
+# forever) and health-checks it before reusing it in a new request.
+# DB_POOL=True switches to a psycopg 3 connection pool per worker
+# process instead (requires `psycopg[pool]`); size it to the worker's
+# thread count. Persistent connections must be off with a pool.
+DB_POOL = os.getenv("DB_POOL", "False") == "True"
+DB_CONN_MAX_AGE = os.getenv("DB_CONN_MAX_AGE", "60")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -60,8 +73,37 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "test"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": 0 if DB_POOL else (None if DB_CONN_MAX_AGE == "None" else int(DB_CONN_MAX_AGE)),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
+        "OPTIONS": {
+            "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+        },
     }
 }
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "4")),
+        # Seconds a request waits for a free connection before failing.
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        # Recycle pooled connections, like CONN_MAX_AGE does for persistent ones.
+        "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+    }
+
+# Read replicas: comma-separated hosts sharing the primary's credentials.
+# Tests mirror them onto the primary's test database.
+DB_REPLICA_HOSTS = [host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()]
+for index, host in enumerate(DB_REPLICA_HOSTS, start=1):
+    DATABASES[f"replica_{index}"] = {**DATABASES["default"], "HOST": host, "TEST": {"MIRROR": "default"}}
+
+DATABASE_ROUTERS = ["medtrackerapp.routers.PrimaryReplicaRouter"]
+
+DATABASE_REPLICAS = {
+    "ALIASES": [f"replica_{index}" for index in range(1, len(DB_REPLICA_HOSTS) + 1)],
+    # After a write, the client reads from the primary for this long.
+    "STICKY_SECONDS": int(os.getenv("DB_REPLICA_STICKY_SECONDS", "5")),
+    "COOKIE_NAME": "medtracker_primary",
+}
 
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -70,3 +112,100 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+DRUG_INFO_CACHE = {
+    "ENABLED": os.getenv("DRUG_INFO_CACHE_ENABLED", "True") == "True",
+    "MAXSIZE": int(os.getenv("DRUG_INFO_CACHE_MAXSIZE", "256")),
+    "TTL": int(os.getenv("DRUG_INFO_CACHE_TTL", "86400")),
+    "NEGATIVE_TTL": int(os.getenv("DRUG_INFO_CACHE_NEGATIVE_TTL", "300")),
+    "STALE_TTL": int(os.getenv("DRUG_INFO_CACHE_STALE_TTL", "3600")),
+    "CACHE_ALIAS": "default",
+    "KEY_PREFIX": "druginfo",
+}
+
+DRUG_INFO_HTTP = {
+    "POOL_SIZE": int(os.getenv("DRUG_INFO_POOL_SIZE", "10")),
+    "CONNECT_TIMEOUT": float(os.getenv("DRUG_INFO_CONNECT_TIMEOUT", "3.05")),
+    "READ_TIMEOUT": float(os.getenv("DRUG_INFO_READ_TIMEOUT", "10")),
+    "MAX_RETRIES": int(os.getenv("DRUG_INFO_MAX_RETRIES", "3")),
+    "BACKOFF_FACTOR": float(os.getenv("DRUG_INFO_BACKOFF_FACTOR", "0.5")),
+    "BACKOFF_MAX": float(os.getenv("DRUG_INFO_BACKOFF_MAX", "8")),
+    "BREAKER_FAILURE_THRESHOLD": int(os.getenv("DRUG_INFO_BREAKER_THRESHOLD", "5")),
+    "BREAKER_RESET_TIMEOUT": float(os.getenv("DRUG_INFO_BREAKER_RESET_TIMEOUT", "30")),
+    "ASYNC_MAX_CONNECTIONS": int(os.getenv("DRUG_INFO_ASYNC_MAX_CONNECTIONS", "200")),
+}
+
+# Serve /medications/{id}/info/ from an async view (use with an ASGI server).
+DRUG_INFO_ASYNC_VIEW = os.getenv("DRUG_INFO_ASYNC_VIEW", "False") == "True"
+
+DRUG_INFO_BATCH = {
+    "MAX_WORKERS": int(os.getenv("DRUG_INFO_BATCH_MAX_WORKERS", "8")),
+    "MAX_IDS": int(os.getenv("DRUG_INFO_BATCH_MAX_IDS", "100")),
+}
+
+DOSE_LOG_BULK = {
+    "CHUNK_SIZE": int(os.getenv("DOSE_LOG_BULK_CHUNK_SIZE", "500")),
+    "MAX_ROWS": int(os.getenv("DOSE_LOG_BULK_MAX_ROWS", "10000")),
+}
+
+# Longest date range accepted by /medications/adherence/.
+ANALYTICS_MAX_DAYS = int(os.getenv("ANALYTICS_MAX_DAYS", "366"))
+
+MEDICATION_RESPONSE_CACHE = {
+    "ENABLED": os.getenv("MEDICATION_RESPONSE_CACHE_ENABLED", "True") == "True",
+    "TIMEOUT": int(os.getenv("MEDICATION_RESPONSE_CACHE_TIMEOUT", "300")),
+    "CACHE_ALIAS": "default",
+    "KEY_PREFIX": "medrepr",
+}
+
+# orjson-backed JSON rendering/parsing; set JSON_BACKEND=json to use the stdlib.
+JSON_BACKEND = os.getenv("JSON_BACKEND", "orjson")
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "medtrackerapp.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "medtrackerapp.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Most recent related rows embedded by /medications/?expand=logs,notes.
+MEDICATION_EXPAND = {
+    "LOGS_LIMIT": int(os.getenv("MEDICATION_EXPAND_LOGS_LIMIT", "20")),
+    "NOTES_LIMIT": int(os.getenv("MEDICATION_EXPAND_NOTES_LIMIT", "20")),
+}
+
+PERF_METRICS = {
+    "ENABLED": os.getenv("PERF_METRICS_ENABLED", "True") == "True",
+    "SAMPLE_RATE": float(os.getenv("PERF_METRICS_SAMPLE_RATE", "1.0")),
+    "SERVER_TIMING": os.getenv("PERF_METRICS_SERVER_TIMING", "True") == "True",
+}
+
+# Background OpenFDA enrichment; the worker runs via `manage.py enrichment_worker`.
+# Off by default: without a running worker the `info` endpoint would answer 202 forever.
+DRUG_INFO_ENRICHMENT = {
+    "ENABLED": os.getenv("DRUG_INFO_ENRICHMENT_ENABLED", "False") == "True",
+    "REFRESH_AFTER": int(os.getenv("DRUG_INFO_ENRICHMENT_REFRESH_AFTER", "86400")),
+    "MAX_ATTEMPTS": int(os.getenv("DRUG_INFO_ENRICHMENT_MAX_ATTEMPTS", "5")),
+    "RETRY_BACKOFF": int(os.getenv("DRUG_INFO_ENRICHMENT_RETRY_BACKOFF", "60")),
+    "BATCH_SIZE": int(os.getenv("DRUG_INFO_ENRICHMENT_BATCH_SIZE", "20")),
+    "LOCK_TIMEOUT": int(os.getenv("DRUG_INFO_ENRICHMENT_LOCK_TIMEOUT", "300")),
+}
+
+# Local copy of the OpenFDA drug-label dataset, loaded with
+# `manage.py ingest_drug_labels`. With REMOTE_FALLBACK off, names that
+# are not mirrored are reported as not found (air-gapped deployments).
+DRUG_LABEL_MIRROR = {
+    "ENABLED": os.getenv("DRUG_LABEL_MIRROR_ENABLED", "False") == "True",
+    "REMOTE_FALLBACK": os.getenv("DRUG_LABEL_MIRROR_REMOTE_FALLBACK", "True") == "True",
+}
+
+# Dose logs older than HORIZON_DAYS are moved to DoseLogArchive by `manage.py archive_dose_logs`.
+DOSE_LOG_ARCHIVE = {
+    "HORIZON_DAYS": int(os.getenv("DOSE_LOG_ARCHIVE_HORIZON_DAYS", "730")),
+    "BATCH_SIZE": int(os.getenv("DOSE_LOG_ARCHIVE_BATCH_SIZE", "10000")),
+}
@@ -0,0 +1,14 @@
+"""
+Settings for the test suite.
+
+Adds a `replica` alias that mirrors the primary's test database, so
+replica routing can be tested without creating a second database.
+Routing itself stays off (`DATABASE_REPLICAS["ALIASES"]` is empty);
+the tests that exercise it enable it with `override_settings`.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=medtracker.test_settings python manage.py test medtrackerapp/tests
+"""
+from medtracker.settings import *  # noqa: F401,F403
+
+DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}  # noqa: F405
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 class TrackerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "medtrackerapp"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .instrumentation import count_connection, install_query_recorder
+        from .signals import connect_rollup_signals
+        connect_rollup_signals()
+        connection_created.connect(install_query_recorder, dispatch_uid="perf_query_recorder")
+        connection_created.connect(count_connection, dispatch_uid="perf_connection_counter")
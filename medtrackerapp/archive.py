@@ -0,0 +1,151 @@
+import heapq
+from datetime import timedelta
+from functools import cmp_to_key
+from itertools import chain
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import DoseLog, DoseLogArchive
+
+ARCHIVE_COLUMNS = ("id", "medication_id", "taken_at", "was_taken")
+
+
+def archive_settings() -> dict:
+    """Return `settings.DOSE_LOG_ARCHIVE` merged over the defaults."""
+    return {"HORIZON_DAYS": 730, "BATCH_SIZE": 10000, **getattr(settings, "DOSE_LOG_ARCHIVE", {})}
+
+
+def archive_cutoff(horizon_days=None, now=None):
+    """Return the datetime before which dose logs are archived."""
+    horizon_days = archive_settings()["HORIZON_DAYS"] if horizon_days is None else horizon_days
+    return (now or timezone.now()) - timedelta(days=horizon_days)
+
+
+def archive_dose_logs(before, batch_size=None) -> int:
+    """
+    Move dose logs taken before `before` into `DoseLogArchive`.
+
+    Each batch of ids is selected (and row-locked where supported)
+    once, then copied with one `INSERT ... SELECT` and removed with one
+    `DELETE` over that same id list in one transaction, so rows never
+    pass through Python, are never visible in both tables or in
+    neither, and a log committed meanwhile is never deleted unarchived.
+    The DoseLog signal handlers are bypassed on purpose: archived logs
+    still count towards the `DailyAdherence` rollup and medication
+    versions are unchanged, since reads return the same rows.
+
+    Archived rows keep their id. Live ids are never reused: they come
+    from a sequence on Postgres and an AUTOINCREMENT key on SQLite.
+
+    Args:
+        before (datetime): Archive logs with `taken_at` earlier than this.
+        batch_size (int | None): Rows moved per transaction.
+
+    Returns:
+        int: Number of logs archived.
+    """
+    batch_size = batch_size or archive_settings()["BATCH_SIZE"]
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(column) for column in ARCHIVE_COLUMNS)
+    live_table = quote(DoseLog._meta.db_table)
+    archive_table = quote(DoseLogArchive._meta.db_table)
+
+    moved = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                DoseLog.objects.select_for_update().filter(taken_at__lt=before)
+                .order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return moved
+            select_sql, params = DoseLog.objects.filter(id__in=ids).order_by().values_list(
+                *ARCHIVE_COLUMNS
+            ).query.sql_with_params()
+            placeholders = ", ".join(["%s"] * len(ids))
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {archive_table} ({columns}) {select_sql}", params)
+                cursor.execute(f"DELETE FROM {live_table} WHERE {quote('id')} IN ({placeholders})", ids)
+                moved += cursor.rowcount
+
+
+class CombinedDoseLogs:
+    """
+    Read-only, queryset-like view over live and archived dose logs.
+
+    Supports the parts of the QuerySet API used by the list views,
+    cursor pagination and exports: `filter`, `order_by`, `values`,
+    `values_list`, slicing and `iterator`. Each operation is applied to
+    both tables; results are merged in the requested order, so a page
+    of N rows costs one query per table of at most N rows each.
+
+    Example:
+        logs = CombinedDoseLogs().filter(medication_id=1).order_by("-taken_at", "id")
+        newest = logs[:100]
+    """
+
+    def __init__(self, live=None, archived=None, ordering=(), fields=None, kind="model"):
+        self.live = DoseLog.objects.all() if live is None else live
+        self.archived = DoseLogArchive.objects.all() if archived is None else archived
+        self.ordering = ordering
+        self.fields = fields
+        self.kind = kind
+
+    def _clone(self, live, archived, **changes):
+        options = {"ordering": self.ordering, "fields": self.fields, "kind": self.kind, **changes}
+        return CombinedDoseLogs(live, archived, **options)
+
+    def filter(self, *args, **kwargs):
+        return self._clone(self.live.filter(*args, **kwargs), self.archived.filter(*args, **kwargs))
+
+    def order_by(self, *ordering):
+        return self._clone(self.live.order_by(*ordering), self.archived.order_by(*ordering), ordering=ordering)
+
+    def values(self, *fields):
+        return self._clone(self.live.values(*fields), self.archived.values(*fields), fields=fields, kind="dict")
+
+    def values_list(self, *fields):
+        return self._clone(
+            self.live.values_list(*fields), self.archived.values_list(*fields), fields=fields, kind="tuple"
+        )
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) or item.step is not None or item.stop is None:
+            raise TypeError("CombinedDoseLogs only supports bounded slices.")
+        stop = item.stop
+        return list(self._merge(list(self.live[:stop]), list(self.archived[:stop])))[item.start or 0:stop]
+
+    def iterator(self, chunk_size=2000):
+        return self._merge(self.live.iterator(chunk_size=chunk_size), self.archived.iterator(chunk_size=chunk_size))
+
+    def __iter__(self):
+        return self.iterator()
+
+    def _merge(self, live_rows, archived_rows):
+        if not self.ordering:
+            return chain(live_rows, archived_rows)
+        return heapq.merge(live_rows, archived_rows, key=self._sort_key())
+
+    def _sort_key(self):
+        spec = [(field.lstrip("-"), field.startswith("-")) for field in self.ordering]
+        if self.kind == "tuple":
+            positions = {name: self.fields.index(name) for name, _ in spec}
+
+            def get(row, name):
+                return row[positions[name]]
+        elif self.kind == "dict":
+            def get(row, name):
+                return row[name]
+        else:
+            get = getattr
+
+        def compare(a, b):
+            for name, descending in spec:
+                x, y = get(a, name), get(b, name)
+                if x != y:
+                    return (1 if x > y else -1) * (-1 if descending else 1)
+            return 0
+
+        return cmp_to_key(compare)
@@ -0,0 +1,50 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def etag_for(request, version):
+    """
+    Build a weak ETag from a resource version and the request variant.
+
+    The request path (including the query string) and negotiated media
+    type are mixed in so that different pages, filters and formats of
+    the same resource never share a validator.
+    """
+    variant = f"{version}|{request.get_full_path()}|{getattr(request, 'accepted_media_type', '')}"
+    return f'W/"{hashlib.md5(variant.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def conditional_response(request, version, last_modified, render):
+    """
+    Answer a GET with 304 Not Modified when the client's copy is current.
+
+    Args:
+        request (Request): The current request.
+        version (str | None): Cheap version token of the resource, or
+            None to skip conditional handling (e.g. missing object).
+        last_modified (datetime | None): When the resource last changed.
+        render (Callable[[], Response]): Builds the full response; only
+            called when the client's validators do not match.
+
+    Returns:
+        HttpResponse: A 304 response, or the rendered response with
+            `ETag` and `Last-Modified` headers added.
+    """
+    if version is None:
+        return render()
+
+    etag = etag_for(request, version)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+
+    response = render()
+    if response.status_code == 200:
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+    return response
@@ -0,0 +1,286 @@
+import gzip
+import io
+import json
+import zipfile
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import DrugLabel
+
+READ_CHUNK_SIZE = 1 << 20
+# Largest single label accepted; stops a malformed file from being buffered whole.
+MAX_RECORD_SIZE = 64 << 20
+WHITESPACE = " \t\n\r"
+
+
+def mirror_settings() -> dict:
+    """Return `settings.DRUG_LABEL_MIRROR` merged over the defaults."""
+    return {"ENABLED": False, "REMOTE_FALLBACK": True, **getattr(settings, "DRUG_LABEL_MIRROR", {})}
+
+
+def normalize_name(drug_name) -> str:
+    """Return the lookup key for a generic name."""
+    return (drug_name or "").strip().lower()
+
+
+class _JSONStream:
+    """Incremental reader over a text stream, decoding one JSON value at a time."""
+
+    def __init__(self, stream, chunk_size=READ_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop consumed text only when refilling, so decoding never copies the buffer per value.
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Malformed drug-label file: expected {char!r} at offset {self.pos}.")
+        self.pos += 1
+
+    def separator(self, close):
+        """Consume the ',' between members, or stop before the closing `close`."""
+        char = self.peek()
+        if char == ",":
+            self.pos += 1
+        elif char != close:
+            raise ValueError(f"Malformed drug-label file: expected ',' or {close!r} at offset {self.pos}.")
+
+    def value(self):
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely cut off at the end of the buffer; read more and retry.
+                if len(self.buffer) - self.pos > MAX_RECORD_SIZE or self.eof or not self._fill():
+                    raise
+                continue
+            if end == len(self.buffer) and not self.eof and self.buffer[self.pos] not in "{[\"":
+                # A bare number may continue in the next chunk.
+                if self._fill():
+                    continue
+            self.pos = end
+            return value
+
+
+def iter_label_records(stream, chunk_size=READ_CHUNK_SIZE):
+    """
+    Yield the label records of an OpenFDA bulk drug-label file one by one.
+
+    The file is a single object, `{"meta": {...}, "results": [...]}`;
+    top-level values other than `results` are skipped, and the
+    `results` array is decoded one element at a time, so memory use is
+    bounded by the largest single label rather than the file size.
+
+    Args:
+        stream (TextIO): The file contents.
+        chunk_size (int): Characters read per refill.
+
+    Yields:
+        dict: Raw label records.
+
+    Raises:
+        ValueError: If the file is not a JSON object of that shape.
+    """
+    reader = _JSONStream(stream, chunk_size)
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+        if key == "results":
+            reader.expect("[")
+            while reader.peek() != "]":
+                yield reader.value()
+                reader.separator("]")
+            reader.expect("]")
+        else:
+            reader.value()
+        reader.separator("}")
+    reader.expect("}")
+
+
+def open_dumps(path):
+    """
+    Yield text streams for a dump file or every dump in a directory.
+
+    Accepts the `.json.zip` files OpenFDA publishes as well as `.json`
+    and `.json.gz`; zip members are streamed without extracting them.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for child in sorted(path.iterdir()):
+            if child.name.endswith((".json", ".json.gz", ".zip")):
+                yield from open_dumps(child)
+        return
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                if member.endswith(".json"):
+                    with archive.open(member) as raw:
+                        yield io.TextIOWrapper(raw, encoding="utf-8")
+    elif path.suffix == ".gz":
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            yield handle
+    else:
+        with open(path, encoding="utf-8") as handle:
+            yield handle
+
+
+def label_rows(record) -> list:
+    """
+    Build `DrugLabel` rows (one per generic name) from a raw label record.
+
+    Field defaults match `DrugInfoService._parse_label`, so a local hit
+    returns what the API would for the same label.
+    """
+    openfda = record.get("openfda") or {}
+    names = openfda.get("generic_name") or []
+    names = [names] if isinstance(names, str) else names
+    set_id = record.get("set_id") or record.get("id")
+    if not names or not set_id:
+        return []
+    manufacturer = openfda.get("manufacturer_name") or ["Unknown"]
+    manufacturer = manufacturer[0] if isinstance(manufacturer, list) else manufacturer
+    rows = {}
+    for name in names:
+        key = normalize_name(name)
+        if key and key not in rows:
+            rows[key] = DrugLabel(
+                generic_name=key[:255],
+                set_id=set_id,
+                name=name[:255],
+                manufacturer=manufacturer[:255],
+                warnings=record.get("warnings", ["No warnings available"]),
+                purpose=record.get("purpose", ["Not specified"]),
+                effective_time=(record.get("effective_time") or "")[:8],
+            )
+    return list(rows.values())
+
+
+def ingest_labels(paths, batch_size=1000, replace=False) -> dict:
+    """
+    Load OpenFDA bulk drug-label dumps into `DrugLabel`.
+
+    Records are streamed and upserted on `(generic_name, set_id)` in
+    batches of `batch_size`, each in its own transaction, so re-running
+    with a newer dump updates labels in place.
+
+    With `replace`, labels missing from these dumps are deleted once
+    the whole ingest has succeeded, in a single transaction, so lookups
+    keep being answered from the old data while the new dumps load.
+
+    Args:
+        paths (Iterable[str | Path]): Dump files or directories.
+        batch_size (int): Rows written per `bulk_create`.
+        replace (bool): Remove stored labels that are not in `paths`.
+
+    Returns:
+        dict: Counts of `records` read, `rows` written, `skipped`
+              records (no generic name or set id) and `deleted` rows.
+    """
+    counts = {"records": 0, "rows": 0, "skipped": 0, "deleted": 0}
+    batch = {}
+    seen = set()
+
+    def flush():
+        with transaction.atomic():
+            DrugLabel.objects.bulk_create(
+                batch.values(),
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["generic_name", "set_id"],
+                update_fields=["name", "manufacturer", "warnings", "purpose", "effective_time"],
+            )
+        counts["rows"] += len(batch)
+        if replace:
+            seen.update(batch)
+        batch.clear()
+
+    for path in paths:
+        for stream in open_dumps(path):
+            for record in iter_label_records(stream):
+                counts["records"] += 1
+                rows = label_rows(record)
+                if not rows:
+                    counts["skipped"] += 1
+                for row in rows:
+                    # A dump can repeat a label; keep the last copy so one statement never upserts a key twice.
+                    batch[(row.generic_name, row.set_id)] = row
+                if len(batch) >= batch_size:
+                    flush()
+    if batch:
+        flush()
+    if replace:
+        counts["deleted"] = _delete_unseen(seen, batch_size)
+    return counts
+
+
+def _delete_unseen(seen, batch_size) -> int:
+    """Delete, in one transaction, every label whose key is not in `seen`."""
+    deleted = 0
+    with transaction.atomic():
+        rows = DrugLabel.objects.values_list("pk", "generic_name", "set_id").order_by("pk")
+        stale = [pk for pk, generic_name, set_id in rows.iterator(chunk_size=batch_size)
+                 if (generic_name, set_id) not in seen]
+        for start in range(0, len(stale), batch_size):
+            deleted += DrugLabel.objects.filter(pk__in=stale[start:start + batch_size]).delete()[0]
+    return deleted
+
+
+def _label_queryset(drug_name):
+    return DrugLabel.objects.filter(generic_name=normalize_name(drug_name)).order_by("-effective_time", "set_id")
+
+
+def lookup_label(drug_name):
+    """
+    Return drug info for `drug_name` from the local mirror, or None if it is not there.
+
+    Picks the most recently effective label when several share the name.
+    """
+    label = _label_queryset(drug_name).first()
+    return label.as_drug_info() if label else None
+
+
+def lookup_labels(drug_names) -> dict:
+    """
+    Look up several names in the local mirror with a single query.
+
+    Returns:
+        dict: Maps each mirrored normalized name to its drug info; names
+              that are not mirrored are left out.
+    """
+    keys = {normalize_name(name) for name in drug_names} - {""}
+    found = {}
+    labels = DrugLabel.objects.filter(generic_name__in=keys).order_by("generic_name", "-effective_time", "set_id")
+    for label in labels:
+        found.setdefault(label.generic_name, label.as_drug_info())
+    return found
+
+
+async def alookup_label(drug_name):
+    """Async variant of `lookup_label`."""
+    label = await _label_queryset(drug_name).afirst()
+    return label.as_drug_info() if label else None
@@ -0,0 +1,232 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import DrugInfoEnrichment, EnrichmentJob, Medication
+from .services import DrugInfoService, DrugNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+def enrichment_settings() -> dict:
+    """Return `settings.DRUG_INFO_ENRICHMENT` merged over the defaults."""
+    return {
+        "ENABLED": False,
+        "REFRESH_AFTER": 86400,
+        "MAX_ATTEMPTS": 5,
+        "RETRY_BACKOFF": 60,
+        "BATCH_SIZE": 20,
+        "LOCK_TIMEOUT": 300,
+        **getattr(settings, "DRUG_INFO_ENRICHMENT", {}),
+    }
+
+
+def is_stale(enrichment, now=None) -> bool:
+    """Return True if `enrichment` is older than `REFRESH_AFTER` seconds."""
+    now = now or timezone.now()
+    return enrichment.fetched_at < now - timedelta(seconds=enrichment_settings()["REFRESH_AFTER"])
+
+
+def enqueue(medication_ids, run_after=None, retry_failed=False) -> int:
+    """
+    Queue a refresh for each medication that has no pending job yet.
+
+    A medication whose latest job failed less than `REFRESH_AFTER`
+    seconds ago is skipped too, so readers of a drug OpenFDA keeps
+    rejecting do not queue a doomed job on every request.
+
+    Args:
+        medication_ids (Iterable[int]): Medications to refresh.
+        run_after (datetime | None): Earliest run time (default: now).
+        retry_failed (bool): Queue recently failed medications as well
+            (e.g. after a rename).
+
+    Returns:
+        int: Number of jobs created.
+    """
+    medication_ids = set(medication_ids)
+    if not medication_ids:
+        return 0
+    skip = Q(status=EnrichmentJob.PENDING)
+    if not retry_failed:
+        cutoff = timezone.now() - timedelta(seconds=enrichment_settings()["REFRESH_AFTER"])
+        latest = EnrichmentJob.objects.filter(medication_id=OuterRef("medication_id")).order_by("-id").values("id")[:1]
+        skip |= Q(status=EnrichmentJob.FAILED, locked_at__gte=cutoff, id=Subquery(latest))
+    queued = set(
+        EnrichmentJob.objects.filter(skip, medication_id__in=medication_ids).values_list("medication_id", flat=True)
+    )
+    jobs = [
+        EnrichmentJob(medication_id=med_id, run_after=run_after or timezone.now())
+        for med_id in sorted(medication_ids - queued)
+    ]
+    # Concurrent enqueues may race past the check above; the partial
+    # unique constraint turns the loser into a no-op.
+    created = 0
+    for job in jobs:
+        try:
+            with transaction.atomic():
+                job.save()
+            created += 1
+        except IntegrityError:
+            pass
+    return created
+
+
+def enqueue_stale(now=None) -> int:
+    """Queue refreshes for medications with missing or stale enrichment data."""
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=enrichment_settings()["REFRESH_AFTER"])
+    ids = Medication.objects.filter(
+        Q(drug_info__isnull=True) | Q(drug_info__fetched_at__lt=cutoff)
+    ).values_list("id", flat=True)
+    return enqueue(ids)
+
+
+def claim_jobs(limit, now=None) -> list:
+    """
+    Claim up to `limit` due jobs for this worker.
+
+    Due pending jobs (and running jobs whose lock is older than
+    `LOCK_TIMEOUT`, left behind by a crashed worker) are locked with
+    `SELECT ... FOR UPDATE SKIP LOCKED` where supported, then marked
+    running with a conditional UPDATE so that two workers never run
+    the same job.
+
+    Returns:
+        list[EnrichmentJob]: The claimed jobs.
+    """
+    now = now or timezone.now()
+    lock_cutoff = now - timedelta(seconds=enrichment_settings()["LOCK_TIMEOUT"])
+    due = (
+        Q(status=EnrichmentJob.PENDING, run_after__lte=now)
+        | Q(status=EnrichmentJob.RUNNING, locked_at__lt=lock_cutoff)
+    )
+    claimed = []
+    with transaction.atomic():
+        candidates = (
+            EnrichmentJob.objects.select_for_update(skip_locked=True)
+            .filter(due).order_by("run_after", "id")[:limit]
+        )
+        for job in candidates:
+            updated = EnrichmentJob.objects.filter(pk=job.pk, status=job.status, locked_at=job.locked_at).update(
+                status=EnrichmentJob.RUNNING, locked_at=now, attempts=job.attempts + 1
+            )
+            if updated:
+                job.status, job.locked_at, job.attempts = EnrichmentJob.RUNNING, now, job.attempts + 1
+                claimed.append(job)
+    return claimed
+
+
+def run_job(job, now=None):
+    """
+    Fetch OpenFDA data for the job's medication and store it.
+
+    A "no results" answer (`DrugNotFoundError`, including an OpenFDA
+    404) is stored as an error entry so it is not fetched again before
+    `REFRESH_AFTER`. Other failures are retried with exponential
+    backoff until `MAX_ATTEMPTS` is reached.
+    """
+    config = enrichment_settings()
+    medication = Medication.objects.filter(pk=job.medication_id).only("id", "name").first()
+    if medication is None:
+        job.delete()
+        return
+    try:
+        data, error = DrugInfoService.get_drug_info(medication.name), ""
+    except DrugNotFoundError as exc:
+        data, error = {}, str(exc)
+    except Exception as exc:
+        _retry_or_fail(job, str(exc), config)
+        return
+
+    DrugInfoEnrichment.objects.update_or_create(
+        medication_id=medication.id,
+        defaults={"name": medication.name, "data": data, "error": error, "fetched_at": now or timezone.now()},
+    )
+    EnrichmentJob.objects.filter(pk=job.pk).update(status=EnrichmentJob.DONE, last_error=error)
+
+
+def _retry_or_fail(job, error, config):
+    logger.warning("Enrichment of medication %s failed (attempt %s): %s", job.medication_id, job.attempts, error)
+    if job.attempts >= config["MAX_ATTEMPTS"]:
+        EnrichmentJob.objects.filter(pk=job.pk).update(status=EnrichmentJob.FAILED, last_error=error)
+        return
+    delay = config["RETRY_BACKOFF"] * (2 ** (job.attempts - 1))
+    try:
+        with transaction.atomic():
+            EnrichmentJob.objects.filter(pk=job.pk).update(
+                status=EnrichmentJob.PENDING, run_after=timezone.now() + timedelta(seconds=delay), last_error=error
+            )
+    except IntegrityError:
+        # A fresh job was queued for this medication meanwhile; let it run instead.
+        EnrichmentJob.objects.filter(pk=job.pk).update(status=EnrichmentJob.FAILED, last_error=error)
+
+
+def prune_jobs(now=None) -> int:
+    """
+    Delete finished jobs.
+
+    Done jobs are dropped at once; failed ones once `REFRESH_AFTER`
+    has passed, when `enqueue` no longer consults them.
+
+    Returns:
+        int: Number of jobs deleted.
+    """
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=enrichment_settings()["REFRESH_AFTER"])
+    finished = Q(status=EnrichmentJob.DONE) | Q(status=EnrichmentJob.FAILED, locked_at__lt=cutoff)
+    return EnrichmentJob.objects.filter(finished).delete()[0]
+
+
+def run_pending(limit=None) -> int:
+    """
+    Claim and run one batch of due jobs.
+
+    Returns:
+        int: Number of jobs processed.
+    """
+    jobs = claim_jobs(limit or enrichment_settings()["BATCH_SIZE"])
+    for job in jobs:
+        run_job(job)
+    return len(jobs)
+
+
+def _close_old_connections():
+    """
+    Drop broken or expired (CONN_MAX_AGE) connections between polls.
+
+    A long-running worker never passes through the request signals
+    that do this for views; connections inside a transaction are left
+    alone.
+    """
+    for conn in connections.all(initialized_only=True):
+        if not conn.in_atomic_block:
+            conn.close_if_unusable_or_obsolete()
+
+
+def run_worker(batch_size=None, poll_interval=5.0, schedule_interval=3600.0, once=False,
+               clock=time.monotonic, sleep=time.sleep):
+    """
+    Process jobs until interrupted.
+
+    Every `schedule_interval` seconds finished jobs are pruned and stale
+    medications are queued for refresh. When no jobs are due the worker sleeps `poll_interval`
+    seconds. With `once`, a single schedule pass and drain is run.
+    """
+    next_schedule = clock()
+    while True:
+        _close_old_connections()
+        if clock() >= next_schedule:
+            prune_jobs()
+            enqueue_stale()
+            next_schedule = clock() + schedule_interval
+        while run_pending(batch_size):
+            pass
+        if once:
+            return
+        sleep(poll_interval)
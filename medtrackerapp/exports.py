@@ -0,0 +1,107 @@
+import csv
+
+from django.utils import timezone
+
+from . import jsonlib
+from .archive import CombinedDoseLogs
+from .models import day_range
+
+EXPORT_FIELDS = ["id", "medication", "taken_at", "was_taken"]
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object whose `write` returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def format_datetime(value, tz=None):
+    """
+    Format a datetime exactly like DRF's `DateTimeField` does by default.
+
+    Pass `tz` (the current timezone) when formatting many values to
+    avoid looking it up for each one.
+    """
+    value = timezone.localtime(value, tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def export_queryset(start=None, end=None, medication=None):
+    """
+    Return the dose logs selected for export.
+
+    Args:
+        start (date | None): First day to include.
+        end (date | None): Last day to include.
+        medication (int | None): Restrict to one medication id.
+
+    Returns:
+        CombinedDoseLogs: Matching live and archived rows as (id,
+            medication_id, taken_at, was_taken) tuples, in the same
+            order as `/logs/`.
+    """
+    logs = CombinedDoseLogs()
+    if start:
+        logs = logs.filter(taken_at__gte=day_range(start, start)[0])
+    if end:
+        logs = logs.filter(taken_at__lt=day_range(end, end)[1])
+    if medication is not None:
+        logs = logs.filter(medication_id=medication)
+    return logs.order_by("-taken_at", "id").values_list(
+        "id", "medication_id", "taken_at", "was_taken"
+    )
+
+
+def iter_export(queryset, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Stream dose-log rows as CSV or NDJSON text.
+
+    Rows are read through a server-side cursor (`iterator`) and
+    emitted one chunk at a time, so memory use does not depend on
+    the number of rows. The CSV header is yielded before the query
+    runs, so the first byte is available immediately.
+
+    Args:
+        queryset (QuerySet): Tuples as returned by `export_queryset`.
+        export_format (str): Either "csv" or "ndjson".
+        chunk_size (int): Rows fetched and emitted per chunk.
+
+    Yields:
+        str: Consecutive pieces of the export.
+
+    Raises:
+        ValueError: If `export_format` is not supported.
+    """
+    tz = timezone.get_current_timezone()
+    if export_format == "csv":
+        writer = csv.writer(_Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+
+        def encode(row):
+            return writer.writerow((row[0], row[1], format_datetime(row[2], tz), row[3]))
+
+        join = "".join
+    elif export_format == "ndjson":
+        # Lines are encoded to bytes and each chunk is decoded once.
+        def encode(row):
+            return jsonlib.dumps(
+                dict(zip(EXPORT_FIELDS, (row[0], row[1], format_datetime(row[2], tz), row[3])))
+            ) + b"\n"
+
+        def join(lines):
+            return b"".join(lines).decode()
+    else:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    chunk = []
+    for row in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(encode(row))
+        if len(chunk) >= chunk_size:
+            yield join(chunk)
+            chunk = []
+    if chunk:
+        yield join(chunk)
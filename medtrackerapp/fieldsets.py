@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
+
+from .models import DoseLog, DoctorsNote
+from .serializers import DoseLogSerializer, DoctorsNoteSerializer
+
+# Expansion name -> (related accessor, model, ordering, serializer, settings key).
+EXPANSIONS = {
+    "logs": ("doselog_set", DoseLog, ("-taken_at", "-id"), DoseLogSerializer, "LOGS_LIMIT"),
+    "notes": ("doctors_notes", DoctorsNote, ("-created_at", "-id"), DoctorsNoteSerializer, "NOTES_LIMIT"),
+}
+
+
+def expand_settings() -> dict:
+    """Return `settings.MEDICATION_EXPAND` merged over the defaults."""
+    return {"LOGS_LIMIT": 20, "NOTES_LIMIT": 20, **getattr(settings, "MEDICATION_EXPAND", {})}
+
+
+def parse_list_param(value, allowed, name):
+    """
+    Parse a comma-separated query parameter such as `?fields=` or `?expand=`.
+
+    Args:
+        value (str | None): Raw parameter value.
+        allowed (Iterable[str]): Accepted names.
+        name (str): Parameter name, for the error message.
+
+    Returns:
+        list[str] | None: Requested names in request order without
+            duplicates, or None when the parameter is absent or empty.
+
+    Raises:
+        ValueError: If a name is not in `allowed`.
+    """
+    names = list(dict.fromkeys(part.strip() for part in (value or "").split(",") if part.strip()))
+    if not names:
+        return None
+    unknown = [part for part in names if part not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown {name}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}.")
+    return names
+
+
+def expand_medications(medications, representations, expand):
+    """
+    Add the requested related collections to medication representations.
+
+    Each expansion is fetched for all `medications` with one
+    `prefetch_related` query whose `Prefetch` queryset is sliced to the
+    configured limit, so the query count does not grow with the number
+    of medications or related rows.
+
+    Args:
+        medications (list[Medication]): The serialized instances.
+        representations (list[dict]): Their representations, same order;
+            updated in place.
+        expand (Iterable[str]): Keys of `EXPANSIONS`.
+    """
+    limits = expand_settings()
+    lookups = []
+    for name in expand:
+        accessor, model, ordering, _, limit = EXPANSIONS[name]
+        queryset = model.objects.order_by(*ordering)[:limits[limit]]
+        lookups.append(Prefetch(accessor, queryset=queryset, to_attr=f"expanded_{name}"))
+    prefetch_related_objects(medications, *lookups)
+
+    for medication, data in zip(medications, representations):
+        for name in expand:
+            serializer = EXPANSIONS[name][3]
+            data[name] = serializer(getattr(medication, f"expanded_{name}"), many=True).data
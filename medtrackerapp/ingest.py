@@ -0,0 +1,66 @@
+from rest_framework.exceptions import ValidationError
+
+from .models import DoseLog, Medication
+from .serializers import DoseLogBulkRowSerializer
+from .signals import dose_logs_bulk_created
+
+
+def validate_dose_log_rows(rows):
+    """
+    Validate raw bulk-upload rows and build unsaved DoseLog objects.
+
+    Field validation reuses one `DoseLogBulkRowSerializer` for every
+    row, and all referenced medications are checked with one query.
+
+    Args:
+        rows (list): Row dicts with `medication`, `taken_at` and
+            optionally `was_taken`.
+
+    Returns:
+        tuple[list[DoseLog], list[dict]]: The unsaved logs and a list
+            of {"index": i, "errors": {...}} entries for invalid rows.
+    """
+    serializer = DoseLogBulkRowSerializer()
+    validated, errors = [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({"index": index, "errors": {"non_field_errors": ["Expected an object."]}})
+            continue
+        try:
+            validated.append((index, serializer.run_validation(row)))
+        except ValidationError as exc:
+            errors.append({"index": index, "errors": exc.detail})
+
+    medication_ids = {data["medication"] for _, data in validated}
+    known = set(Medication.objects.filter(id__in=medication_ids).values_list("id", flat=True))
+
+    logs = []
+    for index, data in validated:
+        if data["medication"] not in known:
+            errors.append({"index": index, "errors": {
+                "medication": [f'Invalid pk "{data["medication"]}" - object does not exist.']
+            }})
+            continue
+        logs.append(DoseLog(
+            medication_id=data["medication"],
+            taken_at=data["taken_at"],
+            was_taken=data["was_taken"],
+        ))
+    errors.sort(key=lambda error: error["index"])
+    return logs, errors
+
+
+def insert_dose_logs(logs, chunk_size):
+    """
+    Insert dose logs with `bulk_create` in chunks of `chunk_size`.
+
+    Callers are expected to wrap this in a transaction. Because
+    `bulk_create` skips `post_save`, `dose_logs_bulk_created` is sent
+    with the saved objects so that derived data can be kept in sync.
+
+    Returns:
+        list[DoseLog]: The saved logs.
+    """
+    created = DoseLog.objects.bulk_create(logs, batch_size=chunk_size)
+    dose_logs_bulk_created.send(sender=DoseLog, logs=created)
+    return created
@@ -0,0 +1,228 @@
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_current = contextvars.ContextVar("medtracker_request_timings", default=None)
+
+
+class RequestTimings:
+    """
+    Per-request counters filled in while a sampled request runs.
+
+    Instances are shared with worker threads that copy the request's
+    context (see `DrugInfoCache.get_many`), so updates take a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.drug_info_seconds = 0.0
+
+    def add(self, field, seconds, queries=0):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + seconds)
+            self.db_queries += queries
+
+
+def perf_settings() -> dict:
+    """Return `settings.PERF_METRICS` merged over the defaults."""
+    return {"ENABLED": True, "SAMPLE_RATE": 1.0, "SERVER_TIMING": True, **getattr(settings, "PERF_METRICS", {})}
+
+
+def start_request():
+    """Start collecting timings for the current context; returns a token for `end_request`."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+@contextmanager
+def timed(field):
+    """
+    Add the time spent in the block to the current request's `field`.
+
+    A no-op (beyond two clock reads) outside of a sampled request.
+
+    Example:
+        with timed("drug_info_seconds"):
+            resp = session.get(url)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.add(field, time.perf_counter() - started)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper counting queries and their time.
+
+    Installed on every connection by `install_query_recorder`; queries
+    outside of a sampled request are passed straight through.
+    """
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add("db_seconds", time.perf_counter() - started, queries=1)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """`connection_created` receiver adding `record_query` to the connection's execute wrappers."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def count_connection(sender, connection, **kwargs):
+    """`connection_created` receiver counting connections per alias, to verify reuse and pooling."""
+    metrics_registry.connection_opened(connection.alias)
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram keyed by label values."""
+
+    def __init__(self, name, documentation, buckets, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.labelnames = labelnames
+        self._series = {}
+
+    def observe(self, labels, value):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def clear(self):
+        self._series.clear()
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            label_text = ",".join(f'{key}="{_escape(value)}"' for key, value in zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide request metrics, exported in Prometheus text format.
+
+    Each worker process keeps its own registry; scrape every process
+    (or aggregate upstream) when running several.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        labels = ("view", "method")
+        self.histograms = {
+            "wall": Histogram(
+                "medtracker_request_duration_seconds", "Wall time per request.", DURATION_BUCKETS, labels
+            ),
+            "db_seconds": Histogram(
+                "medtracker_db_duration_seconds", "Total database time per request.", DURATION_BUCKETS, labels
+            ),
+            "db_queries": Histogram(
+                "medtracker_db_queries", "Database queries per request.", QUERY_COUNT_BUCKETS, labels
+            ),
+            "serialize_seconds": Histogram(
+                "medtracker_serialization_duration_seconds", "Serialization and rendering time per request.",
+                DURATION_BUCKETS, labels,
+            ),
+            "drug_info_seconds": Histogram(
+                "medtracker_drug_info_duration_seconds", "Outbound OpenFDA time per request.",
+                DURATION_BUCKETS, labels,
+            ),
+        }
+        self._requests = {}
+        self._connections = {}
+
+    def observe(self, view, method, status, wall, timings):
+        """Record one finished request."""
+        labels = (view, method)
+        with self._lock:
+            self.histograms["wall"].observe(labels, wall)
+            self.histograms["db_seconds"].observe(labels, timings.db_seconds)
+            self.histograms["db_queries"].observe(labels, timings.db_queries)
+            self.histograms["serialize_seconds"].observe(labels, timings.serialize_seconds)
+            self.histograms["drug_info_seconds"].observe(labels, timings.drug_info_seconds)
+            key = (view, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def connection_opened(self, alias):
+        """Count one database connection set up (or taken from the pool) for `alias`."""
+        with self._lock:
+            self._connections[alias] = self._connections.get(alias, 0) + 1
+
+    def connection_counts(self) -> dict:
+        """Return connections opened so far per database alias."""
+        with self._lock:
+            return dict(self._connections)
+
+    def expose(self) -> str:
+        """Return every metric in Prometheus text exposition format."""
+        with self._lock:
+            lines = ["# HELP medtracker_requests_total Sampled requests.", "# TYPE medtracker_requests_total counter"]
+            for (view, method, status), count in sorted(self._requests.items()):
+                lines.append(
+                    f'medtracker_requests_total{{view="{_escape(view)}",method="{method}",status="{status}"}} {count}'
+                )
+            for histogram in self.histograms.values():
+                lines.extend(histogram.expose())
+            lines.extend([
+                "# HELP medtracker_db_connections_total Database connections opened or checked out of the pool.",
+                "# TYPE medtracker_db_connections_total counter",
+            ])
+            for alias, count in sorted(self._connections.items()):
+                lines.append(f'medtracker_db_connections_total{{alias="{_escape(alias)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Drop every recorded observation."""
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.clear()
+            self._requests.clear()
+            self._connections.clear()
+
+
+def server_timing(wall, timings) -> str:
+    """Format timings as a `Server-Timing` header value (durations in ms)."""
+    return ", ".join([
+        f"app;dur={wall * 1000:.2f}",
+        f'db;dur={timings.db_seconds * 1000:.2f};desc="{timings.db_queries} queries"',
+        f"serialize;dur={timings.serialize_seconds * 1000:.2f}",
+        f"drug-info;dur={timings.drug_info_seconds * 1000:.2f}",
+    ])
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,51 @@
+import json
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+_encoder = JSONEncoder()
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def orjson_enabled() -> bool:
+    """Return True when `settings.JSON_BACKEND` selects orjson and it is installed."""
+    return orjson is not None and getattr(settings, "JSON_BACKEND", "orjson") == "orjson"
+
+
+def dumps(data) -> bytes:
+    """
+    Encode `data` as compact UTF-8 JSON, matching DRF's `JSONRenderer`.
+
+    Types JSON cannot represent natively (datetimes, decimals, ...) go
+    through DRF's `JSONEncoder.default`, and U+2028/U+2029 are escaped,
+    so orjson and the stdlib fallback produce the same bytes.
+
+    Raises:
+        TypeError: If `data` contains a value neither backend can encode.
+    """
+    if orjson_enabled():
+        body = orjson.dumps(data, default=_encoder.default, option=_ORJSON_OPTIONS)
+        return body.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    body = json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return body.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+def loads(data):
+    """
+    Decode JSON from `bytes` or `str`.
+
+    Raises:
+        ValueError: If `data` is not valid JSON (NaN/Infinity included).
+    """
+    if orjson_enabled():
+        return orjson.loads(data)
+    return json.loads(data, parse_constant=_reject_constant)
+
+
+def _reject_constant(value):
+    raise ValueError(f"Invalid JSON constant: {value}")
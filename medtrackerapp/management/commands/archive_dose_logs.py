@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from medtrackerapp.archive import archive_cutoff, archive_dose_logs
+from medtrackerapp.models import DoseLog, day_range
+
+
+class Command(BaseCommand):
+    """
+    Move dose logs older than the archive horizon into DoseLogArchive.
+
+    Meant to run on a schedule (e.g. nightly); each run rolls the
+    boundary forward to `now - HORIZON_DAYS`.
+
+    Example:
+        python manage.py archive_dose_logs --horizon-days 365 --batch-size 5000
+    """
+    help = "Archive dose logs older than the configured horizon."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--horizon-days", type=int, help="Keep this many days live (default: settings).")
+        parser.add_argument("--before", help="Archive logs before this day (YYYY-MM-DD) instead.")
+        parser.add_argument("--batch-size", type=int, help="Rows moved per transaction (default: settings).")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many logs would move.")
+
+    def handle(self, *args, **options):
+        if options["before"]:
+            try:
+                day = parse_date(options["before"])
+            except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+                day = None
+            if not day:
+                raise CommandError("--before must be a valid date (YYYY-MM-DD).")
+            cutoff = day_range(day, day)[0]
+        else:
+            if options["horizon_days"] is not None and options["horizon_days"] < 0:
+                raise CommandError("--horizon-days must not be negative.")
+            cutoff = archive_cutoff(options["horizon_days"])
+
+        if options["dry_run"]:
+            count = DoseLog.objects.filter(taken_at__lt=cutoff).count()
+            self.stdout.write(f"{count} dose logs before {cutoff.isoformat()} would be archived.")
+            return
+        moved = archive_dose_logs(cutoff, options["batch_size"])
+        self.stdout.write(f"Archived {moved} dose logs before {cutoff.isoformat()}.")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from medtrackerapp.enrichment import enqueue_stale, run_worker
+
+
+class Command(BaseCommand):
+    """
+    Run the OpenFDA enrichment worker.
+
+    Processes queued `EnrichmentJob` rows and periodically queues
+    medications whose stored drug info is missing or stale. Several
+    workers can run side by side; jobs are claimed with row locks.
+
+    Example:
+        python manage.py enrichment_worker --poll-interval 5 --schedule-interval 3600
+    """
+    help = "Fetch and refresh stored OpenFDA drug info in the background."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Queue stale medications, drain the queue and exit.")
+        parser.add_argument("--batch-size", type=int, help="Jobs claimed per batch (default: settings).")
+        parser.add_argument("--poll-interval", type=float, default=5.0, help="Seconds to sleep when idle.")
+        parser.add_argument(
+            "--schedule-interval", type=float, default=3600.0, help="Seconds between stale-data sweeps."
+        )
+        parser.add_argument("--enqueue-stale", action="store_true", help="Only queue stale medications and exit.")
+
+    def handle(self, *args, **options):
+        if options["enqueue_stale"]:
+            self.stdout.write(f"Queued {enqueue_stale()} enrichment jobs.")
+            return
+        try:
+            run_worker(
+                batch_size=options["batch_size"],
+                poll_interval=options["poll_interval"],
+                schedule_interval=options["schedule_interval"],
+                once=options["once"],
+            )
+        except KeyboardInterrupt:
+            self.stdout.write("Enrichment worker stopped.")
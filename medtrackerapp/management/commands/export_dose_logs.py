@@ -0,0 +1,48 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from medtrackerapp.exports import EXPORT_CHUNK_SIZE, export_queryset, iter_export
+
+
+class Command(BaseCommand):
+    """
+    Export dose logs to a CSV or NDJSON file.
+
+    Uses the same streaming export as `/logs/export/`, so memory use
+    stays flat however many rows are written.
+
+    Example:
+        python manage.py export_dose_logs --format ndjson --start 2025-11-01 -o logs.ndjson
+    """
+    help = "Stream dose logs to a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+        parser.add_argument("--start", help="First day to include (YYYY-MM-DD).")
+        parser.add_argument("--end", help="Last day to include (YYYY-MM-DD).")
+        parser.add_argument("--medication", type=int, help="Only export this medication id.")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+        parser.add_argument("-o", "--output", default="-", help="Output path, or '-' for stdout.")
+
+    def handle(self, *args, **options):
+        filters = {"medication": options["medication"]}
+        for param in ["start", "end"]:
+            if options[param]:
+                try:
+                    filters[param] = parse_date(options[param])
+                except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+                    filters[param] = None
+                if not filters[param]:
+                    raise CommandError(f"--{param} must be a valid date (YYYY-MM-DD).")
+
+        chunks = iter_export(export_queryset(**filters), options["format"], options["chunk_size"])
+        if options["output"] == "-":
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+
+        with open(options["output"], "w", newline="", encoding="utf-8") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from medtrackerapp.druglabels import ingest_labels
+
+
+class Command(BaseCommand):
+    """
+    Load OpenFDA bulk drug-label downloads into the local mirror.
+
+    Accepts the `drug-label-*.json.zip` files from
+    https://open.fda.gov/data/downloads/ (or unpacked `.json` /
+    `.json.gz` files, or directories of them). Files are streamed, so
+    memory stays bounded whatever their size; re-running with newer
+    files updates labels in place.
+
+    Example:
+        python manage.py ingest_drug_labels /data/openfda/drug-label-0001-of-0013.json.zip
+        python manage.py ingest_drug_labels /data/openfda/ --replace
+    """
+    help = "Ingest OpenFDA drug-label dumps into the local DrugLabel mirror."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Dump files or directories.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows written per batch.")
+        parser.add_argument("--replace", action="store_true", help="Remove mirrored labels that are not in these dumps.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        try:
+            counts = ingest_labels(options["paths"], options["batch_size"], options["replace"])
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not ingest drug labels: {exc}") from exc
+        self.stdout.write(
+            f"Read {counts['records']} labels, wrote {counts['rows']} rows, skipped {counts['skipped']}."
+        )
+        if options["replace"]:
+            self.stdout.write(f"Removed {counts['deleted']} labels missing from these dumps.")
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from medtrackerapp.rollups import rebuild_daily_adherence
+
+
+class Command(BaseCommand):
+    """
+    Recompute the DailyAdherence rollup from raw dose logs.
+
+    Example:
+        python manage.py rebuild_daily_adherence --start 2025-01-01 --end 2025-12-31
+    """
+    help = "Rebuild the DailyAdherence rollup for a date range."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="First day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--end", help="Last day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--medication", type=int, help="Only rebuild this medication id.")
+
+    def handle(self, *args, **options):
+        dates = {}
+        for param in ["start", "end"]:
+            if options[param]:
+                try:
+                    dates[param] = parse_date(options[param])
+                except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+                    dates[param] = None
+                if not dates[param]:
+                    raise CommandError(f"--{param} must be a valid date (YYYY-MM-DD).")
+
+        written = rebuild_daily_adherence(medication=options["medication"], **dates)
+        self.stdout.write(f"Rebuilt {written} daily adherence rows.")
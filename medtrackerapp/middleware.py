@@ -0,0 +1,129 @@
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from .instrumentation import end_request, metrics_registry, perf_settings, server_timing, start_request
+from .routers import replica_settings, routing_scope
+
+
+class PerformanceMiddleware:
+    """
+    Records per-request wall, database, serialization and OpenFDA time.
+
+    Sampled requests get a `Server-Timing` header and are added to the
+    histograms served by the metrics endpoint. Configure with
+    `settings.PERF_METRICS`:
+
+        - ENABLED: Turn instrumentation off entirely.
+        - SAMPLE_RATE: Fraction of requests (0.0-1.0) to instrument.
+        - SERVER_TIMING: Whether to add the `Server-Timing` header.
+
+    Unsampled requests pay only the sampling decision. Works for both
+    sync and async views; database time is collected by the execute
+    wrapper installed on each connection (`install_query_recorder`).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        config = perf_settings()
+        if not self._sampled(config):
+            return self.get_response(request)
+        timings, token = start_request()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        self._finish(request, response, timings, time.perf_counter() - started, config)
+        return response
+
+    async def __acall__(self, request):
+        config = perf_settings()
+        if not self._sampled(config):
+            return await self.get_response(request)
+        timings, token = start_request()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        self._finish(request, response, timings, time.perf_counter() - started, config)
+        return response
+
+    @staticmethod
+    def _sampled(config):
+        if not config["ENABLED"]:
+            return False
+        rate = config["SAMPLE_RATE"]
+        return rate >= 1 or random.random() < rate
+
+    @staticmethod
+    def _finish(request, response, timings, wall, config):
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name or match.route) if match else "unresolved"
+        metrics_registry.observe(view, request.method, response.status_code, wall, timings)
+        if config["SERVER_TIMING"]:
+            response["Server-Timing"] = server_timing(wall, timings)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Lets safe requests read from database replicas.
+
+    GET / HEAD / OPTIONS requests run in a routing scope that sends
+    reads to `settings.DATABASE_REPLICAS["ALIASES"]` (see
+    `PrimaryReplicaRouter`). Other methods use the primary only. A
+    request that writes gets a short-lived cookie
+    (`COOKIE_NAME`, `STICKY_SECONDS`), and requests carrying it read
+    from the primary, so clients see their own writes despite
+    replication lag.
+    """
+    sync_capable = True
+    async_capable = True
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        config = replica_settings()
+        with routing_scope(self._replica_reads(request, config)) as state:
+            response = self.get_response(request)
+        return self._finish(response, state, config)
+
+    async def __acall__(self, request):
+        config = replica_settings()
+        with routing_scope(self._replica_reads(request, config)) as state:
+            response = await self.get_response(request)
+        return self._finish(response, state, config)
+
+    def _replica_reads(self, request, config):
+        return (
+            bool(config["ALIASES"])
+            and request.method in self.SAFE_METHODS
+            and config["COOKIE_NAME"] not in request.COOKIES
+        )
+
+    @staticmethod
+    def _finish(response, state, config):
+        if state.wrote and config["ALIASES"]:
+            response.set_cookie(
+                config["COOKIE_NAME"], "1", max_age=config["STICKY_SECONDS"], httponly=True, samesite="Lax"
+            )
+        return response
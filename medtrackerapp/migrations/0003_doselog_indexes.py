@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0002_doctorsnote'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='doselog',
+            index=models.Index(fields=['medication', 'taken_at'], name='doselog_med_taken_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doselog',
+            index=models.Index(condition=models.Q(('was_taken', True)), fields=['medication', 'taken_at'], name='doselog_med_taken_true_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doselog',
+            index=models.Index(fields=['-taken_at', 'id'], name='doselog_taken_at_id_idx'),
+        ),
+    ]
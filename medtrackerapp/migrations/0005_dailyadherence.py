@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def populate_daily_adherence(apps, schema_editor):
+    DoseLog = apps.get_model("medtrackerapp", "DoseLog")
+    DailyAdherence = apps.get_model("medtrackerapp", "DailyAdherence")
+    counts = (
+        DoseLog.objects.order_by()
+        .annotate(day=TruncDate("taken_at", tzinfo=timezone.get_current_timezone()))
+        .values("medication_id", "day")
+        .annotate(
+            taken=models.Count("id", filter=models.Q(was_taken=True)),
+            missed=models.Count("id", filter=models.Q(was_taken=False)),
+        )
+    )
+    DailyAdherence.objects.bulk_create(
+        [
+            DailyAdherence(
+                medication_id=row["medication_id"], day=row["day"],
+                taken_count=row["taken"], missed_count=row["missed"],
+            )
+            for row in counts.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0004_bulkingestkey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyAdherence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('taken_count', models.PositiveIntegerField(default=0)),
+                ('missed_count', models.PositiveIntegerField(default=0)),
+                ('medication', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_adherence', to='medtrackerapp.medication')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('medication', 'day'), name='daily_adherence_med_day_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_daily_adherence, migrations.RunPython.noop),
+    ]
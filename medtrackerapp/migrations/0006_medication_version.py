@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0005_dailyadherence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medication',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='medication',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Bumped on every change to the medication or its dose logs'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:23
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0006_medication_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DrugInfoEnrichment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Medication name the data was fetched for', max_length=100)),
+                ('data', models.JSONField(default=dict)),
+                ('error', models.TextField(blank=True, default='')),
+                ('fetched_at', models.DateTimeField()),
+                ('medication', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='drug_info', to='medtrackerapp.medication')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EnrichmentJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('medication', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrichment_jobs', to='medtrackerapp.medication')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'run_after'], name='enrichjob_status_run_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('medication',), name='enrichjob_one_pending_per_med')],
+            },
+        ),
+    ]
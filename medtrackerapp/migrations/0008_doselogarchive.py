@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0007_druginfoenrichment_enrichmentjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DoseLogArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('taken_at', models.DateTimeField()),
+                ('was_taken', models.BooleanField()),
+                ('medication', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_dose_logs', to='medtrackerapp.medication')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['medication', 'taken_at'], name='doselogarch_med_taken_at_idx'), models.Index(fields=['-taken_at', 'id'], name='doselogarch_taken_at_id_idx')],
+            },
+        ),
+    ]
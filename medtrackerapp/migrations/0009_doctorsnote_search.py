@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# Postgres: a generated tsvector column with a GIN index; the database
+# recomputes it whenever a note's content is written.
+POSTGRES_FORWARD = [
+    "ALTER TABLE medtrackerapp_doctorsnote ADD COLUMN search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('english', coalesce(content, ''))) STORED",
+    "CREATE INDEX doctorsnote_search_idx ON medtrackerapp_doctorsnote USING GIN (search_vector)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS doctorsnote_search_idx",
+    "ALTER TABLE medtrackerapp_doctorsnote DROP COLUMN IF EXISTS search_vector",
+]
+
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE medtrackerapp_doctorsnote_fts USING fts5("
+    "content, content='medtrackerapp_doctorsnote', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER medtrackerapp_doctorsnote_fts_ai AFTER INSERT ON medtrackerapp_doctorsnote BEGIN "
+    "INSERT INTO medtrackerapp_doctorsnote_fts(rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER medtrackerapp_doctorsnote_fts_ad AFTER DELETE ON medtrackerapp_doctorsnote BEGIN "
+    "INSERT INTO medtrackerapp_doctorsnote_fts(medtrackerapp_doctorsnote_fts, rowid, content) "
+    "VALUES ('delete', old.id, old.content); END",
+    "CREATE TRIGGER medtrackerapp_doctorsnote_fts_au AFTER UPDATE OF content ON medtrackerapp_doctorsnote BEGIN "
+    "INSERT INTO medtrackerapp_doctorsnote_fts(medtrackerapp_doctorsnote_fts, rowid, content) "
+    "VALUES ('delete', old.id, old.content); "
+    "INSERT INTO medtrackerapp_doctorsnote_fts(rowid, content) VALUES (new.id, new.content); END",
+    "INSERT INTO medtrackerapp_doctorsnote_fts(medtrackerapp_doctorsnote_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS medtrackerapp_doctorsnote_fts_ai",
+    "DROP TRIGGER IF EXISTS medtrackerapp_doctorsnote_fts_ad",
+    "DROP TRIGGER IF EXISTS medtrackerapp_doctorsnote_fts_au",
+    "DROP TABLE IF EXISTS medtrackerapp_doctorsnote_fts",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0008_doselogarchive'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            run_for_vendor({"postgresql": POSTGRES_BACKWARD, "sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medtrackerapp', '0009_doctorsnote_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DrugLabel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generic_name', models.CharField(help_text='Normalized (stripped, lower-case) lookup key', max_length=255)),
+                ('set_id', models.CharField(help_text='OpenFDA label set id', max_length=64)),
+                ('name', models.CharField(help_text='Generic name as printed on the label', max_length=255)),
+                ('manufacturer', models.CharField(max_length=255)),
+                ('warnings', models.JSONField(default=list)),
+                ('purpose', models.JSONField(default=list)),
+                ('effective_time', models.CharField(blank=True, default='', help_text='Label version date (YYYYMMDD)', max_length=8)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['generic_name', '-effective_time'], name='druglabel_name_effective_idx')],
+                'constraints': [models.UniqueConstraint(fields=('generic_name', 'set_id'), name='druglabel_name_set_uniq')],
+            },
+        ),
+    ]
@@ -1,7 +1,83 @@
 from django.db import models
-from datetime import date as _date
+from django.db.models.functions import Coalesce
+from datetime import date as _date, datetime, time, timedelta
 from django.utils import timezone
-from .services import DrugInfoService
+from .services import get_drug_info_cache
+
+
+def day_range(start_date: _date, end_date: _date):
+    """
+    Convert an inclusive date range into a half-open datetime range.
+
+    The bounds are midnight at the start of `start_date` and midnight
+    after `end_date` in the current timezone, so filtering with
+    `taken_at__gte` / `taken_at__lt` selects the same rows as
+    `taken_at__date__gte` / `taken_at__date__lte` while still letting
+    the database use an index on `taken_at`.
+
+    Returns:
+        tuple[datetime, datetime]: Aware (start, end) datetimes.
+    """
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    return start, end
+
+
+class MedicationQuerySet(models.QuerySet):
+    """Custom queryset helpers for Medication."""
+
+    def with_adherence_counts(self):
+        """
+        Annotate each medication with its taken and total dose counts.
+
+        Both counts are summed from the `DailyAdherence` rollup in a
+        single aggregate query so that listing medications does not
+        issue per-row adherence queries.
+
+        Returns:
+            QuerySet: Medications annotated with `taken_count` and `total_count`.
+        """
+        return self.annotate(
+            taken_count=Coalesce(models.Sum("daily_adherence__taken_count"), 0),
+            total_count=Coalesce(
+                models.Sum(models.F("daily_adherence__taken_count") + models.F("daily_adherence__missed_count")), 0
+            ),
+        )
+
+    def touch(self):
+        """
+        Mark the selected medications as changed.
+
+        Bumps `version` and `updated_at` with a single UPDATE; used when
+        related dose logs change, since those affect adherence.
+
+        Returns:
+            int: Number of medications updated.
+        """
+        return self.update(version=models.F("version") + 1, updated_at=timezone.now())
+
+    def version_token(self):
+        """
+        Return a cheap fingerprint of the current state of the selected medications.
+
+        Built from one aggregate query over count, max id, summed
+        `version` and latest `updated_at`; it changes whenever a
+        medication or any of its dose logs is created, updated or
+        deleted.
+
+        Returns:
+            tuple[str, datetime | None]: The token and the latest `updated_at`.
+        """
+        state = self.order_by().aggregate(
+            count=models.Count("id"),
+            max_id=models.Max("id"),
+            versions=models.Sum("version"),
+            updated_at=models.Max("updated_at"),
+        )
+        updated_at = state["updated_at"]
+        token = f"{state['count']}-{state['max_id']}-{state['versions']}-{updated_at.timestamp() if updated_at else 0}"
+        return token, updated_at
 
 
 class Medication(models.Model):
@@ -15,26 +91,54 @@ class Medication(models.Model):
     name = models.CharField(max_length=100)
     dosage_mg = models.PositiveIntegerField()
     prescribed_per_day = models.PositiveIntegerField(help_text="Expected number of doses per day")
+    version = models.PositiveIntegerField(default=0, editable=False, help_text="Bumped on every change to the medication or its dose logs")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = MedicationQuerySet.as_manager()
 
     def __str__(self):
         """Return a human-readable representation of the medication."""
         return f"{self.name} ({self.dosage_mg}mg)"
 
+    def save(self, *args, **kwargs):
+        """Save the medication, bumping `version` when an existing row changes."""
+        if self.pk is not None and not self._state.adding:
+            self.version += 1
+        super().save(*args, **kwargs)
+
     def adherence_rate(self):
         """
         Calculate the overall adherence rate for this medication.
 
         The adherence rate is the percentage of all recorded doses that
-        were marked as taken. Rounded to two decimals.
+        were marked as taken. Rounded to two decimals. Counts are read
+        from the `DailyAdherence` rollup rather than the raw logs.
 
         Returns:
             float: Adherence percentage between 0.0 and 100.0.
         """
-        logs = self.doselog_set.all()
-        if not logs.exists():
+        counts = self.daily_adherence.aggregate(
+            taken=Coalesce(models.Sum("taken_count"), 0),
+            total=Coalesce(models.Sum(models.F("taken_count") + models.F("missed_count")), 0),
+        )
+        return self.rate_from_counts(counts["taken"], counts["total"])
+
+    @staticmethod
+    def rate_from_counts(taken: int, total: int) -> float:
+        """
+        Convert taken/total dose counts into an adherence percentage.
+
+        Args:
+            taken (int): Number of doses marked as taken.
+            total (int): Number of recorded doses.
+
+        Returns:
+            float: Adherence percentage rounded to two decimals,
+                   or 0.0 if there are no recorded doses.
+        """
+        if not total:
             return 0.0
-        taken = logs.filter(was_taken=True).count()
-        return round((taken / logs.count()) * 100, 2)
+        return round((taken / total) * 100, 2)
 
     def expected_doses(self, days: int) -> int:
         """
@@ -59,7 +163,8 @@ class Medication(models.Model):
 
         The method counts doses taken (was_taken=True) between the given
         start and end dates and compares them to the expected number
-        based on the prescription schedule.
+        based on the prescription schedule. Taken doses are summed from
+        the `DailyAdherence` rollup, one row per day at most.
 
         Args:
             start_date (date): Start of the evaluation period.
@@ -75,17 +180,16 @@ class Medication(models.Model):
         if start_date > end_date:
             raise ValueError("start_date must be before or equal to end_date")
 
-        logs = self.doselog_set.filter(
-            taken_at__date__gte=start_date,
-            taken_at__date__lte=end_date
-        )
         days = (end_date - start_date).days + 1
         expected = self.expected_doses(days)
 
         if expected == 0:
             return 0.0
 
-        taken = logs.filter(was_taken=True).count()
+        taken = self.daily_adherence.filter(
+            day__gte=start_date,
+            day__lte=end_date
+        ).aggregate(taken=Coalesce(models.Sum("taken_count"), 0))["taken"]
         adherence = (taken / expected) * 100
         return round(adherence, 2)
 
@@ -95,13 +199,31 @@ class Medication(models.Model):
 
         Uses the `DrugInfoService` to query OpenFDA for details
         about this medication's active ingredient or related data.
+        Lookups go through the shared `DrugInfoCache`, so repeated
+        requests for the same drug name do not hit the network.
+
+        Returns:
+            dict: Drug information data, or {'error': message} if the
+                  request fails or the API is unavailable.
+        """
+        try:
+            return get_drug_info_cache().get(self.name)
+        except Exception as exc:
+            return {"error": str(exc)}
+
+    async def afetch_external_info(self):
+        """
+        Async variant of `fetch_external_info`.
+
+        Uses `AsyncDrugInfoService` so the lookup does not block the
+        event loop while waiting for OpenFDA.
 
         Returns:
             dict: Drug information data, or {'error': message} if the
                   request fails or the API is unavailable.
         """
         try:
-            return DrugInfoService.get_drug_info(self.name)
+            return await get_drug_info_cache().aget(self.name)
         except Exception as exc:
             return {"error": str(exc)}
 
@@ -121,6 +243,15 @@ class DoseLog(models.Model):
     class Meta:
         """Metadata options for the DoseLog model."""
         ordering = ["-taken_at"]
+        indexes = [
+            models.Index(fields=["medication", "taken_at"], name="doselog_med_taken_at_idx"),
+            models.Index(
+                fields=["medication", "taken_at"],
+                condition=models.Q(was_taken=True),
+                name="doselog_med_taken_true_idx",
+            ),
+            models.Index(fields=["-taken_at", "id"], name="doselog_taken_at_id_idx"),
+        ]
 
     def __str__(self):
         """Return a human-readable description of the dose event."""
@@ -128,6 +259,59 @@ class DoseLog(models.Model):
         when = timezone.localtime(self.taken_at).strftime("%Y-%m-%d %H:%M")
         return f"{self.medication.name} at {when} - {status}"
 
+
+class DoseLogArchive(models.Model):
+    """
+    Dose logs older than the archive horizon, moved out of `DoseLog`.
+
+    Rows keep their original id and are read-only. Keeping history
+    here keeps the live table and its indexes small for recent-data
+    queries; list, filter and export endpoints read both tables (see
+    `medtrackerapp.archive`). Archived logs stay counted in the
+    `DailyAdherence` rollup.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    medication = models.ForeignKey(Medication, on_delete=models.CASCADE, related_name="archived_dose_logs")
+    taken_at = models.DateTimeField()
+    was_taken = models.BooleanField()
+
+    class Meta:
+        """Metadata options for the DoseLogArchive model."""
+        indexes = [
+            models.Index(fields=["medication", "taken_at"], name="doselogarch_med_taken_at_idx"),
+            models.Index(fields=["-taken_at", "id"], name="doselogarch_taken_at_id_idx"),
+        ]
+
+    def __str__(self):
+        """Return the medication id and dose time."""
+        return f"Archived dose of {self.medication_id} at {self.taken_at:%Y-%m-%d %H:%M}"
+
+
+class DailyAdherence(models.Model):
+    """
+    Daily rollup of dose logs for one medication.
+
+    Holds the number of taken and missed doses logged for a medication
+    on a calendar day (in the current timezone). Rows are maintained
+    incrementally by the DoseLog signal handlers and by bulk ingestion,
+    and can be recomputed with the `rebuild_daily_adherence` command.
+    """
+    medication = models.ForeignKey(Medication, on_delete=models.CASCADE, related_name="daily_adherence")
+    day = models.DateField()
+    taken_count = models.PositiveIntegerField(default=0)
+    missed_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """Metadata options for the DailyAdherence model."""
+        constraints = [
+            models.UniqueConstraint(fields=["medication", "day"], name="daily_adherence_med_day_uniq"),
+        ]
+
+    def __str__(self):
+        """Return a summary of the day's counts."""
+        return f"{self.medication_id} on {self.day}: {self.taken_count} taken, {self.missed_count} missed"
+
+
 class DoctorsNote(models.Model):
     """
     Represents a doctor's note associated with a medication.
@@ -142,4 +326,114 @@ class DoctorsNote(models.Model):
 
     def __str__(self):
         """Return a brief summary of the doctor's note."""
-        return f"Note for {self.medication.name}: {self.content[:20]}"
\ No newline at end of file
+        return f"Note for {self.medication.name}: {self.content[:20]}"
+
+
+class BulkIngestKey(models.Model):
+    """
+    Remembers the outcome of a bulk dose-log upload by idempotency key.
+
+    A gateway that retries an upload with the same `Idempotency-Key`
+    header gets the stored response back instead of inserting the
+    rows a second time.
+    """
+    key = models.CharField(max_length=255, unique=True)
+    status_code = models.PositiveSmallIntegerField()
+    response = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        """Return the idempotency key."""
+        return self.key
+
+
+class DrugInfoEnrichment(models.Model):
+    """
+    Stored OpenFDA label data for a medication.
+
+    Filled and refreshed by the enrichment worker (see
+    `medtrackerapp.enrichment`) so the `info` endpoint can answer
+    without calling OpenFDA on the request path.
+    """
+    medication = models.OneToOneField(Medication, on_delete=models.CASCADE, related_name="drug_info")
+    name = models.CharField(max_length=100, help_text="Medication name the data was fetched for")
+    data = models.JSONField(default=dict)
+    error = models.TextField(blank=True, default="")
+    fetched_at = models.DateTimeField()
+
+    def __str__(self):
+        """Return the medication name and fetch time."""
+        return f"{self.name} fetched {self.fetched_at:%Y-%m-%d %H:%M}"
+
+
+class EnrichmentJob(models.Model):
+    """
+    A queued refresh of one medication's `DrugInfoEnrichment`.
+
+    Jobs live in the database so worker processes need no external
+    broker. At most one pending job exists per medication.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [(PENDING, "Pending"), (RUNNING, "Running"), (DONE, "Done"), (FAILED, "Failed")]
+
+    medication = models.ForeignKey(Medication, on_delete=models.CASCADE, related_name="enrichment_jobs")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Metadata options for the EnrichmentJob model."""
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="enrichjob_status_run_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["medication"], condition=models.Q(status="pending"), name="enrichjob_one_pending_per_med"
+            ),
+        ]
+
+    def __str__(self):
+        """Return the medication id and job status."""
+        return f"Enrich {self.medication_id}: {self.status}"
+
+
+class DrugLabel(models.Model):
+    """
+    One generic name of a drug label from a local OpenFDA mirror.
+
+    Filled from the bulk drug-label download by the
+    `ingest_drug_labels` command (see `medtrackerapp.druglabels`), so
+    `DrugInfoService` can answer with one indexed lookup instead of a
+    call to OpenFDA. A label with several generic names gets one row
+    per name.
+    """
+    generic_name = models.CharField(max_length=255, help_text="Normalized (stripped, lower-case) lookup key")
+    set_id = models.CharField(max_length=64, help_text="OpenFDA label set id")
+    name = models.CharField(max_length=255, help_text="Generic name as printed on the label")
+    manufacturer = models.CharField(max_length=255)
+    warnings = models.JSONField(default=list)
+    purpose = models.JSONField(default=list)
+    effective_time = models.CharField(max_length=8, blank=True, default="", help_text="Label version date (YYYYMMDD)")
+
+    class Meta:
+        """Metadata options for the DrugLabel model."""
+        constraints = [
+            models.UniqueConstraint(fields=["generic_name", "set_id"], name="druglabel_name_set_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["generic_name", "-effective_time"], name="druglabel_name_effective_idx"),
+        ]
+
+    def __str__(self):
+        """Return the label name and manufacturer."""
+        return f"{self.name} ({self.manufacturer})"
+
+    def as_drug_info(self) -> dict:
+        """Return the label in the shape of `DrugInfoService.get_drug_info()`."""
+        return {"name": self.name, "manufacturer": self.manufacturer, "warnings": self.warnings, "purpose": self.purpose}
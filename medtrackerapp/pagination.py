@@ -0,0 +1,47 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class DoseLogCursorPagination(CursorPagination):
+    """
+    Keyset pagination for dose logs, newest first.
+
+    Pages are fetched with a `WHERE taken_at < cursor` seek instead of
+    an OFFSET scan, so fetching a page costs the same at any depth.
+    Cursors are opaque and stay valid while new logs are inserted.
+    """
+    ordering = ("-taken_at", "id")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Keyset pagination that only applies when the client asks for it.
+
+    Requests without a `cursor` or `page_size` query parameter get the
+    plain, unpaginated list for backwards compatibility.
+    """
+    ordering = ("id",)
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page-number pagination for ranked search results.
+
+    Results are ordered by relevance rather than by a unique, stable
+    column, so keyset cursors do not apply; search pages are shallow
+    in practice, which keeps the OFFSET cheap.
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
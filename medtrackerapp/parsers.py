@@ -0,0 +1,53 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from . import jsonlib
+
+UTF8_NAMES = {"utf-8", "utf8"}
+
+
+class FastJSONParser(JSONParser):
+    """
+    `JSONParser` that decodes with orjson when it is available.
+
+    The request body is read as bytes and handed to orjson directly,
+    without an intermediate decoded string. Non UTF-8 bodies use the
+    stock parser.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not jsonlib.orjson_enabled() or encoding.lower() not in UTF8_NAMES:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return jsonlib.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON into a list of objects.
+
+    Blank lines are ignored; each other line must be a JSON value.
+    UTF-8 bodies are decoded line by line straight from bytes.
+    """
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        lines = stream if encoding.lower() in UTF8_NAMES else codecs.getreader(encoding)(stream)
+        rows = []
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(jsonlib.loads(line))
+            except ValueError as exc:
+                raise ParseError(f"NDJSON parse error on line {line_number} - {exc}")
+        return rows
@@ -0,0 +1,133 @@
+import re
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.core.signals import request_finished, request_started
+from django.db import connections
+
+N_PLUS_ONE_THRESHOLD = 3
+
+_IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+def query_shape(sql: str) -> str:
+    """Normalize SQL so queries differing only in parameters (or IN-list length) compare equal."""
+    return _IN_LIST.sub("IN (...)", sql)
+
+
+class QueryRecorder:
+    """
+    Context manager recording every query run on any database connection.
+
+    Installed with `connection.execute_wrapper`, so it sees the SQL and
+    parameters before the driver does.
+
+    Example:
+        with QueryRecorder() as recorder:
+            client.get("/api/logs/")
+        recorder.repeated_shapes()
+    """
+
+    def __init__(self):
+        self.queries = []
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+
+    def repeated_shapes(self, threshold=N_PLUS_ONE_THRESHOLD) -> dict:
+        """
+        Find SELECT shapes executed with at least `threshold` distinct parameter sets.
+
+        Returns:
+            dict: Maps each offending query shape to its number of executions.
+        """
+        params_by_shape = defaultdict(list)
+        for sql, params in self.queries:
+            if sql.lstrip().upper().startswith("SELECT"):
+                params_by_shape[query_shape(sql)].append(repr(params))
+        return {
+            shape: len(params) for shape, params in params_by_shape.items()
+            if len(set(params)) >= threshold
+        }
+
+
+def describe(queries, repeated=None) -> str:
+    """Format recorded queries (and flagged shapes) for a failure message."""
+    lines = [f"  {number}. {sql} {params!r}" for number, (sql, params) in enumerate(queries, start=1)]
+    for shape, count in (repeated or {}).items():
+        lines.append(f"  repeated {count}x: {shape}")
+    return "\n".join(lines)
+
+
+class QueryBudgetMixin:
+    """
+    `TestCase` mixin for query budgets and N+1 detection.
+
+    Example:
+        with self.assertQueryBudget(2):
+            self.client.get(reverse("medication-list"))
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, budget, allow_repeated=False):
+        """
+        Fail if the block runs more than `budget` queries or repeats a query shape.
+
+        Args:
+            budget (int): Maximum number of queries allowed.
+            allow_repeated (bool): Skip the N+1 check.
+        """
+        with QueryRecorder() as recorder:
+            yield recorder
+        repeated = {} if allow_repeated else recorder.repeated_shapes()
+        if repeated:
+            self.fail(f"Repeated query shapes (likely N+1):\n{describe(recorder.queries, repeated)}")
+        if len(recorder.queries) > budget:
+            self.fail(
+                f"{len(recorder.queries)} queries executed, budget is {budget}:\n{describe(recorder.queries)}"
+            )
+
+
+class RequestQueryAuditor:
+    """
+    Flags N+1 query patterns in every request handled while installed.
+
+    Used by `QueryAuditRunner`; each request is recorded from
+    `request_started` to `request_finished` and an `AssertionError`
+    is raised into the test if a query shape repeats.
+    """
+
+    def __init__(self, threshold=N_PLUS_ONE_THRESHOLD):
+        self.threshold = threshold
+        self._recorder = None
+
+    def install(self):
+        request_started.connect(self.start, dispatch_uid="query_audit_start")
+        request_finished.connect(self.finish, dispatch_uid="query_audit_finish")
+
+    def uninstall(self):
+        request_started.disconnect(dispatch_uid="query_audit_start")
+        request_finished.disconnect(dispatch_uid="query_audit_finish")
+
+    def start(self, **kwargs):
+        self._recorder = QueryRecorder().__enter__()
+
+    def finish(self, **kwargs):
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return
+        recorder.__exit__(None, None, None)
+        repeated = recorder.repeated_shapes(self.threshold)
+        if repeated:
+            raise AssertionError(f"Repeated query shapes (likely N+1):\n{describe(recorder.queries, repeated)}")
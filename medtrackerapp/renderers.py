@@ -0,0 +1,52 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from . import jsonlib
+from .instrumentation import timed
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` that encodes with orjson when it is available.
+
+    Output is byte-for-byte the stock renderer's: compact, UTF-8, DRF
+    datetime/decimal encoding. Indented output (e.g. `; indent=4`) and
+    data orjson rejects are handed to the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if (
+            not jsonlib.orjson_enabled()
+            or self.get_indent(accepted_media_type, renderer_context)
+            or self.ensure_ascii
+            or not self.compact
+        ):
+            with timed("serialize_seconds"):
+                return super().render(data, accepted_media_type, renderer_context)
+        with timed("serialize_seconds"):
+            try:
+                return jsonlib.dumps(data)
+            except TypeError:
+                return super().render(data, accepted_media_type, renderer_context)
+
+
+class CSVRenderer(BaseRenderer):
+    """Renderer used for content negotiation of streamed CSV responses."""
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renderer used for content negotiation of streamed NDJSON responses."""
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
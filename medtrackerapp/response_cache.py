@@ -0,0 +1,114 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class MedicationResponseCache:
+    """
+    Server-side cache of rendered `MedicationSerializer` output.
+
+    Entries are stored per medication together with the medication's
+    `version`, so an entry is only served while it matches the row it
+    was rendered from. Signal handlers also delete entries as soon as
+    a medication or one of its dose logs changes. A miss only
+    re-renders the missing medications, never the whole list.
+    """
+
+    def __init__(self, enabled=True, timeout=300, cache_alias="default", key_prefix="medrepr"):
+        self.enabled = enabled
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    @classmethod
+    def from_settings(cls):
+        """Build a cache configured from `settings.MEDICATION_RESPONSE_CACHE`."""
+        config = getattr(settings, "MEDICATION_RESPONSE_CACHE", {})
+        return cls(
+            enabled=config.get("ENABLED", True),
+            timeout=config.get("TIMEOUT", 300),
+            cache_alias=config.get("CACHE_ALIAS", "default"),
+            key_prefix=config.get("KEY_PREFIX", "medrepr"),
+        )
+
+    def key(self, medication_id):
+        """Return the cache key for one medication."""
+        return f"{self.key_prefix}:{medication_id}"
+
+    def get_many(self, medications):
+        """
+        Look up cached representations for `medications`.
+
+        Args:
+            medications (Iterable[Medication]): Instances whose `version`
+                is current.
+
+        Returns:
+            dict: Maps medication id to its cached representation for
+                  every entry that exists and matches the version.
+        """
+        medications = list(medications)
+        stored = caches[self.cache_alias].get_many([self.key(med.pk) for med in medications])
+        found = {}
+        for med in medications:
+            entry = stored.get(self.key(med.pk))
+            if entry is not None and entry["version"] == med.version:
+                found[med.pk] = entry["data"]
+        self._count("hits", len(found))
+        self._count("misses", len(medications) - len(found))
+        return found
+
+    def set_many(self, entries):
+        """
+        Store rendered representations.
+
+        Args:
+            entries (Iterable[tuple[int, int, dict]]): `(medication_id,
+                version, representation)` triples.
+        """
+        caches[self.cache_alias].set_many(
+            {self.key(med_id): {"version": version, "data": data} for med_id, version, data in entries},
+            timeout=self.timeout,
+        )
+
+    def invalidate(self, medication_ids):
+        """Drop the cached representations of the given medications."""
+        keys = [self.key(med_id) for med_id in set(medication_ids)]
+        if not keys:
+            return
+        caches[self.cache_alias].delete_many(keys)
+        self._count("invalidations", len(keys))
+
+    def stats(self) -> dict:
+        """Return hit/miss/invalidation counters and the hit ratio."""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return counters
+
+    def reset_stats(self):
+        """Reset the counters to zero."""
+        with self._lock:
+            for key in self._counters:
+                self._counters[key] = 0
+
+    def _count(self, counter, amount=1):
+        with self._lock:
+            self._counters[counter] += amount
+
+
+_medication_response_cache = None
+_medication_response_cache_lock = threading.Lock()
+
+
+def get_medication_response_cache() -> MedicationResponseCache:
+    """Return the process-wide `MedicationResponseCache`, creating it on first use."""
+    global _medication_response_cache
+    with _medication_response_cache_lock:
+        if _medication_response_cache is None:
+            _medication_response_cache = MedicationResponseCache.from_settings()
+        return _medication_response_cache
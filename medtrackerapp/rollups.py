@@ -0,0 +1,148 @@
+from collections import defaultdict
+from datetime import datetime
+
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import DailyAdherence, DoseLog, DoseLogArchive, Medication, day_range
+from .response_cache import get_medication_response_cache
+
+
+def local_day(value):
+    """Return the calendar day of a `taken_at` value in the current timezone."""
+    if not isinstance(value, datetime):
+        value = DoseLog._meta.get_field("taken_at").to_python(value)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return timezone.localdate(value)
+
+
+def rollup_deltas(rows, sign=1):
+    """
+    Group dose logs into per-(medication, day) count deltas.
+
+    Args:
+        rows (Iterable): Objects or dicts with `medication_id`,
+            `taken_at` and `was_taken`.
+        sign (int): 1 to add the rows, -1 to remove them.
+
+    Returns:
+        dict: Maps (medication_id, day) to [taken_delta, missed_delta].
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    for row in rows:
+        if isinstance(row, dict):
+            medication_id, taken_at, was_taken = row["medication_id"], row["taken_at"], row["was_taken"]
+        else:
+            medication_id, taken_at, was_taken = row.medication_id, row.taken_at, row.was_taken
+        deltas[(medication_id, local_day(taken_at))][0 if was_taken else 1] += sign
+    return deltas
+
+
+def merge_deltas(*deltas):
+    """Sum several delta dicts as returned by `rollup_deltas`."""
+    merged = defaultdict(lambda: [0, 0])
+    for delta in deltas:
+        for key, (taken, missed) in delta.items():
+            merged[key][0] += taken
+            merged[key][1] += missed
+    return merged
+
+
+def apply_deltas(deltas):
+    """
+    Apply count deltas to the `DailyAdherence` rollup.
+
+    Each affected row is updated in place with `F()` expressions, so
+    concurrent writers never lose increments; missing rows are
+    created on demand.
+    """
+    for (medication_id, day), (taken, missed) in deltas.items():
+        if not taken and not missed:
+            continue
+        changes = {
+            "taken_count": models.F("taken_count") + taken,
+            "missed_count": models.F("missed_count") + missed,
+        }
+        rows = DailyAdherence.objects.filter(medication_id=medication_id, day=day)
+        if rows.update(**changes) or (taken <= 0 and missed <= 0):
+            continue
+        try:
+            with transaction.atomic():
+                DailyAdherence.objects.create(
+                    medication_id=medication_id, day=day,
+                    taken_count=max(taken, 0), missed_count=max(missed, 0),
+                )
+        except IntegrityError:
+            rows.update(**changes)
+
+
+def rebuild_daily_adherence(start=None, end=None, medication=None):
+    """
+    Recompute the rollup from raw dose logs.
+
+    Existing rollup rows in the range are replaced by fresh counts
+    computed with one grouped aggregate query per table (live and
+    archived dose logs). Medications whose counts changed get their
+    `version` bumped and their cached representation dropped, so
+    list responses and ETags pick up the corrected adherence.
+
+    Args:
+        start (date | None): First day to rebuild (default: no lower bound).
+        end (date | None): Last day to rebuild (default: no upper bound).
+        medication (int | None): Restrict to one medication id.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    sources = [DoseLog.objects.all(), DoseLogArchive.objects.all()]
+    rollups = DailyAdherence.objects.all()
+    if start:
+        sources = [logs.filter(taken_at__gte=day_range(start, start)[0]) for logs in sources]
+        rollups = rollups.filter(day__gte=start)
+    if end:
+        sources = [logs.filter(taken_at__lt=day_range(end, end)[1]) for logs in sources]
+        rollups = rollups.filter(day__lte=end)
+    if medication is not None:
+        sources = [logs.filter(medication_id=medication) for logs in sources]
+        rollups = rollups.filter(medication_id=medication)
+
+    counts = defaultdict(lambda: [0, 0])
+    for logs in sources:
+        grouped = (
+            logs.order_by()
+            .annotate(day=TruncDate("taken_at", tzinfo=timezone.get_current_timezone()))
+            .values("medication_id", "day")
+            .annotate(
+                taken=models.Count("id", filter=models.Q(was_taken=True)),
+                missed=models.Count("id", filter=models.Q(was_taken=False)),
+            )
+        )
+        for row in grouped.iterator():
+            counts[(row["medication_id"], row["day"])][0] += row["taken"]
+            counts[(row["medication_id"], row["day"])][1] += row["missed"]
+
+    with transaction.atomic():
+        previous = {
+            (medication_id, day): [taken, missed]
+            for medication_id, day, taken, missed in rollups.values_list(
+                "medication_id", "day", "taken_count", "missed_count"
+            ).iterator()
+        }
+        rollups.delete()
+        created = DailyAdherence.objects.bulk_create(
+            [
+                DailyAdherence(medication_id=medication_id, day=day, taken_count=taken, missed_count=missed)
+                for (medication_id, day), (taken, missed) in counts.items()
+            ],
+            batch_size=1000,
+        )
+        changed = {
+            medication_id for medication_id, day in previous.keys() | counts.keys()
+            if previous.get((medication_id, day), [0, 0]) != counts.get((medication_id, day), [0, 0])
+        }
+        if changed:
+            Medication.objects.filter(id__in=changed).touch()
+    get_medication_response_cache().invalidate(changed)
+    return len(created)
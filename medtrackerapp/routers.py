@@ -0,0 +1,78 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+def replica_settings() -> dict:
+    """Return `settings.DATABASE_REPLICAS` merged over the defaults."""
+    return {
+        "ALIASES": [],
+        "STICKY_SECONDS": 5,
+        "COOKIE_NAME": "medtracker_primary",
+        **getattr(settings, "DATABASE_REPLICAS", {}),
+    }
+
+
+class RoutingState:
+    """Per-request routing flags: whether reads may use a replica, and whether anything was written."""
+    __slots__ = ("replica_reads", "wrote")
+
+    def __init__(self, replica_reads):
+        self.replica_reads = replica_reads
+        self.wrote = False
+
+
+_state = ContextVar("medtracker_db_routing", default=None)
+
+
+@contextmanager
+def routing_scope(replica_reads=True):
+    """
+    Route reads in the enclosed block to replicas until something is written.
+
+    Outside any scope (management commands, workers, shells) every
+    query goes to the primary. `ReplicaRoutingMiddleware` opens one
+    scope per request.
+
+    Yields:
+        RoutingState: The state of this scope.
+    """
+    state = RoutingState(replica_reads)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Send writes to the primary and, inside a routing scope, reads to a replica.
+
+    Replica aliases come from `settings.DATABASE_REPLICAS["ALIASES"]`;
+    a random one is picked per query. Once a scope has written,
+    its remaining reads go to the primary so it reads its own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.replica_reads or state.wrote:
+            return DEFAULT_DB_ALIAS
+        aliases = replica_settings()["ALIASES"]
+        return random.choice(aliases) if aliases else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        databases = {DEFAULT_DB_ALIAS, *replica_settings()["ALIASES"]}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,76 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, F, FloatField, Value
+from django.db.models.expressions import RawSQL
+
+from .models import DoctorsNote, day_range
+
+# Text-search configuration / tokenizer. The migration that builds the
+# index (0009_doctorsnote_search) uses the same values.
+POSTGRES_CONFIG = "english"
+SQLITE_FTS_TABLE = "medtrackerapp_doctorsnote_fts"
+
+TERM_RE = re.compile(r"\w+")
+
+
+def search_terms(query) -> list:
+    """Split a user query into plain word terms, dropping any search syntax."""
+    return TERM_RE.findall(query or "")
+
+
+def search_notes(query, medication=None, start=None, end=None):
+    """
+    Return doctor's notes matching every term of `query`, best first.
+
+    Uses the text index of the current database: the generated
+    `search_vector` column and its GIN index on Postgres, the FTS5
+    shadow table on SQLite. Both are kept in sync by the database on
+    every insert, update and delete. Other backends fall back to an
+    unindexed `icontains` match with a constant rank.
+
+    Args:
+        query (str): Search text; all words must match (stemmed).
+        medication (int | None): Restrict to one medication id.
+        start (date | None): First `created_at` day to include.
+        end (date | None): Last `created_at` day to include.
+
+    Returns:
+        QuerySet[DoctorsNote]: Annotated with `rank` (higher is better)
+            and ordered by rank, newest first on ties.
+    """
+    terms = search_terms(query)
+    notes = DoctorsNote.objects.all()
+    if medication is not None:
+        notes = notes.filter(medication_id=medication)
+    if start:
+        notes = notes.filter(created_at__gte=day_range(start, start)[0])
+    if end:
+        notes = notes.filter(created_at__lt=day_range(end, end)[1])
+    if not terms:
+        return notes.none().annotate(rank=Value(0.0, output_field=FloatField()))
+
+    if connection.vendor == "postgresql":
+        # Imported here: django.contrib.postgres needs a Postgres driver installed.
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        tsquery = SearchQuery(" ".join(terms), config=POSTGRES_CONFIG)  # plainto_tsquery
+        vector = RawSQL(f"{DoctorsNote._meta.db_table}.search_vector", [], output_field=SearchVectorField())
+        notes = notes.alias(search=vector).filter(search=tsquery).annotate(rank=SearchRank(F("search"), tsquery))
+    elif connection.vendor == "sqlite":
+        match = " ".join(f'"{term}"' for term in terms)
+        note_id = f"{DoctorsNote._meta.db_table}.id"
+        notes = notes.filter(RawSQL(
+            f"{note_id} IN (SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s)",
+            [match], output_field=BooleanField(),
+        )).annotate(rank=RawSQL(
+            # bm25() is lower for better matches; negate it so rank sorts the same way everywhere.
+            f"SELECT -bm25({SQLITE_FTS_TABLE}) FROM {SQLITE_FTS_TABLE} "
+            f"WHERE {SQLITE_FTS_TABLE} MATCH %s AND {SQLITE_FTS_TABLE}.rowid = {note_id}",
+            [match], output_field=FloatField(),
+        ))
+    else:
+        for term in terms:
+            notes = notes.filter(content__icontains=term)
+        notes = notes.annotate(rank=Value(0.0, output_field=FloatField()))
+    return notes.order_by("-rank", "-created_at", "-id")
@@ -1,4 +1,7 @@
+from django.utils import timezone
 from rest_framework import serializers
+from .exports import format_datetime
+from .instrumentation import timed
 from .models import Medication, DoseLog, DoctorsNote
 
 
@@ -10,7 +13,12 @@ class MedicationSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "dosage_mg", "prescribed_per_day", "adherence"]
 
     def get_adherence(self, obj):
-        return obj.adherence_rate()
+        # Prefer the counts annotated by `with_adherence_counts()` to avoid per-row queries.
+        taken = getattr(obj, "taken_count", None)
+        total = getattr(obj, "total_count", None)
+        if taken is None or total is None:
+            return obj.adherence_rate()
+        return Medication.rate_from_counts(taken, total)
 
 
 class DoseLogSerializer(serializers.ModelSerializer):
@@ -18,6 +26,19 @@ class DoseLogSerializer(serializers.ModelSerializer):
         model = DoseLog
         fields = ["id", "medication", "taken_at", "was_taken"]
 
+class DoseLogBulkRowSerializer(serializers.Serializer):
+    """
+    Validates a single row of a bulk dose-log upload.
+
+    The medication is accepted as a plain id; existence is checked for
+    the whole batch with a single query by the bulk endpoint rather
+    than once per row.
+    """
+    medication = serializers.IntegerField(min_value=1)
+    taken_at = serializers.DateTimeField()
+    was_taken = serializers.BooleanField(default=True)
+
+
 class DoctorsNoteSerializer(serializers.ModelSerializer):
     """
     Serializer for DoctorsNote model.
@@ -26,3 +47,87 @@ class DoctorsNoteSerializer(serializers.ModelSerializer):
     class Meta:
         model = DoctorsNote
         fields = ["id", "medication", "content", "created_at"]
+
+
+class ValuesSerializer:
+    """
+    Read-only serializer that renders `.values()` rows directly.
+
+    Produces the same output as `model_serializer` without creating
+    model instances or DRF field objects per row, for large list
+    responses. The model serializers remain in use for writes and
+    validation.
+
+    Example:
+        rows = DoseLogValuesSerializer.values(DoseLog.objects.all())
+        data = DoseLogValuesSerializer(rows).data
+    """
+    model_serializer = None
+    datetime_fields = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def source_fields(cls):
+        """Return the `.values()` lookups needed to render a row."""
+        return cls.model_serializer.Meta.fields
+
+    @classmethod
+    def values(cls, queryset, *extra):
+        """Return `queryset` as dict rows holding the source fields plus `extra`."""
+        return queryset.values(*cls.source_fields(), *extra)
+
+    def to_representation(self, row, tz):
+        """
+        Return the output dict for one row; keys already match the output field names.
+
+        A copy is returned: the source rows may still be read afterwards
+        (cursor pagination builds its next/previous links from them).
+        """
+        data = dict(row)
+        for name in self.datetime_fields:
+            data[name] = format_datetime(row[name], tz)
+        return data
+
+    @property
+    def data(self):
+        tz = timezone.get_current_timezone()
+        with timed("serialize_seconds"):
+            return [self.to_representation(row, tz) for row in self.rows]
+
+
+class DoseLogValuesSerializer(ValuesSerializer):
+    model_serializer = DoseLogSerializer
+    datetime_fields = ("taken_at",)
+
+
+class DoctorsNoteValuesSerializer(ValuesSerializer):
+    model_serializer = DoctorsNoteSerializer
+    datetime_fields = ("created_at",)
+
+
+class DoctorsNoteSearchValuesSerializer(DoctorsNoteValuesSerializer):
+    """Rows must come from `search_notes()`; adds the relevance `rank`."""
+
+    @classmethod
+    def source_fields(cls):
+        return [*super().source_fields(), "rank"]
+
+
+class MedicationValuesSerializer(ValuesSerializer):
+    """Rows must come from a `with_adherence_counts()` queryset."""
+    model_serializer = MedicationSerializer
+
+    @classmethod
+    def source_fields(cls):
+        return ["id", "name", "dosage_mg", "prescribed_per_day", "taken_count", "total_count"]
+
+    def to_representation(self, row, tz):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "dosage_mg": row["dosage_mg"],
+            "prescribed_per_day": row["prescribed_per_day"],
+            "adherence": Medication.rate_from_counts(row["taken_count"], row["total_count"]),
+        }
@@ -1,4 +1,114 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import httpx
 import requests
+from django.conf import settings
+from django.core.cache import caches
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .instrumentation import timed
+
+# Set in the `DrugInfoCache.get_many` worker contexts: the mirror was
+# already consulted on the request thread, and the throwaway worker
+# threads must not open database connections of their own.
+_mirror_checked = contextvars.ContextVar("drug_label_mirror_checked", default=False)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when the circuit breaker is open and upstream calls are skipped."""
+
+
+class DrugNotFoundError(ValueError):
+    """Raised when OpenFDA (or the local mirror) has no label for a drug name."""
+
+
+class CappedRetry(Retry):
+    """
+    `Retry` that never waits longer than `backoff_max` for a `Retry-After`.
+
+    urllib3 otherwise honours the header for up to six hours, stalling
+    the calling worker; this matches `AsyncDrugInfoService._backoff`.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+
+class CircuitBreaker:
+    """
+    Minimal thread-safe circuit breaker for upstream HTTP calls.
+
+    After `failure_threshold` consecutive failures the breaker opens
+    and every call fails fast with `CircuitOpenError`. Once
+    `reset_timeout` seconds have passed, a single probe call is let
+    through (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return the current breaker state."""
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self):
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with
+                a probe call already in flight.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN or (state == self.HALF_OPEN and self._probe_in_flight):
+                raise CircuitOpenError("OpenFDA circuit breaker is open")
+            if state == self.HALF_OPEN:
+                self._probe_in_flight = True
+
+    def record_success(self):
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._current_state() == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def _current_state(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
 
 class DrugInfoService:
     """
@@ -13,6 +123,106 @@ class DrugInfoService:
     """
 
     BASE_URL = "https://api.fda.gov/drug/label.json"
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    HTTP_DEFAULTS = {
+        "POOL_SIZE": 10,
+        "CONNECT_TIMEOUT": 3.05,
+        "READ_TIMEOUT": 10.0,
+        "MAX_RETRIES": 3,
+        "BACKOFF_FACTOR": 0.5,
+        "BACKOFF_MAX": 8.0,
+        "BREAKER_FAILURE_THRESHOLD": 5,
+        "BREAKER_RESET_TIMEOUT": 30.0,
+        "ASYNC_MAX_CONNECTIONS": 200,
+    }
+
+    _session = None
+    _breaker = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def http_settings(cls) -> dict:
+        """Return the HTTP options, overlaying `settings.DRUG_INFO_HTTP` on the defaults."""
+        return {**cls.HTTP_DEFAULTS, **getattr(settings, "DRUG_INFO_HTTP", {})}
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Return the long-lived, pooled HTTP session used for OpenFDA calls.
+
+        The session keeps connections alive between lookups and retries
+        idempotent requests that fail with 429 or 5xx responses using
+        bounded exponential backoff (honouring `Retry-After` up to
+        `BACKOFF_MAX` seconds).
+        """
+        with cls._lock:
+            if cls._session is None:
+                config = cls.http_settings()
+                retry = CappedRetry(
+                    total=config["MAX_RETRIES"],
+                    connect=config["MAX_RETRIES"],
+                    read=0,
+                    status=config["MAX_RETRIES"],
+                    backoff_factor=config["BACKOFF_FACTOR"],
+                    backoff_max=config["BACKOFF_MAX"],
+                    status_forcelist=cls.RETRY_STATUSES,
+                    allowed_methods=["GET"],
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=config["POOL_SIZE"],
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def get_breaker(cls) -> CircuitBreaker:
+        """Return the circuit breaker guarding OpenFDA calls."""
+        with cls._lock:
+            if cls._breaker is None:
+                config = cls.http_settings()
+                cls._breaker = CircuitBreaker(
+                    failure_threshold=config["BREAKER_FAILURE_THRESHOLD"],
+                    reset_timeout=config["BREAKER_RESET_TIMEOUT"],
+                )
+            return cls._breaker
+
+    @classmethod
+    def reset_session(cls):
+        """Close the pooled session and reset the circuit breaker."""
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+            cls._breaker = None
+
+    @classmethod
+    def _request(cls, params: dict) -> requests.Response:
+        """Perform a guarded GET against the OpenFDA endpoint."""
+        breaker = cls.get_breaker()
+        breaker.before_call()
+        config = cls.http_settings()
+        try:
+            with timed("drug_info_seconds"):
+                resp = cls.get_session().get(
+                    cls.BASE_URL,
+                    params=params,
+                    timeout=(config["CONNECT_TIMEOUT"], config["READ_TIMEOUT"]),
+                )
+        except requests.exceptions.RequestException:
+            breaker.record_failure()
+            raise
+        if resp.status_code in cls.RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return resp
 
     @classmethod
     def get_drug_info(cls, drug_name: str):
@@ -21,7 +231,9 @@ class DrugInfoService:
 
         This method queries the OpenFDA "drug/label" endpoint for
         a specific generic drug name and returns a simplified
-        dictionary of relevant information.
+        dictionary of relevant information. When `DRUG_LABEL_MIRROR`
+        is enabled, names present in the local mirror (`DrugLabel`)
+        are answered from it with one indexed query instead.
 
         Args:
             drug_name (str): The name of the medication to search for.
@@ -39,10 +251,13 @@ class DrugInfoService:
             ValueError:
                 - If `drug_name` is missing or empty.
                 - If the OpenFDA API returns a non-200 response.
-                - If no results are found for the given drug name.
+                - `DrugNotFoundError` if no results are found for the
+                  given drug name (including an OpenFDA 404).
 
             requests.exceptions.RequestException:
                 - If there is a network error or timeout during the request.
+                - `CircuitOpenError` if recent upstream failures opened
+                  the circuit breaker.
 
         Example:
             >>> DrugInfoService.get_drug_info("ibuprofen")
@@ -57,16 +272,72 @@ class DrugInfoService:
         if not drug_name:
             raise ValueError("drug_name is required")
 
-        params = {"search": f"openfda.generic_name:{drug_name.lower()}", "limit": 1}
+        local = cls._lookup_mirror(drug_name)
+        if local is not None:
+            return local
 
-        resp = requests.get(cls.BASE_URL, params=params, timeout=10)
+        resp = cls._request(cls._search_params(drug_name))
+        if resp.status_code == 404:
+            # OpenFDA answers a search without matches with 404.
+            raise DrugNotFoundError("No results found for this medication.")
         if resp.status_code != 200:
             raise ValueError(f"OpenFDA API error: {resp.status_code}")
+        return cls._parse_label(drug_name, resp.json())
+
+    @staticmethod
+    def _lookup_mirror(drug_name: str):
+        """
+        Resolve `drug_name` from the local OpenFDA mirror, if enabled.
+
+        Returns None when the remote API should be asked instead.
+
+        Raises:
+            DrugNotFoundError: If the name is not mirrored and
+                `DRUG_LABEL_MIRROR["REMOTE_FALLBACK"]` is off.
+        """
+        from .druglabels import lookup_label, mirror_settings
+
+        config = mirror_settings()
+        if not config["ENABLED"] or _mirror_checked.get():
+            return None
+        local = lookup_label(drug_name)
+        if local is None and not config["REMOTE_FALLBACK"]:
+            raise DrugNotFoundError("No results found for this medication.")
+        return local
 
-        data = resp.json()
+    @staticmethod
+    def _lookup_mirror_many(drug_names) -> dict:
+        """
+        Resolve several names from the local OpenFDA mirror with one query.
+
+        Returns:
+            dict: Maps each normalized name answered locally to its drug
+                  info, or to {'error': message} when it is not mirrored
+                  and `REMOTE_FALLBACK` is off. Empty if the mirror is
+                  disabled.
+        """
+        from .druglabels import lookup_labels, mirror_settings
+
+        config = mirror_settings()
+        if not config["ENABLED"]:
+            return {}
+        found = lookup_labels(drug_names)
+        if not config["REMOTE_FALLBACK"]:
+            for name in drug_names:
+                found.setdefault(name, {"error": "No results found for this medication."})
+        return found
+
+    @staticmethod
+    def _search_params(drug_name: str) -> dict:
+        """Build the OpenFDA query parameters for a generic drug name."""
+        return {"search": f"openfda.generic_name:{drug_name.lower()}", "limit": 1}
+
+    @staticmethod
+    def _parse_label(drug_name: str, data: dict) -> dict:
+        """Reduce an OpenFDA drug-label payload to the fields exposed by the API."""
         results = data.get("results")
         if not results:
-            raise ValueError("No results found for this medication.")
+            raise DrugNotFoundError("No results found for this medication.")
 
         record = results[0]
         openfda = record.get("openfda", {})
@@ -77,3 +348,447 @@ class DrugInfoService:
             "warnings": record.get("warnings", ["No warnings available"]),
             "purpose": record.get("purpose", ["Not specified"]),
         }
+
+
+class AsyncDrugInfoService:
+    """
+    Non-blocking variant of `DrugInfoService` built on `httpx.AsyncClient`.
+
+    It shares the circuit breaker, retry policy and response parsing
+    of `DrugInfoService`, but never blocks the event loop, so a single
+    ASGI worker can keep many upstream lookups in flight at once.
+    One client (and connection pool) is kept per event loop.
+    """
+
+    _clients = {}
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Return the pooled `httpx.AsyncClient` bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = cls._clients.get(loop)
+        if client is None or client.is_closed:
+            config = DrugInfoService.http_settings()
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(config["READ_TIMEOUT"], connect=config["CONNECT_TIMEOUT"]),
+                limits=httpx.Limits(
+                    max_connections=config["ASYNC_MAX_CONNECTIONS"],
+                    max_keepalive_connections=config["ASYNC_MAX_CONNECTIONS"],
+                ),
+            )
+            cls._clients = {
+                key: value for key, value in cls._clients.items() if not key.is_closed()
+            }
+            cls._clients[loop] = client
+        return client
+
+    @classmethod
+    async def aclose(cls):
+        """Close the client bound to the running event loop, if any."""
+        client = cls._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    async def get_drug_info(cls, drug_name: str) -> dict:
+        """
+        Asynchronously retrieve drug label information for a medication name.
+
+        Behaves exactly like `DrugInfoService.get_drug_info`, including
+        the raised exceptions; network errors surface as
+        `requests.exceptions.RequestException` so callers can treat both
+        services alike.
+        """
+        if not drug_name:
+            raise ValueError("drug_name is required")
+
+        local = await cls._lookup_mirror(drug_name)
+        if local is not None:
+            return local
+
+        resp = await cls._request(DrugInfoService._search_params(drug_name))
+        if resp.status_code == 404:
+            # OpenFDA answers a search without matches with 404.
+            raise DrugNotFoundError("No results found for this medication.")
+        if resp.status_code != 200:
+            raise ValueError(f"OpenFDA API error: {resp.status_code}")
+        return DrugInfoService._parse_label(drug_name, resp.json())
+
+    @staticmethod
+    async def _lookup_mirror(drug_name: str):
+        """Async variant of `DrugInfoService._lookup_mirror`."""
+        from .druglabels import alookup_label, mirror_settings
+
+        config = mirror_settings()
+        if not config["ENABLED"]:
+            return None
+        local = await alookup_label(drug_name)
+        if local is None and not config["REMOTE_FALLBACK"]:
+            raise DrugNotFoundError("No results found for this medication.")
+        return local
+
+    @classmethod
+    async def _request(cls, params: dict) -> httpx.Response:
+        """Perform a guarded GET with bounded exponential-backoff retries."""
+        config = DrugInfoService.http_settings()
+        breaker = DrugInfoService.get_breaker()
+        breaker.before_call()
+        client = cls.get_client()
+        attempt = 0
+        while True:
+            try:
+                with timed("drug_info_seconds"):
+                    resp = await client.get(DrugInfoService.BASE_URL, params=params)
+            except httpx.TimeoutException as exc:
+                breaker.record_failure()
+                raise requests.exceptions.Timeout(str(exc)) from exc
+            except httpx.HTTPError as exc:
+                breaker.record_failure()
+                raise requests.exceptions.ConnectionError(str(exc)) from exc
+            if resp.status_code not in DrugInfoService.RETRY_STATUSES or attempt >= config["MAX_RETRIES"]:
+                break
+            await asyncio.sleep(cls._backoff(resp, attempt, config))
+            attempt += 1
+
+        if resp.status_code in DrugInfoService.RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return resp
+
+    @staticmethod
+    def _backoff(resp, attempt, config) -> float:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), config["BACKOFF_MAX"])
+        return min(config["BACKOFF_FACTOR"] * (2 ** attempt), config["BACKOFF_MAX"])
+
+
+class DrugInfoCache:
+    """
+    Two-tier cache in front of `DrugInfoService.get_drug_info`.
+
+    Lookups are keyed on the normalized (stripped, lower-cased) drug
+    name. The first tier is a size-bounded in-process LRU; the second
+    is a shared tier backed by Django's cache framework so that all
+    workers benefit from a single upstream fetch.
+
+    Successful lookups are kept for `ttl` seconds. Lookups that fail
+    with a `ValueError` (no results, non-200 response) are cached as
+    negative entries for `negative_ttl` seconds. Network errors are
+    never cached.
+
+    When `stale_ttl` is positive, an expired entry that is younger
+    than `ttl + stale_ttl` is still returned immediately while a
+    background refresh fetches a new value (stale-while-revalidate).
+    """
+
+    def __init__(self, fetch=None, afetch=None, maxsize=256, ttl=86400, negative_ttl=300,
+                 stale_ttl=3600, cache_alias="default", key_prefix="druginfo",
+                 background=None, clock=time.time, enabled=True):
+        self._fetch = fetch
+        self._afetch = afetch
+        self.enabled = enabled
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._background = background or self._run_in_thread
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            ["hits", "shared_hits", "stale_hits", "misses", "evictions", "refreshes"], 0
+        )
+
+    @classmethod
+    def from_settings(cls):
+        """Build a cache configured from `settings.DRUG_INFO_CACHE`."""
+        config = getattr(settings, "DRUG_INFO_CACHE", {})
+        return cls(
+            maxsize=config.get("MAXSIZE", 256),
+            ttl=config.get("TTL", 86400),
+            negative_ttl=config.get("NEGATIVE_TTL", 300),
+            stale_ttl=config.get("STALE_TTL", 3600),
+            cache_alias=config.get("CACHE_ALIAS", "default"),
+            key_prefix=config.get("KEY_PREFIX", "druginfo"),
+            enabled=config.get("ENABLED", True),
+        )
+
+    @staticmethod
+    def normalize(drug_name: str) -> str:
+        """Return the cache key form of a drug name."""
+        return (drug_name or "").strip().lower()
+
+    def get(self, drug_name: str):
+        """
+        Return drug info for `drug_name`, using cached data when possible.
+
+        Args:
+            drug_name (str): The name of the medication to look up.
+
+        Returns:
+            dict: The same payload as `DrugInfoService.get_drug_info`.
+
+        Raises:
+            ValueError: If `drug_name` is empty or the (possibly cached)
+                lookup failed with a `ValueError`.
+            requests.exceptions.RequestException: On network errors.
+        """
+        name = self._require_name(drug_name)
+        if not self.enabled:
+            return self._call_fetch(name)
+
+        entry, source = self._lookup(name)
+        freshness = self._freshness(entry)
+        if freshness == "fresh":
+            self._count(source)
+            return self._unwrap(entry)
+        if freshness == "stale":
+            self._count("stale_hits")
+            self._schedule_refresh(name)
+            return self._unwrap(entry)
+
+        self._count("misses")
+        return self._unwrap(self._refresh(name))
+
+    async def aget(self, drug_name: str):
+        """
+        Async counterpart of `get`, backed by `AsyncDrugInfoService`.
+
+        Stale entries are revalidated in a task on the running event
+        loop instead of a thread.
+        """
+        name = self._require_name(drug_name)
+        if not self.enabled:
+            return await self._acall_fetch(name)
+
+        entry, source = await self._alookup(name)
+        freshness = self._freshness(entry)
+        if freshness == "fresh":
+            self._count(source)
+            return self._unwrap(entry)
+        if freshness == "stale":
+            self._count("stale_hits")
+            self._schedule_arefresh(name)
+            return self._unwrap(entry)
+
+        self._count("misses")
+        return self._unwrap(await self._arefresh(name))
+
+    def get_many(self, drug_names, max_workers=8) -> dict:
+        """
+        Look up several drug names concurrently.
+
+        Names are de-duplicated after normalization. Names held in the
+        local drug-label mirror are resolved first, in one query on the
+        calling thread; the rest are fetched over a bounded thread pool,
+        so the total time tracks the slowest lookup rather than the sum
+        of all of them.
+
+        Args:
+            drug_names (Iterable[str]): Medication names to look up.
+            max_workers (int): Upper bound on concurrent lookups.
+
+        Returns:
+            dict: Maps each normalized name to its drug info, or to
+                  {'error': message} if that lookup failed.
+        """
+        names = sorted({self.normalize(name) for name in drug_names} - {""})
+        if not names:
+            return {}
+
+        results = DrugInfoService._lookup_mirror_many(names) if self._fetch is None else {}
+        names = [name for name in names if name not in results]
+        if not names:
+            return results
+
+        def lookup(name):
+            _mirror_checked.set(True)
+            try:
+                return self.get(name)
+            except Exception as exc:
+                return {"error": str(exc)}
+
+        # Run each lookup in a copy of the caller's context so request instrumentation still applies.
+        contexts = [contextvars.copy_context() for _ in names]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+            results.update(zip(names, pool.map(lambda context, name: context.run(lookup, name), contexts, names)))
+        return results
+
+    def stats(self) -> dict:
+        """Return a snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return dict(self._counters, size=len(self._entries))
+
+    def clear(self):
+        """Drop every in-process entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            for key in self._counters:
+                self._counters[key] = 0
+
+    def _require_name(self, drug_name):
+        name = self.normalize(drug_name)
+        if not name:
+            raise ValueError("drug_name is required")
+        return name
+
+    def _freshness(self, entry):
+        if entry is None:
+            return "missing"
+        age = self._clock() - entry["fetched_at"]
+        lifetime = self.negative_ttl if "error" in entry else self.ttl
+        if age < lifetime:
+            return "fresh"
+        if age < lifetime + self.stale_ttl:
+            return "stale"
+        return "expired"
+
+    def _lookup_local(self, name):
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self._entries.move_to_end(name)
+            return entry
+
+    def _lookup(self, name):
+        entry = self._lookup_local(name)
+        if entry is not None:
+            return entry, "hits"
+
+        entry = caches[self.cache_alias].get(self._shared_key(name))
+        if entry is not None:
+            self._store_local(name, entry)
+        return entry, "shared_hits"
+
+    async def _alookup(self, name):
+        entry = self._lookup_local(name)
+        if entry is not None:
+            return entry, "hits"
+
+        entry = await caches[self.cache_alias].aget(self._shared_key(name))
+        if entry is not None:
+            self._store_local(name, entry)
+        return entry, "shared_hits"
+
+    def _call_fetch(self, name):
+        fetch = self._fetch or DrugInfoService.get_drug_info
+        return fetch(name)
+
+    async def _acall_fetch(self, name):
+        afetch = self._afetch or AsyncDrugInfoService.get_drug_info
+        return await afetch(name)
+
+    def _refresh(self, name):
+        try:
+            entry = {"data": self._call_fetch(name), "fetched_at": self._clock()}
+        except ValueError as exc:
+            entry = {"error": str(exc), "fetched_at": self._clock()}
+        self._store(name, entry)
+        return entry
+
+    async def _arefresh(self, name):
+        try:
+            entry = {"data": await self._acall_fetch(name), "fetched_at": self._clock()}
+        except ValueError as exc:
+            entry = {"error": str(exc), "fetched_at": self._clock()}
+        self._store_local(name, entry)
+        await caches[self.cache_alias].aset(
+            self._shared_key(name), entry, timeout=self._shared_timeout(entry)
+        )
+        return entry
+
+    def _begin_refresh(self, name):
+        with self._lock:
+            if name in self._refreshing:
+                return False
+            self._refreshing.add(name)
+            self._counters["refreshes"] += 1
+            return True
+
+    def _end_refresh(self, name):
+        with self._lock:
+            self._refreshing.discard(name)
+
+    def _schedule_refresh(self, name):
+        if not self._begin_refresh(name):
+            return
+
+        def refresh():
+            try:
+                self._refresh(name)
+            except requests.exceptions.RequestException:
+                pass
+            finally:
+                self._end_refresh(name)
+
+        self._background(refresh)
+
+    def _schedule_arefresh(self, name):
+        if not self._begin_refresh(name):
+            return
+
+        async def refresh():
+            try:
+                await self._arefresh(name)
+            except requests.exceptions.RequestException:
+                pass
+            finally:
+                self._end_refresh(name)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _store(self, name, entry):
+        self._store_local(name, entry)
+        caches[self.cache_alias].set(
+            self._shared_key(name), entry, timeout=self._shared_timeout(entry)
+        )
+
+    def _shared_timeout(self, entry):
+        lifetime = self.negative_ttl if "error" in entry else self.ttl
+        return lifetime + self.stale_ttl
+
+    def _store_local(self, name, entry):
+        with self._lock:
+            self._entries[name] = entry
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _shared_key(self, name):
+        return f"{self.key_prefix}:{quote(name, safe='')}"
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    @staticmethod
+    def _unwrap(entry):
+        if "error" in entry:
+            raise ValueError(entry["error"])
+        return entry["data"]
+
+    @staticmethod
+    def _run_in_thread(func):
+        threading.Thread(target=func, daemon=True).start()
+
+
+_drug_info_cache = None
+_drug_info_cache_lock = threading.Lock()
+
+
+def get_drug_info_cache() -> DrugInfoCache:
+    """Return the process-wide `DrugInfoCache`, creating it on first use."""
+    global _drug_info_cache
+    with _drug_info_cache_lock:
+        if _drug_info_cache is None:
+            _drug_info_cache = DrugInfoCache.from_settings()
+        return _drug_info_cache
@@ -0,0 +1,128 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal
+
+from .enrichment import enqueue, enrichment_settings
+from .models import DoctorsNote, DoseLog, Medication
+from .response_cache import get_medication_response_cache
+from .rollups import apply_deltas, merge_deltas, rollup_deltas
+
+# Sent after dose logs are inserted with `bulk_create`, which does not
+# fire `post_save`. Arguments: `logs` (list of saved DoseLog objects).
+dose_logs_bulk_created = Signal()
+
+
+def remember_previous_dose_log(sender, instance, raw=False, **kwargs):
+    """Stash the stored version of an updated DoseLog for the rollup."""
+    if raw or instance.pk is None:
+        instance._rollup_previous = None
+        return
+    instance._rollup_previous = sender.objects.filter(pk=instance.pk).values(
+        "medication_id", "taken_at", "was_taken"
+    ).first()
+
+
+def update_rollup_on_save(sender, instance, raw=False, **kwargs):
+    """Move a saved DoseLog's contribution to its (new) medication and day."""
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    removed = rollup_deltas([previous], sign=-1) if previous else {}
+    apply_deltas(merge_deltas(removed, rollup_deltas([instance])))
+
+
+def update_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    """Remove a deleted DoseLog's contribution from the rollup."""
+    if isinstance(origin, Medication) or getattr(origin, "model", None) is Medication:
+        # The rollup rows are cascade-deleted with the medication.
+        return
+    apply_deltas(rollup_deltas([instance], sign=-1))
+
+
+def update_rollup_on_bulk_create(sender, logs, **kwargs):
+    """Add bulk-inserted DoseLogs to the rollup."""
+    apply_deltas(rollup_deltas(logs))
+
+
+def touch_medication_on_save(sender, instance, raw=False, **kwargs):
+    """Bump the version of the medication(s) a saved DoseLog belongs to."""
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    ids = {instance.medication_id} | ({previous["medication_id"]} if previous else set())
+    Medication.objects.filter(id__in=ids).touch()
+
+
+def touch_medication_on_delete(sender, instance, origin=None, **kwargs):
+    """Bump the version of a deleted DoseLog's medication."""
+    if isinstance(origin, Medication) or getattr(origin, "model", None) is Medication:
+        return
+    Medication.objects.filter(id=instance.medication_id).touch()
+
+
+def touch_medications_on_bulk_create(sender, logs, **kwargs):
+    """Bump the versions of every medication that received bulk-inserted logs."""
+    Medication.objects.filter(id__in={log.medication_id for log in logs}).touch()
+
+
+def touch_medication_on_note_change(sender, instance, raw=False, origin=None, **kwargs):
+    """Bump the version of a medication whose doctor's notes changed (they can be expanded into it)."""
+    if raw or isinstance(origin, Medication) or getattr(origin, "model", None) is Medication:
+        return
+    Medication.objects.filter(id=instance.medication_id).touch()
+
+
+def invalidate_medication_on_change(sender, instance, **kwargs):
+    """Drop the cached representation of a saved or deleted medication."""
+    get_medication_response_cache().invalidate([instance.pk])
+
+
+def invalidate_medication_on_dose_log_change(sender, instance, **kwargs):
+    """Drop the cached representation(s) affected by a saved or deleted DoseLog."""
+    previous = getattr(instance, "_rollup_previous", None)
+    ids = {instance.medication_id} | ({previous["medication_id"]} if previous else set())
+    get_medication_response_cache().invalidate(ids)
+
+
+def invalidate_medications_on_bulk_create(sender, logs, **kwargs):
+    """Drop the cached representations of medications that received bulk-inserted logs."""
+    get_medication_response_cache().invalidate({log.medication_id for log in logs})
+
+
+def remember_previous_medication_name(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Stash the stored name of an updated Medication so a rename can be detected."""
+    instance._enrichment_previous_name = None
+    if raw or instance.pk is None or instance._state.adding or not enrichment_settings()["ENABLED"]:
+        return
+    if update_fields is not None and "name" not in update_fields:
+        instance._enrichment_previous_name = instance.name
+        return
+    instance._enrichment_previous_name = sender.objects.filter(pk=instance.pk).values_list("name", flat=True).first()
+
+
+def enqueue_enrichment_on_save(sender, instance, created=False, raw=False, **kwargs):
+    """Queue an OpenFDA refresh for a new or renamed medication."""
+    if raw or not enrichment_settings()["ENABLED"]:
+        return
+    if created or getattr(instance, "_enrichment_previous_name", None) != instance.name:
+        # A new name deserves a fresh attempt even if the old one just failed.
+        enqueue([instance.pk], retry_failed=True)
+
+
+def connect_rollup_signals():
+    """Connect the rollup, version, response-cache and enrichment handlers. Called from `AppConfig.ready`."""
+    pre_save.connect(remember_previous_dose_log, sender=DoseLog, dispatch_uid="rollup_pre_save")
+    post_save.connect(update_rollup_on_save, sender=DoseLog, dispatch_uid="rollup_post_save")
+    post_delete.connect(update_rollup_on_delete, sender=DoseLog, dispatch_uid="rollup_post_delete")
+    dose_logs_bulk_created.connect(update_rollup_on_bulk_create, dispatch_uid="rollup_bulk_create")
+    post_save.connect(touch_medication_on_save, sender=DoseLog, dispatch_uid="version_post_save")
+    post_delete.connect(touch_medication_on_delete, sender=DoseLog, dispatch_uid="version_post_delete")
+    dose_logs_bulk_created.connect(touch_medications_on_bulk_create, dispatch_uid="version_bulk_create")
+    post_save.connect(touch_medication_on_note_change, sender=DoctorsNote, dispatch_uid="version_note_save")
+    post_delete.connect(touch_medication_on_note_change, sender=DoctorsNote, dispatch_uid="version_note_delete")
+    post_save.connect(invalidate_medication_on_change, sender=Medication, dispatch_uid="response_cache_medication_save")
+    post_delete.connect(invalidate_medication_on_change, sender=Medication, dispatch_uid="response_cache_medication_delete")
+    post_save.connect(invalidate_medication_on_dose_log_change, sender=DoseLog, dispatch_uid="response_cache_log_save")
+    post_delete.connect(invalidate_medication_on_dose_log_change, sender=DoseLog, dispatch_uid="response_cache_log_delete")
+    dose_logs_bulk_created.connect(invalidate_medications_on_bulk_create, dispatch_uid="response_cache_bulk_create")
+    pre_save.connect(remember_previous_medication_name, sender=Medication, dispatch_uid="enrichment_pre_save")
+    post_save.connect(enqueue_enrichment_on_save, sender=Medication, dispatch_uid="enrichment_post_save")
@@ -0,0 +1,41 @@
+import os
+
+from django.test.runner import DiscoverRunner
+
+from .query_audit import RequestQueryAuditor
+
+
+class QueryAuditRunner(DiscoverRunner):
+    """
+    Test runner with an optional N+1 audit of every request.
+
+    With `--query-audit` (or `QUERY_AUDIT=1`), each request made through
+    the test client fails its test when the same SELECT shape runs with
+    several different parameter sets.
+
+    Example:
+        python manage.py test medtrackerapp/tests --query-audit
+    """
+
+    def __init__(self, query_audit=False, **kwargs):
+        super().__init__(**kwargs)
+        self.query_audit = query_audit or os.getenv("QUERY_AUDIT") == "1"
+        self.auditor = RequestQueryAuditor()
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--query-audit", action="store_true",
+            help="Fail tests whose requests repeat a query shape (N+1 queries).",
+        )
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        if self.query_audit:
+            self.auditor.install()
+
+    def teardown_test_environment(self, **kwargs):
+        if self.query_audit:
+            self.auditor.uninstall()
+        super().teardown_test_environment(**kwargs)
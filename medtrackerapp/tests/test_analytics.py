@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from medtrackerapp.analytics import adherence_series, serialize_adherence_series
+from medtrackerapp.models import Medication, DoseLog
+
+
+class AdherenceAnalyticsTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("medication-adherence-analytics")
+        self.start, self.end = date(2025, 12, 1), date(2025, 12, 10)
+        self.meds = [
+            Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2),
+            Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3),
+        ]
+        for offset in range(-5, 10):
+            day = self.start + timedelta(days=offset)
+            for med_index, med in enumerate(self.meds):
+                for dose in range(med.prescribed_per_day):
+                    DoseLog.objects.create(
+                        medication=med,
+                        taken_at=f"{day.isoformat()}T0{dose}:00:00Z",
+                        was_taken=(offset + dose + med_index) % 3 != 0,
+                    )
+
+    def test_series_match_adherence_rate_over_period(self):
+        data = serialize_adherence_series(adherence_series(self.start, self.end))
+        for med in self.meds:
+            series = data["medications"][str(med.id)]
+            for i, day in enumerate(data["days"]):
+                day = date.fromisoformat(day)
+                self.assertEqual(series["daily"][i], med.adherence_rate_over_period(day, day))
+                self.assertEqual(series["rolling_7"][i], med.adherence_rate_over_period(day - timedelta(days=6), day))
+                self.assertEqual(series["rolling_30"][i], med.adherence_rate_over_period(day - timedelta(days=29), day))
+            for i, (first, last) in enumerate(data["weeks"]):
+                self.assertEqual(
+                    series["weekly"][i],
+                    med.adherence_rate_over_period(date.fromisoformat(first), date.fromisoformat(last)),
+                )
+
+    def test_endpoint_query_count_is_constant(self):
+        params = {"start": "2025-12-01", "end": "2025-12-10"}
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["days"]), 10)
+        self.assertEqual(len(response.data["weeks"]), 2)
+
+        for i in range(10):
+            Medication.objects.create(name=f"Med {i}", dosage_mg=1, prescribed_per_day=1)
+        with self.assertNumQueries(2):
+            self.client.get(self.url, params)
+
+    def test_endpoint_filters_ids_and_windows(self):
+        response = self.client.get(self.url, {
+            "start": "2025-12-01", "end": "2025-12-03",
+            "ids": str(self.meds[0].id), "windows": "daily",
+        })
+        self.assertEqual(list(response.data["medications"]), [str(self.meds[0].id)])
+        self.assertEqual(list(response.data["medications"][str(self.meds[0].id)]), ["daily"])
+        self.assertNotIn("weeks", response.data)
+
+    def test_zero_schedule_reports_error(self):
+        med = Medication.objects.create(name="PRN", dosage_mg=1, prescribed_per_day=0)
+        response = self.client.get(self.url, {"start": "2025-12-01", "end": "2025-12-03", "ids": str(med.id)})
+        self.assertIn("error", response.data["medications"][str(med.id)])
+
+    def test_endpoint_invalid_params(self):
+        for params in [
+            {},
+            {"start": "2025-12-03", "end": "2025-12-01"},
+            {"start": "2025-02-01", "end": "2025-02-30"},
+            {"start": "2024-01-01", "end": "2025-12-01"},
+            {"start": "2025-12-01", "end": "2025-12-03", "windows": "monthly"},
+            {"start": "2025-12-01", "end": "2025-12-03", "ids": "a,b"},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,143 @@
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from medtrackerapp.archive import CombinedDoseLogs, archive_dose_logs
+from medtrackerapp.ingest import insert_dose_logs
+from medtrackerapp.models import DailyAdherence, DoseLog, DoseLogArchive, Medication
+from medtrackerapp.rollups import rebuild_daily_adherence
+
+CUTOFF = datetime(2025, 12, 4, tzinfo=timezone.utc)
+
+
+class DoseLogArchiveTests(APITestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        self.other = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=1)
+        start = datetime(2025, 12, 1, 8, tzinfo=timezone.utc)
+        insert_dose_logs([
+            DoseLog(
+                medication=self.med if i % 3 else self.other,
+                taken_at=start + timedelta(hours=6 * i),
+                was_taken=bool(i % 4),
+            )
+            for i in range(24)
+        ], chunk_size=100)
+
+    def rollup(self):
+        return sorted(DailyAdherence.objects.values_list("medication_id", "day", "taken_count", "missed_count"))
+
+    def pages(self, url, params):
+        ids, response = [], self.client.get(url, {**params, "page_size": 5})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(log["id"] for log in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_archive_moves_old_logs_and_keeps_rollup(self):
+        rollup = self.rollup()
+        old_ids = set(DoseLog.objects.filter(taken_at__lt=CUTOFF).values_list("id", flat=True))
+
+        moved = archive_dose_logs(CUTOFF, batch_size=5)
+
+        self.assertEqual(moved, 11)
+        self.assertEqual(set(DoseLogArchive.objects.values_list("id", flat=True)), old_ids)
+        self.assertFalse(DoseLog.objects.filter(taken_at__lt=CUTOFF).exists())
+        self.assertEqual(DoseLog.objects.count(), 13)
+        self.assertEqual(self.rollup(), rollup)
+        self.assertEqual(archive_dose_logs(CUTOFF), 0)
+
+    def test_reads_are_unchanged_by_archiving(self):
+        requests = [
+            (reverse("doselog-list"), {}),
+            (reverse("doselog-filter-by-date"), {"start": "2025-12-02", "end": "2025-12-05"}),
+        ]
+        export = reverse("doselog-export")
+        before = [self.pages(url, params) for url, params in requests]
+        exported = b"".join(self.client.get(export, {"format": "csv"}).streaming_content)
+
+        archive_dose_logs(CUTOFF)
+
+        self.assertEqual([self.pages(url, params) for url, params in requests], before)
+        self.assertEqual(b"".join(self.client.get(export, {"format": "csv"}).streaming_content), exported)
+        self.assertEqual(len(before[0]), 24)
+
+    def test_retrieve_archived_log(self):
+        log = DoseLog.objects.order_by("taken_at").first()
+        archive_dose_logs(CUTOFF)
+
+        response = self.client.get(reverse("doselog-detail", args=[log.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], log.id)
+        self.assertEqual(response.data["medication"], log.medication_id)
+        self.assertEqual(
+            self.client.get(reverse("doselog-detail", args=[10**9])).status_code, status.HTTP_404_NOT_FOUND
+        )
+
+    def test_rebuild_counts_archived_logs(self):
+        rollup = self.rollup()
+        archive_dose_logs(CUTOFF)
+        DailyAdherence.objects.all().delete()
+
+        rebuild_daily_adherence()
+
+        self.assertEqual(self.rollup(), rollup)
+
+    def test_combined_values_list_merges_in_order(self):
+        archive_dose_logs(CUTOFF)
+        combined = CombinedDoseLogs().filter(medication_id=self.med.id).order_by("-taken_at", "id")
+
+        rows = list(combined.values_list("id", "taken_at"))
+
+        expected = list(DoseLog.objects.filter(medication=self.med).values_list("id", "taken_at"))
+        expected += DoseLogArchive.objects.filter(medication=self.med).values_list("id", "taken_at")
+        self.assertEqual(rows, sorted(expected, key=lambda row: row[1], reverse=True))
+        self.assertEqual(combined.values_list("id", "taken_at")[2:4], rows[2:4])
+
+    def test_log_changed_during_a_batch_is_not_lost(self):
+        # A log that only falls before the cutoff once the batch is copied.
+        first = DoseLog.objects.filter(taken_at__lt=CUTOFF).order_by("id").first()
+        DoseLog.objects.filter(pk=first.pk).update(taken_at=CUTOFF + timedelta(days=1))
+        changed = []
+
+        def change_between_copy_and_delete(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if sql.startswith("INSERT") and DoseLogArchive._meta.db_table in sql and not changed:
+                changed.append(DoseLog.objects.filter(pk=first.pk).update(taken_at=CUTOFF - timedelta(days=10)))
+            return result
+
+        with connection.execute_wrapper(change_between_copy_and_delete):
+            moved = archive_dose_logs(CUTOFF, batch_size=1000)
+
+        self.assertEqual(moved, 11)
+        self.assertTrue(DoseLogArchive.objects.filter(pk=first.pk).exists())
+
+    def test_live_ids_are_not_reused_after_archiving_everything(self):
+        archive_dose_logs(datetime(2030, 1, 1, tzinfo=timezone.utc))
+        self.assertFalse(DoseLog.objects.exists())
+
+        log = DoseLog.objects.create(medication=self.med, taken_at=CUTOFF)
+
+        self.assertGreater(log.pk, DoseLogArchive.objects.order_by("-id").values_list("id", flat=True).first())
+
+    def test_command_rejects_impossible_date(self):
+        with self.assertRaisesMessage(CommandError, "--before must be a valid date"):
+            call_command("archive_dose_logs", "--before", "2025-02-30", stdout=StringIO())
+
+    def test_command_dry_run_and_before(self):
+        out = StringIO()
+        call_command("archive_dose_logs", "--before", "2025-12-04", "--dry-run", stdout=out)
+        self.assertIn("11 dose logs", out.getvalue())
+        self.assertFalse(DoseLogArchive.objects.exists())
+
+        call_command("archive_dose_logs", "--before", "2025-12-04", stdout=out)
+        self.assertEqual(DoseLogArchive.objects.count(), 11)
+        self.assertEqual(DoseLogArchive.objects.latest("taken_at").taken_at.date(), date(2025, 12, 3))
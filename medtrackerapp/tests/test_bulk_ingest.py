@@ -0,0 +1,76 @@
+import json
+from unittest import mock
+
+from django.db import IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from medtrackerapp.models import Medication, DoseLog
+
+
+class DoseLogBulkCreateTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("doselog-bulk-create")
+        self.med = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        self.rows = [
+            {"medication": self.med.id, "taken_at": f"2025-12-0{day}T08:00:00Z", "was_taken": day % 2 == 0}
+            for day in range(1, 6)
+        ]
+
+    @override_settings(DOSE_LOG_BULK={"CHUNK_SIZE": 2, "MAX_ROWS": 100})
+    def test_bulk_create_json_array(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.rows, format="json")
+        sql = [query["sql"] for query in queries.captured_queries]
+        self.assertEqual(len([q for q in sql if q.startswith("SELECT") and 'FROM "medtrackerapp_medication"' in q]), 1)
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT INTO "medtrackerapp_doselog"')]), 3)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 5)
+        self.assertEqual(DoseLog.objects.count(), 5)
+        self.assertEqual(DoseLog.objects.filter(was_taken=True).count(), 2)
+
+    def test_bulk_create_ndjson(self):
+        body = "\n".join(json.dumps(row) for row in self.rows) + "\n"
+        response = self.client.generic("POST", self.url, body, content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(DoseLog.objects.count(), 5)
+        self.assertEqual(sorted(response.data["ids"]), sorted(DoseLog.objects.values_list("id", flat=True)))
+
+    def test_bulk_create_reports_row_errors(self):
+        rows = self.rows + [
+            {"medication": 999999, "taken_at": "2025-12-01T08:00:00Z"},
+            {"medication": self.med.id, "taken_at": "bad-date"},
+            "not-an-object",
+        ]
+        response = self.client.post(self.url, rows, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["errors"]
+        self.assertEqual([error["index"] for error in errors], [5, 6, 7])
+        self.assertIn("medication", errors[0]["errors"])
+        self.assertIn("taken_at", errors[1]["errors"])
+        self.assertEqual(DoseLog.objects.count(), 0)
+
+    def test_bulk_create_invalid_body(self):
+        for body in [[], {"medication": self.med.id}]:
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_idempotency_key(self):
+        headers = {"HTTP_IDEMPOTENCY_KEY": "gateway-batch-1"}
+        first = self.client.post(self.url, self.rows, format="json", **headers)
+        retry = self.client.post(self.url, self.rows, format="json", **headers)
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(DoseLog.objects.count(), 5)
+
+    @mock.patch("medtrackerapp.views.insert_dose_logs", side_effect=IntegrityError("FOREIGN KEY constraint failed"))
+    def test_bulk_create_row_integrity_error_is_not_taken_for_a_key_race(self, insert):
+        with self.assertRaisesMessage(IntegrityError, "FOREIGN KEY"):
+            self.client.post(self.url, self.rows, format="json", HTTP_IDEMPOTENCY_KEY="gateway-batch-2")
@@ -0,0 +1,68 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from medtrackerapp.models import Medication, DoseLog
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        self.other = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        self.log = DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        self.urls = [
+            reverse("medication-list"),
+            reverse("medication-detail", args=[self.med.id]),
+            reverse("doselog-filter-by-date") + "?start=2025-12-01&end=2025-12-02",
+        ]
+
+    def assertRevalidates(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", first)
+        self.assertIn("Last-Modified", first)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached["ETag"], first["ETag"])
+        return first["ETag"]
+
+    def test_unchanged_resources_return_304(self):
+        for url in self.urls:
+            self.assertRevalidates(url)
+
+    def test_dose_log_writes_invalidate(self):
+        etags = [self.assertRevalidates(url) for url in self.urls]
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-02T08:00:00Z", was_taken=False)
+        for url, etag in zip(self.urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etags = [self.assertRevalidates(url) for url in self.urls]
+        self.log.delete()
+        for url, etag in zip(self.urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_medication_writes_invalidate(self):
+        etags = [self.assertRevalidates(url) for url in self.urls[:2]]
+        response = self.client.patch(self.urls[1], {"name": "Aspirin EC"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for url, etag in zip(self.urls[:2], etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_other_medication_does_not_invalidate_detail(self):
+        etag = self.assertRevalidates(self.urls[1])
+        DoseLog.objects.create(medication=self.other, taken_at="2025-12-02T08:00:00Z")
+        response = self.client.get(self.urls[1], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_query_string_changes_etag(self):
+        first = self.client.get(self.urls[0])
+        paged = self.client.get(self.urls[0], {"page_size": 1})
+        self.assertNotEqual(first["ETag"], paged["ETag"])
+
+    def test_missing_medication_still_404(self):
+        response = self.client.get(reverse("medication-detail", args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
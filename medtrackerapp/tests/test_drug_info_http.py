@@ -0,0 +1,206 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+from medtrackerapp.services import (
+    AsyncDrugInfoService, CircuitBreaker, CircuitOpenError, DrugInfoService, DrugNotFoundError,
+)
+
+
+LABEL = {
+    "results": [{
+        "openfda": {"generic_name": ["Ibuprofen"], "manufacturer_name": ["McKesson"]},
+        "warnings": ["Keep out of reach of children."],
+        "purpose": ["Pain reliever"],
+    }]
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.client_address)
+        status = server.statuses.pop(0) if server.statuses else 200
+        body = json.dumps(LABEL if status == 200 else {"error": "stub"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if status == 429 and server.retry_after:
+            self.send_header("Retry-After", server.retry_after)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+HTTP_SETTINGS = {
+    "POOL_SIZE": 2,
+    "CONNECT_TIMEOUT": 1,
+    "READ_TIMEOUT": 1,
+    "MAX_RETRIES": 2,
+    "BACKOFF_FACTOR": 0,
+    "BACKOFF_MAX": 0,
+    "BREAKER_FAILURE_THRESHOLD": 2,
+    "BREAKER_RESET_TIMEOUT": 60,
+    "ASYNC_MAX_CONNECTIONS": 10,
+}
+
+
+@override_settings(DRUG_INFO_HTTP=HTTP_SETTINGS)
+class TestDrugInfoServiceHttp(SimpleTestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.statuses = []
+        self.server.requests = []
+        self.server.retry_after = None
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_port}/drug/label.json"
+        patcher = patch.object(DrugInfoService, "BASE_URL", url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        DrugInfoService.reset_session()
+        self.addCleanup(DrugInfoService.reset_session)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        for _ in range(3):
+            DrugInfoService.get_drug_info("Ibuprofen")
+        ports = {address[1] for address in self.server.requests}
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(ports), 1)
+
+    def test_retries_on_5xx_and_429(self):
+        self.server.statuses = [503, 429]
+        result = DrugInfoService.get_drug_info("Ibuprofen")
+        self.assertEqual(result["name"], "Ibuprofen")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_404_is_not_found(self):
+        self.server.statuses = [404]
+        with self.assertRaisesMessage(DrugNotFoundError, "No results found"):
+            DrugInfoService.get_drug_info("Ibuprofen")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retry_after_is_capped_at_backoff_max(self):
+        self.server.statuses = [429]
+        self.server.retry_after = "3600"
+        with override_settings(DRUG_INFO_HTTP={**HTTP_SETTINGS, "BACKOFF_MAX": 0.5}), \
+                patch("urllib3.util.retry.time.sleep") as sleep:
+            DrugInfoService.reset_session()
+            self.assertEqual(DrugInfoService.get_drug_info("Ibuprofen")["name"], "Ibuprofen")
+        sleep.assert_called_once_with(0.5)
+
+    def test_retries_are_bounded(self):
+        self.server.statuses = [500, 500, 500, 500]
+        with self.assertRaises(ValueError):
+            DrugInfoService.get_drug_info("Ibuprofen")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_breaker_opens_and_fails_fast(self):
+        self.server.statuses = [500] * 6
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                DrugInfoService.get_drug_info("Ibuprofen")
+        served = len(self.server.requests)
+
+        with self.assertRaises(CircuitOpenError):
+            DrugInfoService.get_drug_info("Ibuprofen")
+        self.assertEqual(len(self.server.requests), served)
+
+
+@override_settings(DRUG_INFO_HTTP=HTTP_SETTINGS)
+class TestAsyncDrugInfoServiceHttp(TestDrugInfoServiceHttp):
+
+    def lookup(self, drug_name):
+        async def run():
+            try:
+                return await AsyncDrugInfoService.get_drug_info(drug_name)
+            finally:
+                await AsyncDrugInfoService.aclose()
+        return asyncio.run(run())
+
+    def test_connections_are_reused(self):
+        async def run():
+            try:
+                for _ in range(3):
+                    await AsyncDrugInfoService.get_drug_info("Ibuprofen")
+            finally:
+                await AsyncDrugInfoService.aclose()
+        asyncio.run(run())
+        ports = {address[1] for address in self.server.requests}
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(ports), 1)
+
+    def test_retries_on_5xx_and_429(self):
+        self.server.statuses = [503, 429]
+        self.assertEqual(self.lookup("Ibuprofen")["name"], "Ibuprofen")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_404_is_not_found(self):
+        self.server.statuses = [404]
+        with self.assertRaisesMessage(DrugNotFoundError, "No results found"):
+            self.lookup("Ibuprofen")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retry_after_is_capped_at_backoff_max(self):
+        self.server.statuses = [429]
+        self.server.retry_after = "3600"
+        with override_settings(DRUG_INFO_HTTP={**HTTP_SETTINGS, "BACKOFF_MAX": 0.5}), \
+                patch("medtrackerapp.services.asyncio.sleep") as sleep:
+            self.assertEqual(self.lookup("Ibuprofen")["name"], "Ibuprofen")
+        sleep.assert_called_once_with(0.5)
+
+    def test_retries_are_bounded(self):
+        self.server.statuses = [500, 500, 500, 500]
+        with self.assertRaises(ValueError):
+            self.lookup("Ibuprofen")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_breaker_opens_and_fails_fast(self):
+        self.server.statuses = [500] * 6
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.lookup("Ibuprofen")
+        served = len(self.server.requests)
+
+        with self.assertRaises(CircuitOpenError):
+            self.lookup("Ibuprofen")
+        self.assertEqual(len(self.server.requests), served)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: self.now)
+
+    def test_half_open_probe_closes_on_success(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+        self.now = 10
+        self.breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_probe_reopens_on_failure(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.now = 10
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
@@ -0,0 +1,202 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import zipfile
+from io import StringIO
+from unittest import mock
+
+import requests
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+from medtrackerapp.druglabels import iter_label_records, lookup_label
+from medtrackerapp.models import DrugLabel
+from medtrackerapp.services import AsyncDrugInfoService, DrugInfoCache, DrugInfoService
+
+LABELS = [
+    {
+        "set_id": "set-ibu-old",
+        "effective_time": "20200101",
+        "openfda": {"generic_name": ["IBUPROFEN"], "manufacturer_name": ["Old Pharma"]},
+        "warnings": ["Old warning"],
+    },
+    {
+        "set_id": "set-ibu-new",
+        "effective_time": "20240101",
+        "openfda": {"generic_name": ["IBUPROFEN"], "manufacturer_name": ["McKesson"]},
+        "warnings": ["Stomach bleeding warning: {\"quoted\"} [brackets]"],
+        "purpose": ["Pain reliever/fever reducer"],
+    },
+    {
+        "set_id": "set-combo",
+        "effective_time": "20230101",
+        "openfda": {"generic_name": ["ACETAMINOPHEN", "Caffeine"], "manufacturer_name": ["Acme"]},
+    },
+    {"set_id": "set-unnamed", "openfda": {}},
+]
+
+
+def dump(records=LABELS):
+    # The real files carry a `results` object inside `meta` as well.
+    return json.dumps({
+        "meta": {"last_updated": "2025-01-01", "results": {"skip": 0, "limit": 2, "total": len(records)}},
+        "results": records,
+    }, indent=1)
+
+
+class LabelStreamTests(SimpleTestCase):
+    def test_streams_records_across_small_chunks(self):
+        records = list(iter_label_records(io.StringIO(dump()), chunk_size=7))
+
+        self.assertEqual(records, LABELS)
+
+    def test_empty_results(self):
+        self.assertEqual(list(iter_label_records(io.StringIO('{"meta": {}, "results": []}'))), [])
+
+    def test_malformed_file(self):
+        for text in ['["not", "an", "object"]', '{"results": [{"set_id": 1}, {"set_id"', '{"results": [1 2]}']:
+            with self.assertRaises(ValueError, msg=text):
+                list(iter_label_records(io.StringIO(text), chunk_size=4))
+
+
+class IngestDrugLabelsCommandTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(path, "w") as archive:
+                archive.writestr(name[:-len(".zip")], text)
+        elif name.endswith(".gz"):
+            with gzip.open(path, "wt", encoding="utf-8") as handle:
+                handle.write(text)
+        else:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+        return path
+
+    def ingest(self, *paths, **options):
+        out = StringIO()
+        call_command("ingest_drug_labels", *paths, stdout=out, **options)
+        return out.getvalue()
+
+    def test_ingest_zip_and_lookup(self):
+        output = self.ingest(self.write("drug-label-0001-of-0001.json.zip", dump()), batch_size=2)
+
+        self.assertIn("Read 4 labels, wrote 4 rows, skipped 1.", output)
+        self.assertEqual(lookup_label(" Ibuprofen "), {
+            "name": "IBUPROFEN",
+            "manufacturer": "McKesson",
+            "warnings": LABELS[1]["warnings"],
+            "purpose": ["Pain reliever/fever reducer"],
+        })
+        self.assertEqual(lookup_label("caffeine")["manufacturer"], "Acme")
+        self.assertEqual(lookup_label("acetaminophen")["warnings"], ["No warnings available"])
+        self.assertIsNone(lookup_label("aspirin"))
+
+    def test_reingest_updates_in_place(self):
+        self.ingest(self.write("a.json", dump()))
+        updated = [dict(LABELS[1], openfda={"generic_name": ["IBUPROFEN"], "manufacturer_name": ["Advil Inc"]})]
+        self.ingest(self.write("b.json.gz", dump(updated)))
+
+        self.assertEqual(DrugLabel.objects.filter(generic_name="ibuprofen").count(), 2)
+        self.assertEqual(lookup_label("ibuprofen")["manufacturer"], "Advil Inc")
+
+        self.ingest(self.directory.name, replace=True)
+        self.assertEqual(DrugLabel.objects.count(), 4)
+
+    def test_replace_removes_labels_missing_from_the_new_dump(self):
+        self.ingest(self.write("a.json", dump()))
+        updated = self.write("b.json", dump([LABELS[1]]))
+
+        output = self.ingest(updated, replace=True)
+
+        self.assertIn("Removed 3 labels missing from these dumps.", output)
+        self.assertEqual(list(DrugLabel.objects.values_list("set_id", flat=True)), ["set-ibu-new"])
+
+    def test_failed_replace_keeps_existing_labels(self):
+        self.ingest(self.write("a.json", dump()))
+        with self.assertRaises(CommandError):
+            self.ingest(self.write("b.json", dump([LABELS[1]])), self.write("c.json", '{"results": [{'), replace=True)
+
+        self.assertEqual(DrugLabel.objects.count(), 4)
+
+    def test_invalid_input(self):
+        with self.assertRaises(CommandError):
+            self.ingest(self.write("bad.json", '{"results": [{'))
+        with self.assertRaises(CommandError):
+            self.ingest(os.path.join(self.directory.name, "missing.json"))
+
+
+@override_settings(DRUG_LABEL_MIRROR={"ENABLED": True, "REMOTE_FALLBACK": True})
+class DrugInfoMirrorLookupTests(TestCase):
+    def setUp(self):
+        DrugLabel.objects.create(
+            generic_name="ibuprofen", set_id="s1", name="IBUPROFEN", manufacturer="McKesson",
+            warnings=["Warning"], purpose=["Pain"], effective_time="20240101",
+        )
+        self.remote = {"results": [{"openfda": {"generic_name": ["ASPIRIN"], "manufacturer_name": ["Bayer"]}}]}
+
+    def test_mirrored_name_skips_the_network(self):
+        with mock.patch.object(requests.Session, "get") as get:
+            info = DrugInfoService.get_drug_info("Ibuprofen")
+
+        get.assert_not_called()
+        self.assertEqual(info["manufacturer"], "McKesson")
+
+    def test_missing_name_falls_back_to_remote(self):
+        response = mock.Mock(status_code=200, json=mock.Mock(return_value=self.remote))
+        with mock.patch.object(DrugInfoService, "_request", return_value=response) as request:
+            info = DrugInfoService.get_drug_info("aspirin")
+
+        request.assert_called_once()
+        self.assertEqual(info["manufacturer"], "Bayer")
+
+    def test_air_gapped_miss_is_not_found(self):
+        with override_settings(DRUG_LABEL_MIRROR={"ENABLED": True, "REMOTE_FALLBACK": False}), \
+                mock.patch.object(DrugInfoService, "_request") as request:
+            with self.assertRaisesMessage(ValueError, "No results found"):
+                DrugInfoService.get_drug_info("aspirin")
+        request.assert_not_called()
+
+    def test_disabled_mirror_is_not_consulted(self):
+        response = mock.Mock(status_code=200, json=mock.Mock(return_value=self.remote))
+        with override_settings(DRUG_LABEL_MIRROR={"ENABLED": False}), \
+                mock.patch.object(DrugInfoService, "_request", return_value=response), \
+                self.assertNumQueries(0):
+            self.assertEqual(DrugInfoService.get_drug_info("ibuprofen")["name"], "ASPIRIN")
+
+    def test_batch_resolves_mirrored_names_in_one_query(self):
+        response = mock.Mock(status_code=200, json=mock.Mock(return_value=self.remote))
+        cache = DrugInfoCache(enabled=False)
+        # Worker threads would need their own connections; they must not touch the mirror.
+        with mock.patch("medtrackerapp.druglabels.lookup_label", side_effect=AssertionError) as lookup_label, \
+                mock.patch.object(DrugInfoService, "_request", return_value=response) as request, \
+                self.assertNumQueries(1):
+            info = cache.get_many(["Ibuprofen", "aspirin", "IBUPROFEN "])
+
+        self.assertEqual(info["ibuprofen"]["manufacturer"], "McKesson")
+        self.assertEqual(info["aspirin"]["manufacturer"], "Bayer")
+        request.assert_called_once()
+        lookup_label.assert_not_called()
+
+    def test_air_gapped_batch_reports_misses(self):
+        cache = DrugInfoCache(enabled=False)
+        with override_settings(DRUG_LABEL_MIRROR={"ENABLED": True, "REMOTE_FALLBACK": False}), \
+                mock.patch.object(DrugInfoService, "_request") as request:
+            info = cache.get_many(["ibuprofen", "aspirin"])
+
+        self.assertEqual(info["aspirin"], {"error": "No results found for this medication."})
+        self.assertEqual(info["ibuprofen"]["name"], "IBUPROFEN")
+        request.assert_not_called()
+
+    async def test_async_service_uses_mirror(self):
+        with mock.patch.object(AsyncDrugInfoService, "_request") as request:
+            info = await AsyncDrugInfoService.get_drug_info("ibuprofen")
+
+        request.assert_not_called()
+        self.assertEqual(info["name"], "IBUPROFEN")
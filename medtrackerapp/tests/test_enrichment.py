@@ -0,0 +1,192 @@
+from datetime import timedelta
+from unittest import mock
+
+import requests
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from medtrackerapp.enrichment import claim_jobs, enqueue, enqueue_stale, prune_jobs, run_pending
+from medtrackerapp.models import DrugInfoEnrichment, EnrichmentJob, Medication
+from medtrackerapp.services import DrugInfoService
+
+LABEL = {"name": "ibuprofen", "manufacturer": "McKesson", "warnings": [], "purpose": ["Pain reliever"]}
+ENABLED = {"ENABLED": True}
+
+
+@override_settings(DRUG_INFO_ENRICHMENT=ENABLED)
+class EnrichmentQueueTests(TestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+
+    def test_new_medication_is_queued_once(self):
+        self.assertEqual(EnrichmentJob.objects.filter(medication=self.med, status="pending").count(), 1)
+        self.assertEqual(enqueue([self.med.id]), 0)
+
+    def test_rename_queues_refresh_but_dosage_change_does_not(self):
+        EnrichmentJob.objects.all().delete()
+        self.med.dosage_mg = 400
+        self.med.save()
+        self.assertFalse(EnrichmentJob.objects.exists())
+
+        self.med.name = "Advil"
+        self.med.save()
+        self.assertTrue(EnrichmentJob.objects.filter(medication=self.med, status="pending").exists())
+
+    @mock.patch("medtrackerapp.enrichment.DrugInfoService.get_drug_info", return_value=LABEL)
+    def test_worker_stores_label(self, get_drug_info):
+        self.assertEqual(run_pending(), 1)
+
+        stored = DrugInfoEnrichment.objects.get(medication=self.med)
+        self.assertEqual(stored.data, LABEL)
+        self.assertEqual(stored.name, "Ibuprofen")
+        self.assertEqual(EnrichmentJob.objects.get().status, "done")
+        get_drug_info.assert_called_once_with("Ibuprofen")
+
+    @mock.patch(
+        "medtrackerapp.enrichment.DrugInfoService.get_drug_info", side_effect=requests.exceptions.Timeout("slow")
+    )
+    def test_failures_back_off_then_fail(self, get_drug_info):
+        with self.settings(DRUG_INFO_ENRICHMENT={**ENABLED, "MAX_ATTEMPTS": 2, "RETRY_BACKOFF": 60}), \
+                self.assertLogs("medtrackerapp.enrichment", "WARNING") as logs:
+            run_pending()
+            job = EnrichmentJob.objects.get()
+            self.assertEqual((job.status, job.attempts), ("pending", 1))
+            self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=30))
+            self.assertEqual(claim_jobs(10), [])
+
+            EnrichmentJob.objects.update(run_after=timezone.now())
+            run_pending()
+        self.assertEqual([record.getMessage() for record in logs.records], [
+            f"Enrichment of medication {self.med.id} failed (attempt 1): slow",
+            f"Enrichment of medication {self.med.id} failed (attempt 2): slow",
+        ])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.last_error), ("failed", "slow"))
+        self.assertFalse(DrugInfoEnrichment.objects.exists())
+
+    @mock.patch.object(DrugInfoService, "_request", return_value=mock.Mock(status_code=404))
+    def test_openfda_404_is_stored_without_retrying(self, request):
+        with self.assertNoLogs("medtrackerapp.enrichment", "WARNING"):
+            run_pending()
+
+        self.assertEqual(EnrichmentJob.objects.get().status, "done")
+        stored = DrugInfoEnrichment.objects.get(medication=self.med)
+        self.assertEqual((stored.data, stored.error), ({}, "No results found for this medication."))
+        request.assert_called_once()
+
+    def test_failed_medication_is_not_requeued_until_refresh_after(self):
+        EnrichmentJob.objects.update(status="failed", locked_at=timezone.now())
+
+        self.assertEqual(enqueue([self.med.id]), 0)
+        self.assertEqual(enqueue_stale(), 0)
+
+        EnrichmentJob.objects.update(locked_at=timezone.now() - timedelta(days=2))
+        self.assertEqual(enqueue([self.med.id]), 1)
+
+    def test_rename_requeues_a_failed_medication(self):
+        EnrichmentJob.objects.update(status="failed", locked_at=timezone.now())
+        self.med.name = "Advil"
+        self.med.save()
+
+        self.assertTrue(EnrichmentJob.objects.filter(medication=self.med, status="pending").exists())
+
+    def test_prune_jobs(self):
+        other = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=1)
+        third = Medication.objects.create(name="Advil", dosage_mg=100, prescribed_per_day=1)
+        EnrichmentJob.objects.filter(medication=self.med).update(status="done")
+        EnrichmentJob.objects.filter(medication=other).update(status="failed", locked_at=timezone.now())
+        EnrichmentJob.objects.filter(medication=third).update(
+            status="failed", locked_at=timezone.now() - timedelta(days=2)
+        )
+
+        self.assertEqual(prune_jobs(), 2)
+        self.assertEqual(list(EnrichmentJob.objects.values_list("medication_id", flat=True)), [other.id])
+
+    def test_claimed_job_is_not_claimed_twice(self):
+        self.assertEqual(len(claim_jobs(10)), 1)
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_abandoned_running_job_is_reclaimed(self):
+        claim_jobs(10)
+        later = timezone.now() + timedelta(seconds=600)
+        self.assertEqual(len(claim_jobs(10, now=later)), 1)
+
+    def test_stale_entries_are_queued(self):
+        EnrichmentJob.objects.all().delete()
+        DrugInfoEnrichment.objects.create(
+            medication=self.med, name=self.med.name, data=LABEL, fetched_at=timezone.now() - timedelta(days=2)
+        )
+        self.assertEqual(enqueue_stale(), 1)
+
+    @mock.patch("medtrackerapp.enrichment.DrugInfoService.get_drug_info", return_value=LABEL)
+    def test_worker_command_once(self, get_drug_info):
+        call_command("enrichment_worker", "--once")
+        self.assertTrue(DrugInfoEnrichment.objects.filter(medication=self.med).exists())
+
+        call_command("enrichment_worker", "--once")
+        self.assertFalse(EnrichmentJob.objects.exists())
+
+
+@override_settings(DRUG_INFO_ENRICHMENT=ENABLED)
+class EnrichedInfoEndpointTests(APITestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        self.url = reverse("medication-get-external-info", args=[self.med.id])
+
+    @mock.patch("medtrackerapp.services.DrugInfoService.get_drug_info")
+    def test_missing_data_is_accepted_without_calling_openfda(self, get_drug_info):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 202)
+        get_drug_info.assert_not_called()
+
+    def test_fresh_data_is_served_from_store(self):
+        DrugInfoEnrichment.objects.create(medication=self.med, name=self.med.name, data=LABEL, fetched_at=timezone.now())
+        EnrichmentJob.objects.all().delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"], LABEL)
+        self.assertFalse(response.data["stale"])
+        self.assertFalse(EnrichmentJob.objects.exists())
+
+    def test_stale_data_is_served_and_refresh_queued(self):
+        DrugInfoEnrichment.objects.create(
+            medication=self.med, name=self.med.name, data=LABEL, fetched_at=timezone.now() - timedelta(days=2)
+        )
+        EnrichmentJob.objects.all().delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["stale"])
+        self.assertEqual(EnrichmentJob.objects.filter(status="pending").count(), 1)
+
+    def test_recent_failure_is_not_requeued_by_reads(self):
+        EnrichmentJob.objects.update(status="failed", locked_at=timezone.now())
+
+        for _ in range(2):
+            self.assertEqual(self.client.get(self.url).status_code, 202)
+        self.assertFalse(EnrichmentJob.objects.filter(status="pending").exists())
+
+    def test_stored_error_returns_502(self):
+        DrugInfoEnrichment.objects.create(
+            medication=self.med, name=self.med.name, error="No results found for this medication.",
+            fetched_at=timezone.now(),
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 502)
+
+    @override_settings(DRUG_INFO_ENRICHMENT={"ENABLED": False})
+    @mock.patch("medtrackerapp.models.Medication.fetch_external_info", return_value=LABEL)
+    def test_disabled_enrichment_fetches_live(self, fetch):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, LABEL)
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from medtrackerapp.models import Medication, DoseLog
+
+
+class DoseLogExportTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("doselog-export")
+        self.med = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        self.other = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=1)
+        self.first = DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z", was_taken=True)
+        self.second = DoseLog.objects.create(medication=self.med, taken_at="2025-12-02T08:00:00Z", was_taken=False)
+        DoseLog.objects.create(medication=self.other, taken_at="2025-12-03T08:00:00Z")
+
+    def read(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        response = self.client.get(self.url, {"format": "csv", "medication": self.med.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertEqual(self.read(response).splitlines(), [
+            "id,medication,taken_at,was_taken",
+            f"{self.second.id},{self.med.id},2025-12-02T08:00:00Z,False",
+            f"{self.first.id},{self.med.id},2025-12-01T08:00:00Z,True",
+        ])
+
+    def test_export_ndjson_with_date_range(self):
+        response = self.client.get(self.url, {"format": "ndjson", "start": "2025-12-01", "end": "2025-12-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(rows, [{
+            "id": self.first.id, "medication": self.med.id,
+            "taken_at": "2025-12-01T08:00:00Z", "was_taken": True,
+        }])
+
+    def test_export_matches_list_representation(self):
+        listed = self.client.get(reverse("doselog-list")).data["results"]
+        exported = self.client.get(self.url, {"format": "ndjson"})
+        rows = [json.loads(line) for line in self.read(exported).splitlines()]
+        self.assertEqual(rows, [dict(row) for row in listed])
+
+    def test_export_invalid_params(self):
+        for params in [{"start": "bad-date"}, {"end": "2025-02-30"}, {"medication": "abc"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_command_rejects_impossible_date(self):
+        with self.assertRaisesMessage(CommandError, "--start must be a valid date"):
+            call_command("export_dose_logs", "--start", "2025-02-30")
+
+    def test_export_command_writes_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs.csv")
+            call_command("export_dose_logs", "--format", "csv", "--chunk-size", "1", "-o", path)
+            with open(path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0], "id,medication,taken_at,was_taken")
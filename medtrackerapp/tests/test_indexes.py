@@ -0,0 +1,48 @@
+import unittest
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from medtrackerapp.models import Medication, DoseLog, DoctorsNote, day_range
+from medtrackerapp.search import search_notes
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "EXPLAIN index checks require Postgres")
+class DoseLogIndexUsageTests(TestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        with connection.cursor() as cursor:
+            # The tables are tiny, so force the planner to consider indexes.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        self.start, self.end = day_range(date(2025, 12, 1), date(2025, 12, 7))
+
+    def test_period_query_uses_composite_index(self):
+        plan = self.med.doselog_set.filter(taken_at__gte=self.start, taken_at__lt=self.end).explain()
+        self.assertIn("doselog_med_taken_at_idx", plan)
+
+    def test_taken_count_uses_partial_index(self):
+        plan = self.med.doselog_set.filter(
+            taken_at__gte=self.start, taken_at__lt=self.end, was_taken=True
+        ).explain()
+        self.assertIn("doselog_med_taken_true_idx", plan)
+
+    def test_date_filter_uses_taken_at_index(self):
+        plan = DoseLog.objects.filter(taken_at__gte=self.start, taken_at__lt=self.end).explain()
+        self.assertIn("doselog_taken_at_id_idx", plan)
+
+    def test_note_search_uses_gin_index(self):
+        DoctorsNote.objects.create(medication=self.med, content="Interaction with warfarin")
+        plan = search_notes("warfarin").explain()
+        self.assertIn("doctorsnote_search_idx", plan)
+
+
+class DayRangeTests(TestCase):
+    def test_day_range_is_half_open(self):
+        med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        DoseLog.objects.create(medication=med, taken_at="2025-12-01T00:00:00Z")
+        DoseLog.objects.create(medication=med, taken_at="2025-12-02T23:59:59Z")
+        DoseLog.objects.create(medication=med, taken_at="2025-12-03T00:00:00Z")
+
+        start, end = day_range(date(2025, 12, 1), date(2025, 12, 2))
+        self.assertEqual(DoseLog.objects.filter(taken_at__gte=start, taken_at__lt=end).count(), 2)
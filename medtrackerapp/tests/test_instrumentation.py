@@ -0,0 +1,72 @@
+from unittest import mock
+
+import requests
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from medtrackerapp.instrumentation import metrics_registry
+from medtrackerapp.models import DoseLog, Medication
+from medtrackerapp.services import DrugInfoService, get_drug_info_cache
+
+
+def server_timing(response):
+    parts = {}
+    for item in response["Server-Timing"].split(", "):
+        name, *params = item.split(";")
+        parts[name] = dict(param.split("=", 1) for param in params)
+    return parts
+
+
+class PerformanceMiddlewareTests(APITestCase):
+    def setUp(self):
+        metrics_registry.clear()
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+
+    def test_server_timing_reports_db_queries(self):
+        response = self.client.get(reverse("doselog-list"))
+
+        timing = server_timing(response)
+        self.assertEqual(set(timing), {"app", "db", "serialize", "drug-info"})
+        self.assertEqual(timing["db"]["desc"], '"2 queries"')
+        self.assertGreater(float(timing["serialize"]["dur"]), 0)
+
+    def test_drug_info_time_is_recorded(self):
+        self.addCleanup(get_drug_info_cache().clear)
+        self.addCleanup(DrugInfoService.reset_session)
+        get_drug_info_cache().clear()
+        fake = mock.Mock(status_code=200, json=mock.Mock(return_value={"results": []}))
+        with mock.patch.object(requests.Session, "get", return_value=fake) as get:
+            response = self.client.get(reverse("medication-get-external-info-batch"), {"ids": self.med.id})
+
+        self.assertTrue(get.called)
+        self.assertIn("drug-info;dur=", response["Server-Timing"])
+
+    def test_metrics_endpoint_exports_histograms(self):
+        self.client.get(reverse("doselog-list"))
+        self.client.get(reverse("doselog-list"))
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn('medtracker_requests_total{view="doselog-list",method="GET",status="200"} 2', body)
+        self.assertIn('medtracker_db_queries_bucket{view="doselog-list",method="GET",le="2"} 2', body)
+        self.assertIn('medtracker_request_duration_seconds_count{view="doselog-list",method="GET"} 2', body)
+
+    def test_metrics_endpoint_counts_connections(self):
+        before = metrics_registry.connection_counts().get("default", 0)
+        connection_created.send(sender=type(connection), connection=connection)
+
+        self.assertEqual(metrics_registry.connection_counts()["default"], before + 1)
+        self.assertIn('medtracker_db_connections_total{alias="default"}', self.client.get(reverse("metrics")).content.decode())
+
+    @override_settings(PERF_METRICS={"SAMPLE_RATE": 0.0})
+    def test_unsampled_requests_are_not_instrumented(self):
+        response = self.client.get(reverse("doselog-list"))
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertNotIn("doselog-list", metrics_registry.expose())
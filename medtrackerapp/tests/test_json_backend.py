@@ -0,0 +1,70 @@
+import io
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from medtrackerapp.models import DoseLog, Medication
+from medtrackerapp.parsers import FastJSONParser
+from medtrackerapp.renderers import FastJSONRenderer
+
+PAYLOAD = {
+    "results": [
+        {"id": 1, "taken_at": datetime(2025, 12, 1, 8, 0, 0, 123456, tzinfo=dt_timezone.utc), "was_taken": True},
+        {"id": 2, "day": date(2025, 12, 1), "dose": Decimal("2.50"), "rate": 66.67, "note": "a\u2028b\u2029 ü"},
+    ],
+    "next": None,
+    "counts": {1: 2},
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_stock_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    @override_settings(JSON_BACKEND="json")
+    def test_stdlib_fallback_matches_stock_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    def test_indented_output_uses_stock_renderer(self):
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD, media_type), JSONRenderer().render(PAYLOAD, media_type)
+        )
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def test_parses_like_stock_parser(self):
+        body = b'[{"medication": 1, "taken_at": "2025-12-01T08:00:00Z", "note": "\\u00fc"}]'
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        for body in [b"{", b'{"rate": NaN}']:
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+
+class FastJSONApiTests(APITestCase):
+    def test_bulk_ingest_and_list_round_trip(self):
+        med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        response = self.client.post(
+            reverse("doselog-bulk-create"),
+            data=f'[{{"medication": {med.id}, "taken_at": "2025-12-01T08:00:00Z"}}]',
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(DoseLog.objects.count(), 1)
+
+        response = self.client.get(reverse("doselog-list"))
+        self.assertEqual(response.json()["results"][0]["taken_at"], "2025-12-01T08:00:00Z")
+
+    def test_malformed_body_returns_400(self):
+        response = self.client.post(reverse("medication-list"), data="{", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -21,6 +23,12 @@ class MedicationExpectedDosesTest(APITestCase):
         self.assertEqual(response.data['days'], 2)
         self.assertEqual(response.data['expected_doses'], 4)
 
+    def test_expected_doses_skips_adherence_aggregate(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'days': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("dailyadherence", queries[0]["sql"].lower())
 
     def test_expected_doses_invalid_days(self):
         response = self.client.get(self.url, {'days': -1})
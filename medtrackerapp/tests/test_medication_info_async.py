@@ -0,0 +1,99 @@
+import json
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from medtrackerapp.models import DrugInfoEnrichment, EnrichmentJob, Medication
+from medtrackerapp.services import get_drug_info_cache
+from medtrackerapp.views import medication_info_async
+
+
+class MedicationInfoAsyncViewTest(TestCase):
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.medication = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        self.clear_drug_info_cache()
+        self.addCleanup(self.clear_drug_info_cache)
+
+    @staticmethod
+    def clear_drug_info_cache():
+        caches["default"].clear()
+        get_drug_info_cache().clear()
+
+    @patch("medtrackerapp.services.AsyncDrugInfoService.get_drug_info", new_callable=AsyncMock)
+    async def test_info_success(self, mock_lookup):
+        mock_lookup.return_value = {"name": "Ibuprofen"}
+        request = self.factory.get(f"/api/medications/{self.medication.id}/info/")
+        response = await medication_info_async(request, pk=self.medication.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {"name": "Ibuprofen"})
+        mock_lookup.assert_awaited_once_with("ibuprofen")
+
+    @patch("medtrackerapp.services.AsyncDrugInfoService.get_drug_info", new_callable=AsyncMock)
+    async def test_info_upstream_error(self, mock_lookup):
+        mock_lookup.side_effect = ValueError("OpenFDA API error: 500")
+        request = self.factory.get(f"/api/medications/{self.medication.id}/info/")
+        response = await medication_info_async(request, pk=self.medication.id)
+
+        self.assertEqual(response.status_code, 502)
+        self.assertIn("error", json.loads(response.content))
+
+    async def test_info_not_found(self):
+        request = self.factory.get("/api/medications/999999/info/")
+        response = await medication_info_async(request, pk=999999)
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(DRUG_INFO_ENRICHMENT={"ENABLED": True})
+class MedicationInfoAsyncEnrichedTest(TestCase):
+    """With enrichment on, the async view answers exactly like the DRF action."""
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.medication = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        EnrichmentJob.objects.all().delete()
+
+    async def get(self):
+        request = self.factory.get(f"/api/medications/{self.medication.id}/info/")
+        return await medication_info_async(request, pk=self.medication.id)
+
+    @patch("medtrackerapp.services.AsyncDrugInfoService.get_drug_info", new_callable=AsyncMock)
+    async def test_missing_data_is_accepted_and_queued(self, mock_lookup):
+        response = await self.get()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(json.loads(response.content), {"status": "pending"})
+        self.assertEqual(await EnrichmentJob.objects.filter(medication=self.medication).acount(), 1)
+        mock_lookup.assert_not_awaited()
+
+    def test_stored_data_matches_drf_action(self):
+        DrugInfoEnrichment.objects.create(
+            medication=self.medication, name=self.medication.name, data={"name": "ibuprofen"},
+            fetched_at=timezone.now() - timedelta(days=2),
+        )
+        drf = self.client.get(reverse("medication-get-external-info", args=[self.medication.id]))
+        EnrichmentJob.objects.all().delete()
+
+        response = async_to_sync(self.get)()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), drf.json())
+        self.assertTrue(json.loads(response.content)["stale"])
+        self.assertTrue(EnrichmentJob.objects.filter(medication=self.medication).exists())
+
+    async def test_stored_error_returns_502(self):
+        await DrugInfoEnrichment.objects.acreate(
+            medication=self.medication, name=self.medication.name, error="No results found for this medication.",
+            fetched_at=timezone.now(),
+        )
+
+        response = await self.get()
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(json.loads(response.content)["error"], "No results found for this medication.")
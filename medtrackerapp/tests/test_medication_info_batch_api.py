@@ -0,0 +1,61 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from medtrackerapp.models import Medication
+from medtrackerapp.services import get_drug_info_cache
+
+
+def slow_lookup(drug_name):
+    time.sleep(0.2)
+    if drug_name == "unknown":
+        raise ValueError("No results found for this medication.")
+    return {"name": drug_name}
+
+
+class MedicationInfoBatchTest(APITestCase):
+
+    def setUp(self):
+        self.clear_drug_info_cache()
+        self.addCleanup(self.clear_drug_info_cache)
+        self.url = reverse("medication-get-external-info-batch")
+        self.meds = [
+            Medication.objects.create(name=name, dosage_mg=100, prescribed_per_day=1)
+            for name in ["Aspirin", "aspirin ", "Ibuprofen", "Paracetamol", "Unknown"]
+        ]
+
+    @staticmethod
+    def clear_drug_info_cache():
+        caches["default"].clear()
+        get_drug_info_cache().clear()
+
+    @patch("medtrackerapp.services.DrugInfoService.get_drug_info", side_effect=slow_lookup)
+    def test_batch_returns_per_id_results(self, mock_lookup):
+        ids = ",".join(str(med.id) for med in self.meds)
+        response = self.client.get(self.url, {"ids": ids + ",999999"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(results[str(self.meds[0].id)], {"name": "aspirin"})
+        self.assertEqual(results[str(self.meds[1].id)], {"name": "aspirin"})
+        self.assertIn("error", results[str(self.meds[4].id)])
+        self.assertIn("error", results["999999"])
+        self.assertEqual(mock_lookup.call_count, 4)
+
+    @patch("medtrackerapp.services.DrugInfoService.get_drug_info", side_effect=slow_lookup)
+    def test_batch_lookups_run_concurrently(self, mock_lookup):
+        ids = ",".join(str(med.id) for med in self.meds)
+        started = time.perf_counter()
+        response = self.client.get(self.url, {"ids": ids})
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLess(elapsed, 0.2 * 4 * 0.75)
+
+    def test_batch_invalid_ids(self):
+        for params in [{}, {"ids": ""}, {"ids": "1,abc"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
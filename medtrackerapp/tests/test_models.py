@@ -103,7 +103,7 @@ class MedicationModelTests(TestCase):
 # tests for fetch_external_info method in Medication model
     def test_fetch_external_info_exception(self):
         med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
-        with patch("medtrackerapp.models.DrugInfoService.get_drug_info") as mock_service:
+        with patch("medtrackerapp.services.DrugInfoService.get_drug_info") as mock_service:
             mock_service.side_effect = Exception("API down")
             result = med.fetch_external_info()
             self.assertEqual(result, {"error": "API down"})
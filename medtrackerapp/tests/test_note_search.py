@@ -0,0 +1,82 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from medtrackerapp.models import Medication, DoctorsNote
+from medtrackerapp.search import search_notes
+
+
+class DoctorsNoteSearchTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("doctors_notes-search")
+        self.med = Medication.objects.create(name="Warfarin", dosage_mg=5, prescribed_per_day=1)
+        self.other = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=1)
+        self.strong = DoctorsNote.objects.create(
+            medication=self.med, content="Interaction with aspirin: bleeding risk. Aspirin interactions are serious."
+        )
+        self.weak = DoctorsNote.objects.create(
+            medication=self.med, content="Avoid grapefruit juice; possible interaction with several foods and drugs."
+        )
+        self.unrelated = DoctorsNote.objects.create(medication=self.other, content="Take with food in the morning.")
+
+    def ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [note["id"] for note in response.data["results"]]
+
+    def test_results_are_ranked(self):
+        response = self.client.get(self.url, {"q": "interaction aspirin"})
+
+        self.assertEqual(self.ids(response), [self.strong.id])
+        self.assertEqual(set(response.data["results"][0]), {"id", "medication", "content", "created_at", "rank"})
+
+        response = self.client.get(self.url, {"q": "interaction"})
+        self.assertEqual(self.ids(response), [self.strong.id, self.weak.id])
+        self.assertGreater(response.data["results"][0]["rank"], response.data["results"][1]["rank"])
+
+    def test_matches_stemmed_terms_and_ignores_syntax(self):
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": "Interactions"})), [self.strong.id, self.weak.id])
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": 'grapefruit" -(juice*'})), [self.weak.id])
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": "!!!"})), [])
+
+    def test_index_follows_creates_and_deletes(self):
+        note = DoctorsNote.objects.create(medication=self.other, content="Check for interaction with ibuprofen.")
+        self.assertIn(note.id, self.ids(self.client.get(self.url, {"q": "ibuprofen"})))
+
+        self.client.delete(reverse("doctors_notes-detail", args=[note.id]))
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": "ibuprofen"})), [])
+
+        self.med.delete()
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": "interaction"})), [])
+
+    def test_medication_and_date_filters(self):
+        DoctorsNote.objects.filter(id=self.weak.id).update(created_at="2025-11-01T12:00:00Z")
+        DoctorsNote.objects.create(medication=self.other, content="No interaction with warfarin observed.")
+
+        response = self.client.get(self.url, {"q": "interaction", "medication": self.med.id})
+        self.assertEqual(self.ids(response), [self.strong.id, self.weak.id])
+
+        response = self.client.get(self.url, {"q": "interaction", "start": "2025-10-31", "end": "2025-11-01"})
+        self.assertEqual(self.ids(response), [self.weak.id])
+
+    def test_pagination(self):
+        for i in range(5):
+            DoctorsNote.objects.create(medication=self.other, content=f"Dose note {i}")
+
+        first = self.client.get(self.url, {"q": "dose note", "page_size": 3})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual(first.data["count"], 5)
+        self.assertEqual(len(set(self.ids(first)) | set(self.ids(second))), 5)
+        self.assertIsNone(second.data["next"])
+
+    def test_invalid_parameters(self):
+        for params in [{}, {"q": " "}, {"q": "x", "start": "bad"}, {"q": "x", "end": "2025-02-30"},
+                       {"q": "x", "medication": "one"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn("error", response.data)
+
+    def test_search_notes_returns_queryset(self):
+        notes = search_notes("bleeding")
+
+        self.assertEqual([note.id for note in notes], [self.strong.id])
+        self.assertGreater(notes[0].rank, 0)
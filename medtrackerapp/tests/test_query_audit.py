@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from medtrackerapp.models import Medication
+from medtrackerapp.query_audit import QueryBudgetMixin, QueryRecorder, query_shape
+
+
+class QueryAuditTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.meds = [
+            Medication.objects.create(name=f"Med {i}", dosage_mg=100, prescribed_per_day=1) for i in range(3)
+        ]
+
+    def test_per_row_queries_are_flagged(self):
+        with QueryRecorder() as recorder:
+            for med in self.meds:
+                med.adherence_rate()
+
+        self.assertEqual(list(recorder.repeated_shapes().values()), [3])
+
+    def test_same_query_with_same_params_is_not_flagged(self):
+        with QueryRecorder() as recorder:
+            for _ in range(3):
+                self.meds[0].adherence_rate()
+
+        self.assertEqual(recorder.repeated_shapes(), {})
+
+    def test_in_lists_of_any_length_share_a_shape(self):
+        self.assertEqual(query_shape('WHERE "id" IN (%s)'), query_shape('WHERE "id" IN (%s, %s, %s)'))
+
+    def test_budget_failure(self):
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(1):
+                list(Medication.objects.all())
+                list(Medication.objects.all())
+
+    def test_n_plus_one_failure(self):
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(10):
+                for med in self.meds:
+                    med.adherence_rate()
@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from medtrackerapp.models import DoseLog, Medication
+from medtrackerapp.response_cache import MedicationResponseCache, get_medication_response_cache
+
+
+class MedicationResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.response_cache = get_medication_response_cache()
+        self.response_cache.reset_stats()
+        self.aspirin = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        self.ibuprofen = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=1)
+        DoseLog.objects.create(medication=self.aspirin, taken_at="2025-12-01T08:00:00Z", was_taken=True)
+
+    def test_second_list_is_served_from_cache(self):
+        url = reverse("medication-list")
+        first = self.client.get(url)
+        second = self.client.get(url)
+
+        self.assertEqual(first.data, second.data)
+        stats = self.response_cache.stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_dose_log_write_invalidates_only_its_medication(self):
+        url = reverse("medication-list")
+        self.client.get(url)
+        DoseLog.objects.create(medication=self.aspirin, taken_at="2025-12-01T20:00:00Z", was_taken=False)
+        self.response_cache.reset_stats()
+
+        response = self.client.get(url)
+
+        by_name = {item["name"]: item for item in response.data}
+        self.assertEqual(by_name["Aspirin"]["adherence"], 50.0)
+        self.assertEqual(self.response_cache.stats()["misses"], 1)
+        self.assertEqual(self.response_cache.stats()["hits"], 1)
+
+    def test_medication_update_is_visible_on_detail(self):
+        url = reverse("medication-detail", args=[self.ibuprofen.id])
+        self.client.get(url)
+        self.client.patch(url, {"dosage_mg": 400}, format="json")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["dosage_mg"], 400)
+
+    def test_stale_version_is_not_served_without_signal(self):
+        self.client.get(reverse("medication-list"))
+        Medication.objects.filter(pk=self.ibuprofen.pk).update(name="Advil")
+        Medication.objects.filter(pk=self.ibuprofen.pk).touch()
+
+        response = self.client.get(reverse("medication-detail", args=[self.ibuprofen.id]))
+
+        self.assertEqual(response.data["name"], "Advil")
+
+    def test_disabled_cache_serializes_directly(self):
+        disabled = MedicationResponseCache(enabled=False)
+        with override_settings(MEDICATION_RESPONSE_CACHE={"ENABLED": False}):
+            self.assertFalse(MedicationResponseCache.from_settings().enabled)
+        with mock.patch("medtrackerapp.views.get_medication_response_cache", return_value=disabled):
+            response = self.client.get(reverse("medication-list"))
+
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(disabled.stats()["hits"] + disabled.stats()["misses"], 0)
@@ -0,0 +1,104 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.cache import cache
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from medtrackerapp.ingest import insert_dose_logs
+from medtrackerapp.models import Medication, DoseLog, DailyAdherence
+
+
+class DailyAdherenceRollupTests(TestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+
+    def counts(self, medication=None):
+        return {
+            row.day: (row.taken_count, row.missed_count)
+            for row in DailyAdherence.objects.filter(medication=medication or self.med)
+        }
+
+    def test_create_updates_rollup(self):
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z", was_taken=True)
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T20:00:00Z", was_taken=False)
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (1, 1)})
+
+    def test_update_moves_counts(self):
+        log = DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z", was_taken=True)
+        other = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=1)
+
+        log.was_taken = False
+        log.save()
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (0, 1)})
+
+        log.medication = other
+        log.taken_at = "2025-12-02T08:00:00Z"
+        log.save()
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (0, 0)})
+        self.assertEqual(self.counts(other), {date(2025, 12, 2): (0, 1)})
+
+    def test_delete_updates_rollup(self):
+        log = DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T20:00:00Z")
+        log.delete()
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (1, 0)})
+
+    def test_medication_delete_cascades(self):
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        self.med.delete()
+        self.assertEqual(DailyAdherence.objects.count(), 0)
+
+    def test_bulk_insert_updates_rollup(self):
+        insert_dose_logs([
+            DoseLog(medication=self.med, taken_at="2025-12-01T08:00:00Z", was_taken=True),
+            DoseLog(medication=self.med, taken_at="2025-12-01T20:00:00Z", was_taken=True),
+            DoseLog(medication=self.med, taken_at="2025-12-02T08:00:00Z", was_taken=False),
+        ], chunk_size=2)
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (2, 0), date(2025, 12, 2): (0, 1)})
+
+    def test_rebuild_command_repairs_drift(self):
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-05T08:00:00Z")
+        DoseLog.objects.filter(taken_at__day=1).update(was_taken=False)  # bypasses signals
+        DailyAdherence.objects.filter(day=date(2025, 12, 5)).update(taken_count=7)
+
+        call_command("rebuild_daily_adherence", "--start", "2025-12-01", "--end", "2025-12-01", stdout=StringIO())
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (0, 1), date(2025, 12, 5): (7, 0)})
+
+        call_command("rebuild_daily_adherence", stdout=StringIO())
+        self.assertEqual(self.counts(), {date(2025, 12, 1): (0, 1), date(2025, 12, 5): (1, 0)})
+
+    def test_rebuild_refreshes_cached_medication_responses(self):
+        cache.clear()
+        other = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=1)
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-01T08:00:00Z")
+        DoseLog.objects.create(medication=other, taken_at="2025-12-01T08:00:00Z")
+        url = reverse("medication-list")
+        first = self.client.get(url)
+        self.assertEqual([med["adherence"] for med in first.json()], [100.0, 100.0])
+        other.refresh_from_db()
+
+        DoseLog.objects.filter(medication=self.med).update(was_taken=False)  # bypasses signals
+        call_command("rebuild_daily_adherence", stdout=StringIO())
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([med["adherence"] for med in response.json()], [0.0, 100.0])
+        # Medications whose counts did not change keep their version (and cache entries).
+        self.assertEqual(Medication.objects.get(pk=other.pk).version, other.version)
+
+    def test_rebuild_command_rejects_impossible_date(self):
+        with self.assertRaisesMessage(CommandError, "--end must be a valid date"):
+            call_command("rebuild_daily_adherence", "--end", "2025-02-30", stdout=StringIO())
+
+    def test_adherence_methods_read_rollup(self):
+        for day in range(1, 4):
+            DoseLog.objects.create(medication=self.med, taken_at=f"2025-12-0{day}T08:00:00Z", was_taken=True)
+            DoseLog.objects.create(medication=self.med, taken_at=f"2025-12-0{day}T20:00:00Z", was_taken=day != 2)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.med.adherence_rate_over_period(date(2025, 12, 1), date(2025, 12, 3)), 83.33)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.med.adherence_rate(), 83.33)
@@ -0,0 +1,106 @@
+from contextlib import ExitStack
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from medtrackerapp.models import Medication
+from medtrackerapp.routers import PrimaryReplicaRouter, routing_scope
+
+# Routing decisions need no connection, so the router tests use a nominal alias.
+REPLICAS = {"ALIASES": ["replica"], "STICKY_SECONDS": 5, "COOKIE_NAME": "medtracker_primary"}
+
+# Aliases that mirror the primary's test database (see `medtracker.test_settings`),
+# so requests can be traced to the connection that served them. A mirror is
+# a separate connection: the middleware tests commit their data
+# (transactional test case) so it is visible, and unlocked, there.
+REPLICA_ALIASES = [
+    alias for alias, database in settings.DATABASES.items()
+    if database.get("TEST", {}).get("MIRROR") == DEFAULT_DB_ALIAS
+]
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def test_reads_use_primary_outside_a_scope(self):
+        self.assertEqual(Medication.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_reads_use_replica_until_a_write(self):
+        router = PrimaryReplicaRouter()
+        with routing_scope() as state:
+            self.assertEqual(Medication.objects.all().db, "replica")
+            self.assertEqual(router.db_for_write(Medication), DEFAULT_DB_ALIAS)
+            self.assertTrue(state.wrote)
+            self.assertEqual(Medication.objects.all().db, DEFAULT_DB_ALIAS)
+        self.assertEqual(Medication.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_scope_without_replica_reads(self):
+        with routing_scope(replica_reads=False):
+            self.assertEqual(Medication.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_no_replicas_configured(self):
+        with override_settings(DATABASE_REPLICAS={"ALIASES": []}), routing_scope():
+            self.assertEqual(Medication.objects.all().db, DEFAULT_DB_ALIAS)
+
+
+@skipUnless(REPLICA_ALIASES, "Needs a replica alias mirroring the test database (medtracker.test_settings).")
+@override_settings(DATABASE_REPLICAS={**REPLICAS, "ALIASES": REPLICA_ALIASES})
+class ReplicaRoutingMiddlewareTests(APITransactionTestCase):
+    databases = {DEFAULT_DB_ALIAS, *REPLICA_ALIASES}
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("medication-list")
+        self.med = Medication.objects.create(name="Primary", dosage_mg=100, prescribed_per_day=1)
+
+    def served_by(self, send):
+        """Send a request and return it with the set of aliases that ran queries for it."""
+        with ExitStack() as stack:
+            captured = {
+                alias: stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in self.databases
+            }
+            response = send()
+        return response, {alias for alias, queries in captured.items() if len(queries)}
+
+    def assertServedByReplica(self, aliases):
+        self.assertNotIn(DEFAULT_DB_ALIAS, aliases)
+        self.assertTrue(aliases & set(REPLICA_ALIASES))
+
+    def test_safe_requests_read_from_replica(self):
+        response, aliases = self.served_by(lambda: self.client.get(self.url))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["name"] for item in response.data], ["Primary"])
+        self.assertServedByReplica(aliases)
+
+    def test_writes_go_to_primary_and_pin_reads(self):
+        response, aliases = self.served_by(
+            lambda: self.client.post(self.url, {"name": "New", "dosage_mg": 5, "prescribed_per_day": 1}, format="json")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(aliases, {DEFAULT_DB_ALIAS})
+        self.assertEqual(response.cookies["medtracker_primary"]["max-age"], 5)
+        self.assertEqual(self.served_by(lambda: self.client.get(self.url))[1], {DEFAULT_DB_ALIAS})
+
+        self.client.cookies.pop("medtracker_primary")
+        cache.clear()
+        self.assertServedByReplica(self.served_by(lambda: self.client.get(self.url))[1])
+
+    def test_failed_write_does_not_pin(self):
+        response = self.client.post(self.url, {"name": ""}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn("medtracker_primary", response.cookies)
+
+    def test_without_replicas_everything_uses_primary(self):
+        with override_settings(DATABASE_REPLICAS={"ALIASES": []}):
+            response, aliases = self.served_by(lambda: self.client.get(self.url))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(aliases, {DEFAULT_DB_ALIAS})
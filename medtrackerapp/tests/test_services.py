@@ -1,10 +1,15 @@
 import unittest
 from unittest.mock import patch, Mock
-from medtrackerapp.models import DrugInfoService
+import requests
+from django.core.cache import caches
+from medtrackerapp.services import DrugInfoCache, DrugInfoService
 
 class TestDrugInfoService(unittest.TestCase):
 
-    @patch("medtrackerapp.services.requests.get")
+    def setUp(self):
+        DrugInfoService.reset_session()
+
+    @patch("medtrackerapp.services.requests.Session.get")
     def test_fetch_drug_info(self, mock_get):
         mock_get.return_value = Mock(status_code=200)
         mock_get.return_value.json.return_value = {
@@ -25,15 +30,88 @@ class TestDrugInfoService(unittest.TestCase):
         with self.assertRaises(ValueError):
             DrugInfoService.get_drug_info("")
 
-    @patch("medtrackerapp.services.requests.get")
+    @patch("medtrackerapp.services.requests.Session.get")
     def test_api_non_200(self, mock_get):
         mock_get.return_value = Mock(status_code=500)
         with self.assertRaises(ValueError):
             DrugInfoService.get_drug_info("Ibuprofen")
 
-    @patch("medtrackerapp.services.requests.get")
+    @patch("medtrackerapp.services.requests.Session.get")
     def test_no_results_found(self, mock_get):
         mock_get.return_value = Mock(status_code=200)
         mock_get.return_value.json.return_value = {"results": []}
         with self.assertRaises(ValueError):
-            DrugInfoService.get_drug_info("Ibuprofen")
\ No newline at end of file
+            DrugInfoService.get_drug_info("Ibuprofen")
+
+class TestDrugInfoCache(unittest.TestCase):
+
+    def setUp(self):
+        caches["default"].clear()
+        self.now = 1000.0
+        self.fetch = Mock(return_value={"name": "Ibuprofen"})
+        self.cache = DrugInfoCache(
+            fetch=self.fetch, maxsize=2, ttl=60, negative_ttl=10, stale_ttl=30,
+            background=lambda func: func(), clock=lambda: self.now,
+        )
+
+    def test_hit_after_miss(self):
+        self.assertEqual(self.cache.get("Ibuprofen"), {"name": "Ibuprofen"})
+        self.assertEqual(self.cache.get("  ibuprofen "), {"name": "Ibuprofen"})
+        self.fetch.assert_called_once_with("ibuprofen")
+        stats = self.cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_lru_eviction(self):
+        for name in ["a", "b", "c"]:
+            self.cache.get(name)
+        stats = self.cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["size"], 2)
+
+    def test_shared_tier_used_after_local_eviction(self):
+        self.cache.get("a")
+        self.cache.clear()
+        self.cache.get("a")
+        self.fetch.assert_called_once()
+        self.assertEqual(self.cache.stats()["shared_hits"], 1)
+
+    def test_negative_caching(self):
+        self.fetch.side_effect = ValueError("No results found for this medication.")
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.cache.get("Unknown")
+        self.fetch.assert_called_once()
+
+        self.now += 11
+        with self.assertRaises(ValueError):
+            self.cache.get("Unknown")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_network_errors_not_cached(self):
+        self.fetch.side_effect = requests.exceptions.ConnectionError("down")
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.RequestException):
+                self.cache.get("Ibuprofen")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_stale_while_revalidate(self):
+        self.cache.get("Ibuprofen")
+        self.fetch.return_value = {"name": "Ibuprofen v2"}
+        self.now += 70
+        scheduled = []
+        self.cache._background = scheduled.append
+
+        self.assertEqual(self.cache.get("Ibuprofen"), {"name": "Ibuprofen"})
+        self.assertEqual(self.cache.stats()["stale_hits"], 1)
+        self.assertEqual(len(scheduled), 1)
+
+        scheduled[0]()
+        self.assertEqual(self.cache.get("Ibuprofen"), {"name": "Ibuprofen v2"})
+
+    def test_expired_beyond_stale_window_fetches_synchronously(self):
+        self.cache.get("Ibuprofen")
+        self.now += 100
+        self.cache.get("Ibuprofen")
+        self.assertEqual(self.fetch.call_count, 2)
+        self.assertEqual(self.cache.stats()["misses"], 2)
@@ -0,0 +1,89 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from medtrackerapp.models import DoctorsNote, DoseLog, Medication
+from medtrackerapp.query_audit import QueryBudgetMixin
+from medtrackerapp.response_cache import MedicationResponseCache
+
+
+class SparseFieldsetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("medication-list")
+        self.meds = []
+        for i in range(4):
+            med = Medication.objects.create(name=f"Med {i}", dosage_mg=100 + i, prescribed_per_day=2)
+            for day in range(1, 6):
+                DoseLog.objects.create(medication=med, taken_at=f"2025-12-{day:02d}T08:00:00Z", was_taken=day % 2 == 1)
+            for n in range(3):
+                DoctorsNote.objects.create(medication=med, content=f"Note {n}")
+            self.meds.append(med)
+
+    def test_fields_limit_output_and_skip_adherence(self):
+        with self.assertQueryBudget(2):
+            response = self.client.get(self.url, {"fields": "id,name"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0], {"id": self.meds[0].id, "name": "Med 0"})
+        self.assertEqual(len(response.data), 4)
+
+    def test_fields_with_adherence_match_full_output(self):
+        full = self.client.get(self.url).data
+        sparse = self.client.get(self.url, {"fields": "name,adherence"}).data
+
+        self.assertEqual(sparse, [{"name": item["name"], "adherence": item["adherence"]} for item in full])
+
+    def test_detail_fields(self):
+        response = self.client.get(reverse("medication-detail", args=[self.meds[1].id]), {"fields": "dosage_mg"})
+
+        self.assertEqual(response.data, {"dosage_mg": 101})
+
+    def test_expand_embeds_bounded_recent_rows(self):
+        with override_settings(MEDICATION_EXPAND={"LOGS_LIMIT": 2, "NOTES_LIMIT": 1}):
+            response = self.client.get(self.url, {"expand": "logs,notes"})
+
+        first = response.data[0]
+        self.assertEqual(set(first), {"id", "name", "dosage_mg", "prescribed_per_day", "adherence", "logs", "notes"})
+        self.assertEqual([log["taken_at"] for log in first["logs"]], ["2025-12-05T08:00:00Z", "2025-12-04T08:00:00Z"])
+        self.assertEqual({log["medication"] for log in first["logs"]}, {self.meds[0].id})
+        self.assertEqual([note["content"] for note in first["notes"]], ["Note 2"])
+
+    def test_expand_query_count_is_constant(self):
+        self.client.get(self.url)  # warm the response cache
+        with self.assertQueryBudget(4):
+            response = self.client.get(self.url, {"expand": "logs,notes", "fields": "id"})
+        self.assertEqual(len(response.data), 4)
+
+        more = Medication.objects.create(name="Extra", dosage_mg=1, prescribed_per_day=1)
+        DoseLog.objects.create(medication=more, taken_at="2025-12-01T08:00:00Z")
+        self.client.get(self.url)
+        with self.assertQueryBudget(4):
+            response = self.client.get(self.url, {"expand": "logs,notes", "fields": "id"})
+        self.assertEqual(len(response.data), 5)
+
+    def test_expand_without_response_cache(self):
+        disabled = MedicationResponseCache(enabled=False)
+        with mock.patch("medtrackerapp.views.get_medication_response_cache", return_value=disabled):
+            response = self.client.get(self.url, {"expand": "notes", "fields": "name,adherence"})
+
+        self.assertEqual(set(response.data[0]), {"name", "adherence", "notes"})
+        self.assertEqual(len(response.data[0]["notes"]), 3)
+
+    def test_note_changes_refresh_expanded_etag(self):
+        first = self.client.get(self.url, {"expand": "notes"})
+        DoctorsNote.objects.create(medication=self.meds[0], content="New note")
+
+        second = self.client.get(self.url, {"expand": "notes"}, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data[0]["notes"][0]["content"], "New note")
+
+    def test_unknown_fields_and_expansions(self):
+        for params in [{"fields": "id,secret"}, {"expand": "everything"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.data)
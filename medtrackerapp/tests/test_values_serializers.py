@@ -0,0 +1,60 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from medtrackerapp.models import DoctorsNote, DoseLog, Medication
+from medtrackerapp.serializers import (
+    DoctorsNoteSerializer, DoctorsNoteValuesSerializer,
+    DoseLogSerializer, DoseLogValuesSerializer,
+    MedicationSerializer, MedicationValuesSerializer,
+)
+
+
+class ValuesSerializerOutputTests(TestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=1)
+        DoseLog.objects.create(medication=self.med, taken_at=datetime(2025, 12, 1, 8, 0, tzinfo=dt_timezone.utc))
+        DoseLog.objects.create(
+            medication=self.med, taken_at=datetime(2025, 12, 1, 20, 0, 0, 123456, tzinfo=dt_timezone.utc),
+            was_taken=False,
+        )
+        DoctorsNote.objects.create(medication=self.med, content="Take with food")
+
+    def assertSameJSON(self, model_serializer, values_serializer, queryset):
+        queryset = queryset.order_by("id")
+        expected = JSONRenderer().render(model_serializer(queryset, many=True).data)
+        actual = JSONRenderer().render(values_serializer(values_serializer.values(queryset)).data)
+        self.assertEqual(actual, expected)
+
+    def test_dose_log_output_is_byte_identical(self):
+        self.assertSameJSON(DoseLogSerializer, DoseLogValuesSerializer, DoseLog.objects.all())
+
+    def test_dose_log_output_matches_in_other_timezone(self):
+        with timezone.override("Europe/Berlin"):
+            self.assertSameJSON(DoseLogSerializer, DoseLogValuesSerializer, DoseLog.objects.all())
+
+    def test_doctors_note_output_is_byte_identical(self):
+        self.assertSameJSON(DoctorsNoteSerializer, DoctorsNoteValuesSerializer, DoctorsNote.objects.all())
+
+    def test_medication_output_is_byte_identical(self):
+        self.assertSameJSON(
+            MedicationSerializer, MedicationValuesSerializer, Medication.objects.with_adherence_counts()
+        )
+
+
+class ValuesListEndpointTests(APITestCase):
+    def test_logs_list_skips_model_serializer(self):
+        med = Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        log = DoseLog.objects.create(medication=med, taken_at="2025-12-01T08:00:00Z")
+
+        response = self.client.get(reverse("doselog-list"))
+
+        self.assertEqual(
+            response.data["results"],
+            [{"id": log.id, "medication": med.id, "taken_at": "2025-12-01T08:00:00Z", "was_taken": True}],
+        )
@@ -1,5 +1,7 @@
 from rest_framework.test import APITestCase
-from medtrackerapp.models import Medication, DoseLog
+from medtrackerapp.models import Medication, DoseLog, DoctorsNote
+from medtrackerapp.query_audit import QueryBudgetMixin
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 
@@ -120,7 +122,7 @@ class DoseLogViewTests(APITestCase):
         url = reverse("doselog-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
 # create
     def test_create_doselog_valid_data(self):
@@ -204,10 +206,168 @@ class DoseLogViewTests(APITestCase):
         url = reverse("doselog-filter-by-date")
         response = self.client.get(url + "?start=2025-12-01&end=2025-12-02")
         self.assertEqual(response.status_code, 200)
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertGreaterEqual(len(response.data["results"]), 1)
 
     def test_filter_by_date_missing_params(self):
         url = reverse("doselog-filter-by-date")
         response = self.client.get(url + "?start=&end=")
         self.assertEqual(response.status_code, 400)
         self.assertIn("error", response.data)
+
+    def test_filter_by_date_absent_or_impossible_params(self):
+        url = reverse("doselog-filter-by-date")
+        for query in ["", "?start=2025-12-01", "?end=2025-12-01", "?start=2025-02-30&end=2025-03-01"]:
+            response = self.client.get(url + query)
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn("error", response.data)
+
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.med = Medication.objects.create(name="Ibuprofen", dosage_mg=200, prescribed_per_day=3)
+        for day in range(1, 6):
+            DoseLog.objects.create(medication=self.med, taken_at=f"2025-12-0{day}T08:00:00Z")
+
+    def test_logs_paginated_newest_first(self):
+        response = self.client.get(reverse("doselog-list"), {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([log["taken_at"] for log in response.data["results"]],
+                         ["2025-12-05T08:00:00Z", "2025-12-04T08:00:00Z"])
+        self.assertIsNotNone(response.data["next"])
+
+    def test_cursor_stable_across_inserts(self):
+        first = self.client.get(reverse("doselog-list"), {"page_size": 2})
+        DoseLog.objects.create(medication=self.med, taken_at="2025-12-09T08:00:00Z")
+
+        second = self.client.get(first.data["next"])
+        self.assertEqual([log["taken_at"] for log in second.data["results"]],
+                         ["2025-12-03T08:00:00Z", "2025-12-02T08:00:00Z"])
+
+    def test_filter_by_date_paginated(self):
+        url = reverse("doselog-filter-by-date")
+        response = self.client.get(url, {"start": "2025-12-02", "end": "2025-12-04", "page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        rest = self.client.get(response.data["next"])
+        self.assertEqual([log["taken_at"] for log in rest.data["results"]], ["2025-12-02T08:00:00Z"])
+        self.assertIsNone(rest.data["next"])
+
+    def walk(self, url, params):
+        ids, response = [], self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(log["id"] for log in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_walks_every_log_with_tied_timestamps(self):
+        DoseLog.objects.all().delete()
+        for index in range(60):
+            DoseLog.objects.create(medication=self.med, taken_at=f"2025-12-{1 + index // 3:02d}T08:00:00Z")
+        expected = set(DoseLog.objects.values_list("id", flat=True))
+
+        for url, params in [
+            (reverse("doselog-list"), {"page_size": 7}),
+            (reverse("doselog-filter-by-date"), {"start": "2025-12-01", "end": "2025-12-31", "page_size": 7}),
+        ]:
+            ids = self.walk(url, params)
+            self.assertEqual(len(ids), 60, url)
+            self.assertEqual(set(ids), expected, url)
+
+    def test_medications_pagination_is_opt_in(self):
+        Medication.objects.create(name="Aspirin", dosage_mg=100, prescribed_per_day=2)
+        url = reverse("medication-list")
+
+        response = self.client.get(url)
+        self.assertIsInstance(response.data, list)
+
+        response = self.client.get(url, {"page_size": 1})
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["name"], "Ibuprofen")
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["results"][0]["name"], "Aspirin")
+
+
+class MedicationListQueryCountTests(APITestCase):
+    def _create_medications(self, count):
+        for i in range(count):
+            med = Medication.objects.create(name=f"Med {i}", dosage_mg=100, prescribed_per_day=2)
+            DoseLog.objects.create(medication=med, taken_at="2025-12-01T08:00:00Z", was_taken=True)
+            DoseLog.objects.create(medication=med, taken_at="2025-12-01T20:00:00Z", was_taken=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        url = reverse("medication-list")
+        # One query for the ETag version token, one for the list and one for
+        # the annotated re-fetch of medications missing from the response cache.
+        self._create_medications(1)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.data[0]["adherence"], 50.0)
+
+        self._create_medications(20)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 21)
+        self.assertTrue(all(item["adherence"] == 50.0 for item in response.data))
+
+        # Fully cached: no adherence query at all.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 21)
+
+
+# Maximum queries per request for each endpoint, independent of the
+# number of rows involved. Raise a budget only together with the change
+# that needs it; the N+1 check fails on any SELECT repeated per row.
+QUERY_BUDGETS = {
+    "medication-list": 3,
+    "medication-detail": 3,
+    "medication-list-sparse": 2,
+    "medication-list-expanded": 5,
+    "medication-expected-doses": 1,
+    "medication-adherence-analytics": 2,
+    "doselog-list": 2,
+    "doselog-filter-by-date": 3,
+    "doctors_notes-list": 1,
+    "doctors_notes-search": 2,
+}
+
+
+class EndpointQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(5):
+            med = Medication.objects.create(name=f"Med {i}", dosage_mg=100, prescribed_per_day=2)
+            for hour in (8, 14, 20):
+                DoseLog.objects.create(medication=med, taken_at=f"2025-12-01T{hour:02d}:00:00Z", was_taken=hour != 14)
+            DoctorsNote.objects.create(medication=med, content="Take with food")
+        self.med = med
+
+    def assertWithinBudget(self, name, url, params=None):
+        with self.assertQueryBudget(QUERY_BUDGETS[name]):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_medication_endpoints(self):
+        self.assertWithinBudget("medication-list", reverse("medication-list"))
+        self.assertWithinBudget("medication-detail", reverse("medication-detail", args=[self.med.id]))
+        self.assertWithinBudget("medication-list-sparse", reverse("medication-list"), {"fields": "id,name"})
+        self.assertWithinBudget("medication-list-expanded", reverse("medication-list"), {"expand": "logs,notes"})
+        self.assertWithinBudget(
+            "medication-expected-doses", reverse("medication-expected-doses", args=[self.med.id]), {"days": 7}
+        )
+        self.assertWithinBudget(
+            "medication-adherence-analytics", reverse("medication-adherence-analytics"),
+            {"start": "2025-12-01", "end": "2025-12-07"},
+        )
+
+    def test_dose_log_and_note_endpoints(self):
+        self.assertWithinBudget("doselog-list", reverse("doselog-list"))
+        self.assertWithinBudget(
+            "doselog-filter-by-date", reverse("doselog-filter-by-date"), {"start": "2025-12-01", "end": "2025-12-01"}
+        )
+        self.assertWithinBudget("doctors_notes-list", reverse("doctors_notes-list"))
+        self.assertWithinBudget("doctors_notes-search", reverse("doctors_notes-search"), {"q": "food"})
@@ -1,6 +1,7 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import MedicationViewSet, DoseLogViewSet, DoctorsNoteViewSet
+from .views import MedicationViewSet, DoseLogViewSet, DoctorsNoteViewSet, medication_info_async, metrics
 
 router = DefaultRouter()
 router.register("medications", MedicationViewSet, basename="medication")
@@ -10,5 +11,9 @@ router.register("doctors_notes", DoctorsNoteViewSet, basename="doctors_notes")
 
 
 urlpatterns = [
+    path("metrics/", metrics, name="metrics"),
     path("", include(router.urls)),
 ]
+
+if getattr(settings, "DRUG_INFO_ASYNC_VIEW", False):
+    urlpatterns.insert(0, path("medications/<int:pk>/info/", medication_info_async, name="medication-info-async"))
@@ -1,9 +1,55 @@
+from asgiref.sync import sync_to_async
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.utils.dateparse import parse_date
-from .models import Medication, DoseLog, DoctorsNote
-from .serializers import MedicationSerializer, DoseLogSerializer, DoctorsNoteSerializer
+from .models import Medication, DoseLog, DoseLogArchive, DoctorsNote, BulkIngestKey, DrugInfoEnrichment, day_range
+from .archive import CombinedDoseLogs
+from .analytics import WINDOWS, adherence_series, serialize_adherence_series
+from .conditional import conditional_response
+from .enrichment import enqueue, enrichment_settings, is_stale
+from .exports import export_queryset, iter_export
+from .fieldsets import EXPANSIONS, expand_medications, parse_list_param
+from .ingest import insert_dose_logs, validate_dose_log_rows
+from .instrumentation import metrics_registry
+from .pagination import DoseLogCursorPagination, OptInCursorPagination, SearchPagination
+from .parsers import FastJSONParser, NDJSONParser
+from .renderers import CSVRenderer, NDJSONRenderer
+from .response_cache import get_medication_response_cache
+from .search import search_notes
+from .services import get_drug_info_cache
+from .serializers import (
+    MedicationSerializer, DoseLogSerializer, DoctorsNoteSerializer,
+    MedicationValuesSerializer, DoseLogValuesSerializer, DoctorsNoteValuesSerializer,
+    DoctorsNoteSearchValuesSerializer,
+)
+
+
+class ValuesListMixin:
+    """
+    Serve list reads through a `ValuesSerializer`.
+
+    Rows are fetched with `.values()` and rendered without model
+    instances or per-row DRF field objects; writes and detail reads
+    keep using `serializer_class`.
+    """
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        return self.values_response(self.filter_queryset(self.get_queryset()))
+
+    def values_response(self, queryset):
+        """Paginate (if configured) and render `queryset` as `.values()` rows."""
+        rows = self.values_serializer_class.values(queryset)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer_class(page).data)
+        return Response(self.values_serializer_class(rows).data)
 
 
 class MedicationViewSet(viewsets.ModelViewSet):
@@ -21,17 +67,157 @@ class MedicationViewSet(viewsets.ModelViewSet):
         - PUT/PATCH /medications/{id}/ — update a medication
         - DELETE /medications/{id}/ — delete a medication
         - GET /medications/{id}/info/ — fetch external drug info from OpenFDA
+        - GET /medications/info/?ids=1,2,3 — fetch external drug info for many medications
+        - GET /medications/adherence/?start=&end= — adherence time series for a cohort
+
+    Listing is unpaginated unless the client passes `cursor` or
+    `page_size`, in which case keyset pagination ordered by id is used.
+
+    List and detail responses carry `ETag` / `Last-Modified` validators
+    derived from `Medication.version`; matching conditional requests get
+    304 Not Modified without running serializers or adherence queries.
+
+    Rendered medications are also cached server-side per medication
+    (see `MedicationResponseCache`), so only changed medications are
+    re-serialized and have their adherence recomputed.
+
+    List and detail reads accept `?fields=id,name,...` to return only
+    those fields (leaving out `adherence` skips its query entirely) and
+    `?expand=logs,notes` to embed each medication's most recent dose
+    logs and doctor's notes, fetched with one bounded prefetch query
+    per expansion.
     """
     queryset = Medication.objects.all()
     serializer_class = MedicationSerializer
+    pagination_class = OptInCursorPagination
+
+    def get_queryset(self):
+        """
+        Add the adherence annotation only to reads that render it.
+
+        Other actions (writes, `info`, `expected-doses`) never pay for
+        the aggregate join. Reads served by the response cache skip it
+        too, and sparse reads that leave out `adherence` also load only
+        the requested columns.
+        """
+        if self.action in ("list", "retrieve"):
+            fields = getattr(self, "sparse_fields", None)
+            if fields is not None and "adherence" not in fields:
+                return Medication.objects.only(*fields)
+            if not get_medication_response_cache().enabled:
+                return Medication.objects.with_adherence_counts()
+        return super().get_queryset()
+
+    def parse_sparse_options(self, request):
+        """
+        Read `?fields=` and `?expand=` into `sparse_fields` / `expand`.
+
+        Returns:
+            Response | None: A 400 response if either parameter names
+                an unknown field or expansion, otherwise None.
+        """
+        try:
+            self.sparse_fields = parse_list_param(
+                request.query_params.get("fields"), MedicationSerializer.Meta.fields, "fields"
+            )
+            self.expand = parse_list_param(request.query_params.get("expand"), list(EXPANSIONS), "expansions") or []
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return None
+
+    def list(self, request, *args, **kwargs):
+        """List medications, honouring If-None-Match / If-Modified-Since."""
+        error = self.parse_sparse_options(request)
+        if error is not None:
+            return error
+
+        def render():
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            data = self.represent(page if page is not None else queryset)
+            return self.get_paginated_response(data) if page is not None else Response(data)
+
+        version, updated_at = Medication.objects.version_token()
+        return conditional_response(request, version, updated_at, render)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a medication, honouring If-None-Match / If-Modified-Since."""
+        error = self.parse_sparse_options(request)
+        if error is not None:
+            return error
+        try:
+            state = Medication.objects.filter(pk=kwargs.get("pk")).values_list("version", "updated_at").first()
+        except (ValueError, TypeError):
+            state = None
+        version, updated_at = (f"{kwargs.get('pk')}-{state[0]}-{state[1].timestamp()}", state[1]) if state else (None, None)
+        return conditional_response(
+            request, version, updated_at, lambda: Response(self.represent([self.get_object()])[0])
+        )
+
+    def represent(self, medications):
+        """
+        Serialize medications, reusing cached representations where possible.
+
+        Medications missing from the response cache are re-fetched with
+        their adherence counts in one `.values()` query, rendered by
+        `MedicationValuesSerializer` and stored. The `sparse_fields` and
+        `expand` options parsed from the request are then applied; a
+        sparse read without `adherence` never touches the cache or the
+        adherence counts.
+
+        Args:
+            medications (Iterable[Medication]): Plain or annotated instances.
+
+        Returns:
+            list[dict]: Representations in the same order.
+        """
+        medications = list(medications)
+        fields = getattr(self, "sparse_fields", None)
+        expand = getattr(self, "expand", [])
+        if fields is not None and "adherence" not in fields:
+            data = [{name: getattr(med, name) for name in fields} for med in medications]
+        else:
+            data = self.represent_full(medications)
+            if len(data) != len(medications):
+                # Deleted since the page was read.
+                present = {item["id"] for item in data}
+                medications = [med for med in medications if med.pk in present]
+            if fields is not None:
+                data = [{name: item[name] for name in fields} for item in data]
+            elif expand:
+                data = [dict(item) for item in data]
+        if expand:
+            expand_medications(medications, data, expand)
+        return data
+
+    def represent_full(self, medications):
+        """Return full representations of `medications` via the response cache."""
+        cache = get_medication_response_cache()
+        if not cache.enabled:
+            return self.get_serializer(medications, many=True).data
+
+        found = cache.get_many(medications)
+        missing = [med.pk for med in medications if med.pk not in found]
+        if missing:
+            rows = list(MedicationValuesSerializer.values(
+                Medication.objects.with_adherence_counts().filter(pk__in=missing), "version"
+            ))
+            versions = [row["version"] for row in rows]
+            data = MedicationValuesSerializer(rows).data
+            cache.set_many((item["id"], version, item) for item, version in zip(data, versions))
+            found.update((item["id"], item) for item in data)
+        return [found[med.pk] for med in medications if med.pk in found]
 
     @action(detail=True, methods=["get"], url_path="info")
     def get_external_info(self, request, pk=None):
         """
-        Retrieve external drug information from the OpenFDA API.
+        Retrieve external drug information for a medication.
 
-        Calls the `Medication.fetch_external_info()` method, which
-        delegates to the `DrugInfoService` for API access.
+        Served from the stored `DrugInfoEnrichment` that the background
+        worker keeps up to date, so OpenFDA is not called on the request
+        path. A stale entry is still returned, and a refresh is queued.
+        With enrichment disabled, OpenFDA is queried through
+        `Medication.fetch_external_info()` instead.
 
         Args:
             request (Request): The current HTTP request.
@@ -39,18 +225,121 @@ class MedicationViewSet(viewsets.ModelViewSet):
 
         Returns:
             Response:
-                - 200 OK: External API data returned successfully.
-                - 502 BAD GATEWAY: If the external API request failed.
+                - 200 OK: {"data": {...}, "fetched_at": ..., "stale": bool}
+                  (or the raw data when enrichment is disabled).
+                - 202 ACCEPTED: No data stored yet; a fetch is queued (after
+                  `REFRESH_AFTER` if the last one failed).
+                - 502 BAD GATEWAY: If the stored fetch (or the live
+                  request) failed.
 
         Example:
             GET /medications/1/info/
         """
         medication = self.get_object()
-        data = medication.fetch_external_info()
+        if not enrichment_settings()["ENABLED"]:
+            data = medication.fetch_external_info()
+            if isinstance(data, dict) and data.get("error"):
+                return Response(data, status=status.HTTP_502_BAD_GATEWAY)
+            return Response(data)
 
-        if isinstance(data, dict) and data.get("error"):
-            return Response(data, status=status.HTTP_502_BAD_GATEWAY)
-        return Response(data)
+        stored = DrugInfoEnrichment.objects.filter(medication=medication).first()
+        body, code, refresh = stored_info_result(stored, medication)
+        if refresh:
+            enqueue([medication.id])
+        return Response(body, status=code)
+
+    @action(detail=False, methods=["get"], url_path="info")
+    def get_external_info_batch(self, request):
+        """
+        Retrieve external drug information for several medications at once.
+
+        Medications are de-duplicated by normalized name and the
+        OpenFDA lookups run concurrently over a bounded thread pool.
+        A failed lookup is reported per id instead of failing the
+        whole batch.
+
+        Query Parameters:
+            - ids (str): Comma-separated medication ids (may be repeated).
+
+        Returns:
+            Response:
+                - 200 OK: {"results": {id: drug info or {"error": message}}}.
+                - 400 BAD REQUEST: If 'ids' is missing, invalid or too long.
+
+        Example:
+            GET /medications/info/?ids=1,2,3
+        """
+        config = getattr(settings, "DRUG_INFO_BATCH", {})
+        max_ids = config.get("MAX_IDS", 100)
+        raw_ids = [part for value in request.query_params.getlist("ids") for part in value.split(",")]
+        try:
+            ids = list(dict.fromkeys(int(part) for part in raw_ids if part.strip()))
+        except ValueError:
+            ids = []
+        if not ids or len(ids) > max_ids:
+            return Response(
+                {"error": f"'ids' must be a comma-separated list of 1 to {max_ids} integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        names = dict(Medication.objects.filter(id__in=ids).values_list("id", "name"))
+        cache = get_drug_info_cache()
+        info = cache.get_many(names.values(), max_workers=config.get("MAX_WORKERS", 8))
+
+        results = {}
+        for med_id in ids:
+            if med_id in names:
+                results[str(med_id)] = info[cache.normalize(names[med_id])]
+            else:
+                results[str(med_id)] = {"error": "Medication not found."}
+        return Response({"results": results})
+
+    @action(detail=False, methods=["get"], url_path="adherence")
+    def adherence_analytics(self, request):
+        """
+        Return daily, weekly and rolling adherence series for many medications.
+
+        All series are computed from one rollup query with vectorized
+        NumPy operations; see `analytics.adherence_series`.
+
+        Query Parameters:
+            - start (YYYY-MM-DD): First day of the series.
+            - end (YYYY-MM-DD): Last day of the series (at most
+              ANALYTICS_MAX_DAYS days after start).
+            - ids (str): Optional comma-separated medication ids
+              (default: every medication).
+            - windows (str): Optional comma-separated subset of
+              daily, weekly, rolling_7, rolling_30.
+
+        Returns:
+            Response:
+                - 200 OK: {"days": [...], "weeks": [...], "medications": {id: {window: [...]}}}.
+                - 400 BAD REQUEST: If a parameter is missing or invalid.
+
+        Example:
+            GET /medications/adherence/?start=2025-11-01&end=2025-11-30&windows=daily,rolling_7
+        """
+        try:
+            start = parse_date(request.query_params.get("start") or "")
+            end = parse_date(request.query_params.get("end") or "")
+        except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+            start = end = None
+        max_days = getattr(settings, "ANALYTICS_MAX_DAYS", 366)
+        if not start or not end or start > end or (end - start).days >= max_days:
+            return Response(
+                {"error": f"'start' and 'end' must be valid dates at most {max_days} days apart."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        windows = request.query_params.get("windows")
+        windows = [w for w in windows.split(",") if w] if windows else list(WINDOWS)
+        ids = request.query_params.get("ids")
+        try:
+            ids = [int(part) for part in ids.split(",") if part.strip()] if ids else None
+            result = adherence_series(start, end, medication_ids=ids, windows=windows)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serialize_adherence_series(result))
 
     @action(detail=True, methods=["get"], url_path="expected-doses")
     def expected_doses(self, request, pk=None):
@@ -81,7 +370,84 @@ class MedicationViewSet(viewsets.ModelViewSet):
             return Response({'error': "days must be a positive integer"}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class DoseLogViewSet(viewsets.ModelViewSet):
+def stored_info_result(stored, medication):
+    """
+    Build the `info` response for a medication from its stored enrichment.
+
+    Shared by the DRF action and the async view so both answer alike.
+
+    Args:
+        stored (DrugInfoEnrichment | None): The stored entry, if any.
+        medication (Medication): The medication being looked up.
+
+    Returns:
+        tuple: (body, HTTP status, whether a refresh should be queued).
+    """
+    if stored is None or stored.name != medication.name:
+        return {"status": "pending"}, status.HTTP_202_ACCEPTED, True
+    stale = is_stale(stored)
+    if stored.error:
+        body = {"error": stored.error, "fetched_at": stored.fetched_at, "stale": stale}
+        return body, status.HTTP_502_BAD_GATEWAY, stale
+    return {"data": stored.data, "fetched_at": stored.fetched_at, "stale": stale}, status.HTTP_200_OK, stale
+
+
+async def medication_info_async(request, pk):
+    """
+    Async counterpart of `MedicationViewSet.get_external_info`.
+
+    Served in place of the DRF action when `settings.DRUG_INFO_ASYNC_VIEW`
+    is enabled, with the same responses. The stored enrichment is read
+    without blocking a worker; with enrichment disabled the OpenFDA
+    lookup is awaited instead, so under ASGI one process can serve many
+    slow lookups at once.
+
+    Returns:
+        JsonResponse:
+            - 200 OK: {"data": {...}, "fetched_at": ..., "stale": bool}
+              (or the raw data when enrichment is disabled).
+            - 202 ACCEPTED: No data stored yet; a fetch is queued (after
+              `REFRESH_AFTER` if the last one failed).
+            - 404 NOT FOUND: If the medication does not exist.
+            - 405 METHOD NOT ALLOWED: For non-GET requests.
+            - 502 BAD GATEWAY: If the stored fetch (or the live
+              request) failed.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+    try:
+        medication = await Medication.objects.aget(pk=pk)
+    except Medication.DoesNotExist:
+        return JsonResponse({"detail": "No Medication matches the given query."}, status=status.HTTP_404_NOT_FOUND)
+
+    if not enrichment_settings()["ENABLED"]:
+        data = await medication.afetch_external_info()
+        if isinstance(data, dict) and data.get("error"):
+            return JsonResponse(data, status=status.HTTP_502_BAD_GATEWAY)
+        return JsonResponse(data)
+
+    stored = await DrugInfoEnrichment.objects.filter(medication=medication).afirst()
+    body, code, refresh = stored_info_result(stored, medication)
+    if refresh:
+        await sync_to_async(enqueue)([medication.id])
+    # DRF's encoder, so timestamps are formatted as in the DRF action.
+    return JsonResponse(body, status=code, encoder=JSONEncoder)
+
+
+def metrics(request):
+    """
+    Expose aggregated request metrics in Prometheus text format.
+
+    Histograms of wall, database, serialization and OpenFDA time (and
+    query counts) per view, as recorded by `PerformanceMiddleware`.
+
+    Example:
+        GET /metrics/
+    """
+    return HttpResponse(metrics_registry.expose(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class DoseLogViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """
     API endpoint for viewing and managing dose logs.
 
@@ -97,9 +463,33 @@ class DoseLogViewSet(viewsets.ModelViewSet):
         - DELETE /logs/{id}/ — delete a dose log
         - GET /logs/filter/?start=YYYY-MM-DD&end=YYYY-MM-DD —
           filter logs within a date range
+        - GET /logs/export/?format=csv|ndjson — stream every matching log
+        - POST /logs/bulk/ — create many logs from a JSON array or NDJSON body
+
+    List responses are cursor-paginated, newest first; follow the
+    `next` / `previous` links to move between pages.
+
+    Reads (list, filter, export, retrieve) include logs moved to the
+    archive by `archive_dose_logs`; archived logs cannot be modified.
     """
     queryset = DoseLog.objects.all()
     serializer_class = DoseLogSerializer
+    values_serializer_class = DoseLogValuesSerializer
+    pagination_class = DoseLogCursorPagination
+
+    def get_queryset(self):
+        """Read live and archived logs for list reads; writes only touch the live table."""
+        if self.action in ("list", "filter_by_date"):
+            return CombinedDoseLogs()
+        return super().get_queryset()
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a dose log, falling back to the archive for old entries."""
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archived = get_object_or_404(DoseLogArchive, pk=kwargs.get("pk"))
+            return Response(self.get_serializer(archived).data)
 
     @action(detail=False, methods=["get"], url_path="filter")
     def filter_by_date(self, request):
@@ -110,16 +500,23 @@ class DoseLogViewSet(viewsets.ModelViewSet):
             - start (YYYY-MM-DD): Start date of the range (inclusive).
             - end (YYYY-MM-DD): End date of the range (inclusive).
 
+        Responses carry `ETag` / `Last-Modified` validators; a matching
+        conditional request gets 304 Not Modified without querying logs.
+
         Returns:
             Response:
-                - 200 OK: A list of dose logs between the two dates.
+                - 200 OK: A cursor-paginated page of dose logs between the two dates.
+                - 304 NOT MODIFIED: If the client's cached page is still current.
                 - 400 BAD REQUEST: If start or end parameters are missing or invalid.
 
         Example:
             GET /logs/filter/?start=2025-11-01&end=2025-11-07
         """
-        start = parse_date(request.query_params.get("start"))
-        end = parse_date(request.query_params.get("end"))
+        try:
+            start = parse_date(request.query_params.get("start") or "")
+            end = parse_date(request.query_params.get("end") or "")
+        except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+            start = end = None
 
         if not start or not end:
             return Response(
@@ -127,20 +524,200 @@ class DoseLogViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        logs = self.get_queryset().filter(
-            taken_at__date__gte=start,
-            taken_at__date__lte=end
-        ).order_by("taken_at")
+        def render():
+            range_start, range_end = day_range(start, end)
+            logs = self.get_queryset().filter(
+                taken_at__gte=range_start,
+                taken_at__lt=range_end
+            )
+            return self.values_response(logs)
+
+        # Every dose-log write bumps its medication's version.
+        version, updated_at = Medication.objects.version_token()
+        return conditional_response(request, version, updated_at, render)
+
+    @action(detail=False, methods=["get"], url_path="export", renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """
+        Stream dose logs as CSV or NDJSON.
+
+        Rows are read with a server-side cursor and written to a
+        `StreamingHttpResponse` chunk by chunk, so memory stays flat
+        regardless of the number of rows.
+
+        Query Parameters:
+            - format (csv|ndjson): Output format (default: csv).
+            - start (YYYY-MM-DD): Optional first day to include.
+            - end (YYYY-MM-DD): Optional last day to include.
+            - medication (int): Optional medication id.
+
+        Returns:
+            StreamingHttpResponse:
+                - 200 OK: The exported rows.
+                - 400 BAD REQUEST: If a filter parameter is invalid.
+
+        Example:
+            GET /logs/export/?format=ndjson&start=2025-11-01&end=2025-11-07
+        """
+        filters = {}
+        for param in ["start", "end"]:
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    filters[param] = parse_date(value)
+                except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+                    filters[param] = None
+                if not filters[param]:
+                    return JsonResponse(
+                        {"error": f"'{param}' must be a valid date (YYYY-MM-DD)."},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+        medication = request.query_params.get("medication")
+        if medication:
+            try:
+                filters["medication"] = int(medication)
+            except ValueError:
+                return JsonResponse(
+                    {"error": "'medication' must be an integer."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            iter_export(export_queryset(**filters), renderer.format),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = f'attachment; filename="dose_logs.{renderer.format}"'
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk", parser_classes=[FastJSONParser, NDJSONParser])
+    def bulk_create(self, request):
+        """
+        Create many dose logs in one request.
+
+        Accepts a JSON array (`application/json`) or one object per
+        line (`application/x-ndjson`). All rows are validated first,
+        with medication ids checked in a single query; if any row is
+        invalid nothing is inserted. Valid uploads are inserted with
+        `bulk_create` in chunks inside one transaction.
+
+        Headers:
+            - Idempotency-Key (optional): Replays the stored response
+              instead of inserting again when an upload is retried.
+
+        Returns:
+            Response:
+                - 201 CREATED: {"created": n, "ids": [...]}.
+                - 400 BAD REQUEST: If the body is not a non-empty list
+                  within the size limit, or {"errors": [...]} with one
+                  entry per invalid row.
+
+        Example:
+            POST /logs/bulk/
+            [{"medication": 1, "taken_at": "2025-12-01T08:00:00Z", "was_taken": true}]
+        """
+        key = request.headers.get("Idempotency-Key")
+        if key:
+            stored = BulkIngestKey.objects.filter(key=key).first()
+            if stored:
+                return Response(stored.response, status=stored.status_code)
+
+        config = getattr(settings, "DOSE_LOG_BULK", {})
+        max_rows = config.get("MAX_ROWS", 10000)
+        rows = request.data
+        if not isinstance(rows, list) or not rows or len(rows) > max_rows:
+            return Response(
+                {"error": f"Expected a list of 1 to {max_rows} dose logs."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        logs, errors = validate_dose_log_rows(rows)
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                created = insert_dose_logs(logs, config.get("CHUNK_SIZE", 500))
+                body = {"created": len(created), "ids": [log.pk for log in created]}
+                if key:
+                    BulkIngestKey.objects.create(key=key, status_code=status.HTTP_201_CREATED, response=body)
+        except IntegrityError:
+            # A concurrent retry with the same key committed first; any other
+            # integrity error (e.g. from a log row) is re-raised.
+            stored = BulkIngestKey.objects.filter(key=key).first() if key else None
+            if stored is None:
+                raise
+            return Response(stored.response, status=stored.status_code)
+        return Response(body, status=status.HTTP_201_CREATED)
 
-        serializer = self.get_serializer(logs, many=True)
-        return Response(serializer.data)
 
-class DoctorsNoteViewSet(viewsets.ModelViewSet):
+class DoctorsNoteViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """
     API endpoint for viewing and managing doctor's notes.
+
+    Endpoints:
+        - GET /doctors_notes/search/?q=... — ranked full-text search
     """
     queryset = DoctorsNote.objects.all()
     serializer_class = DoctorsNoteSerializer
+    values_serializer_class = DoctorsNoteValuesSerializer
+
+    @action(
+        detail=False, methods=["get"], url_path="search",
+        pagination_class=SearchPagination, values_serializer_class=DoctorsNoteSearchValuesSerializer,
+    )
+    def search(self, request):
+        """
+        Search note content through the database text index.
+
+        Every word of `q` must match (stemmed, case-insensitive);
+        punctuation and search operators are ignored. Results are
+        ranked by relevance, newest first on ties.
+
+        Query Parameters:
+            - q (str): Search text (required).
+            - medication (int): Optional medication id.
+            - start (YYYY-MM-DD): Optional first `created_at` day.
+            - end (YYYY-MM-DD): Optional last `created_at` day.
+            - page, page_size: Page number and size (default 20, max 100).
+
+        Returns:
+            Response:
+                - 200 OK: {"count", "next", "previous", "results": [{..., "rank"}]}.
+                - 400 BAD REQUEST: If `q` is missing or a filter is invalid.
+
+        Example:
+            GET /doctors_notes/search/?q=grapefruit+interaction&medication=3
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"error": "The 'q' query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        filters = {}
+        for param in ["start", "end"]:
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    filters[param] = parse_date(value)
+                except ValueError:  # well-formed but impossible, e.g. 2025-02-30
+                    filters[param] = None
+                if not filters[param]:
+                    return Response(
+                        {"error": f"'{param}' must be a valid date (YYYY-MM-DD)."},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+        medication = request.query_params.get("medication")
+        if medication:
+            try:
+                filters["medication"] = int(medication)
+            except ValueError:
+                return Response(
+                    {"error": "'medication' must be an integer."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        return self.values_response(search_notes(query, **filters))
 
     def update(self, request, *args, **kwargs):
         """